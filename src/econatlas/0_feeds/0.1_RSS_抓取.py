@@ -4,11 +4,14 @@ RSS/JSON 抓取与标准化：处理受保护站点时可调用浏览器抓取
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import json
 import os
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 from datetime import datetime
 from typing import Any, Iterable, Sequence, Protocol
@@ -18,9 +21,16 @@ import feedparser
 import httpx
 from dateutil import parser as date_parser
 
+from econatlas._loader import load_local_module
 from econatlas.models import NormalizedFeedEntry
 from econatlas.samples import BrowserCredentials, PlaywrightFetcher
 
+_cache_mod = load_local_module(__file__, "0.2_Feed缓存.py", "econatlas._feeds_cache")
+FeedCache = _cache_mod.FeedCache  # type: ignore[attr-defined]
+FeedNotModified = _cache_mod.FeedNotModified  # type: ignore[attr-defined]
+FeedValidators = _cache_mod.FeedValidators  # type: ignore[attr-defined]
+body_hash = _cache_mod.body_hash  # type: ignore[attr-defined]
+
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) "
@@ -80,7 +90,8 @@ class _ThreadedBrowserFetcher(BrowserFetcher):
     """将同步 PlaywrightFetcher 放入线程，避免阻塞/事件循环冲突。"""
 
     def __init__(self, delegate: BrowserFetcher | None = None) -> None:
-        self._delegate = delegate or PlaywrightFetcher()
+        # 复用浏览器：首页预热与 feed 抓取共用同一个 Chromium，省去每次 1–3 秒的启动。
+        self._delegate = delegate or PlaywrightFetcher(reuse_browser=True)
         self._executor = ThreadPoolExecutor(max_workers=1)
 
     def fetch(
@@ -102,6 +113,12 @@ class _ThreadedBrowserFetcher(BrowserFetcher):
         ).result()
 
     def close(self) -> None:
+        close = getattr(self._delegate, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                LOGGER.debug("关闭浏览器抓取器失败", exc_info=True)
         self._executor.shutdown(wait=True, cancel_futures=True)
 
 
@@ -114,18 +131,42 @@ class FeedClient:
         timeout: float = 30.0,
         browser_fetcher: BrowserFetcher | None = None,
         protected_hosts: Iterable[str] | None = None,
+        feed_cache: FeedCache | None = None,
+        refresh: bool = False,
+        http_client: httpx.Client | None = None,
+        async_client_factory: Callable[[], httpx.AsyncClient] | None = None,
     ):
         self._timeout = timeout
+        # 长连接池：同一主机（如 rss.cnki.net）的多个 feed 复用 TCP/TLS 连接。
+        self._http = http_client or _build_http_client(timeout)
+        self._async_client_factory = async_client_factory or (lambda: _build_async_http_client(timeout))
         self._browser_fetcher: BrowserFetcher | None = browser_fetcher
         self._protected_hosts = set(protected_hosts) if protected_hosts else set(PROTECTED_FEED_HOSTS)
+        # 多条抓取通道共享同一 FeedClient，浏览器抓取器只应创建一次。
+        self._browser_lock = threading.Lock()
+        # 配置缓存后：发送条件请求，304 或内容哈希不变时抛出 FeedNotModified。
+        # refresh=True 时忽略已有缓存强制拉取，但仍记录新的校验信息。
+        self._feed_cache = feed_cache
+        self._refresh = refresh
+        self._prefetched: dict[str, list[NormalizedFeedEntry]] = {}
+        self._not_modified: dict[str, str] = {}
+        self._prefetched_lock = threading.Lock()
 
     def fetch(self, rss_url: str) -> list[NormalizedFeedEntry]:
+        with self._prefetched_lock:
+            prefetched = self._prefetched.pop(rss_url, None)
+            not_modified = self._not_modified.pop(rss_url, None)
+        if prefetched is not None:
+            return prefetched
+        if not_modified is not None:
+            raise FeedNotModified(rss_url, not_modified)
         LOGGER.info("抓取 feed %s", rss_url)
-        headers = _headers_for_feed(rss_url)
-        cookies = _cookies_for_feed(rss_url)
+        request_headers, cookies, cached = self._prepare_request(rss_url)
         host = urlparse(rss_url).hostname or ""
         if host in self._protected_hosts:
+            headers = _headers_for_feed(rss_url)
             text = self._fetch_feed_via_browser(rss_url, headers=headers, cookies=cookies)
+            self._remember(rss_url, text.encode("utf-8"), etag=None, last_modified=None, cached=cached)
             if _looks_like_json_text(text):
                 return self._parse_json_payload(rss_url, text)
             return self._parse_rss_feed(rss_url, text)
@@ -133,12 +174,14 @@ class FeedClient:
         response: httpx.Response | None = None
         for attempt in range(1, 6):
             try:
-                response = httpx.get(
+                response = self._http.get(
                     rss_url,
                     timeout=self._timeout,
-                    headers=headers,
+                    headers=request_headers,
                     cookies=cookies or None,
                 )
+                if response.status_code == 304 and cached is not None:
+                    raise FeedNotModified(rss_url, "304")
                 response.raise_for_status()
                 break
             except httpx.HTTPError as exc:
@@ -148,10 +191,167 @@ class FeedClient:
                 LOGGER.warning("Feed 请求失败 %s (attempt %s/5); %.1fs 后重试", exc, attempt, delay)
                 time.sleep(delay)
         assert response is not None
+        return self._parse_response(rss_url, response, cached)
+
+    def fetch_many(
+        self,
+        rss_urls: Iterable[str],
+        *,
+        concurrency: int = 8,
+        per_host: int = 2,
+    ) -> dict[str, int | BaseException]:
+        """
+        用 asyncio 并发预取多个 feed（受保护站点除外，仍走浏览器），解析结果留给后续 fetch 直接使用。
+        concurrency 为全局并发上限，per_host 为单主机并发上限。
+        返回 url -> 条目数，或该 feed 的异常（FeedNotModified 也会在后续 fetch 时再次抛出）；
+        失败的 feed 不缓存，后续 fetch 会按原逻辑重试。
+        """
+        urls = [
+            url
+            for url in dict.fromkeys(rss_urls)
+            if (urlparse(url).hostname or "") not in self._protected_hosts
+        ]
+        if not urls:
+            return {}
+        return asyncio.run(self._fetch_many_async(urls, concurrency=max(1, concurrency), per_host=max(1, per_host)))
+
+    async def _fetch_many_async(
+        self,
+        urls: list[str],
+        *,
+        concurrency: int,
+        per_host: int,
+    ) -> dict[str, int | BaseException]:
+        global_limit = asyncio.Semaphore(concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        outcomes: dict[str, int | BaseException] = {}
+
+        async def _one(client: httpx.AsyncClient, rss_url: str) -> None:
+            host = urlparse(rss_url).hostname or ""
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+            async with global_limit, host_limit:
+                try:
+                    entries = await self._fetch_async(client, rss_url)
+                except FeedNotModified as exc:
+                    with self._prefetched_lock:
+                        self._not_modified[rss_url] = exc.reason
+                    outcomes[rss_url] = exc
+                    return
+                except Exception as exc:  # noqa: BLE001
+                    LOGGER.warning("预取 feed 失败 %s: %s", rss_url, exc)
+                    outcomes[rss_url] = exc
+                    return
+            with self._prefetched_lock:
+                self._prefetched[rss_url] = entries
+            outcomes[rss_url] = len(entries)
+
+        async with self._async_client_factory() as client:
+            await asyncio.gather(*(_one(client, url) for url in urls))
+        return outcomes
+
+    async def _fetch_async(self, client: httpx.AsyncClient, rss_url: str) -> list[NormalizedFeedEntry]:
+        LOGGER.info("预取 feed %s", rss_url)
+        request_headers, cookies, cached = self._prepare_request(rss_url)
+        response: httpx.Response | None = None
+        for attempt in range(1, 4):
+            try:
+                response = await client.get(rss_url, headers=request_headers, cookies=cookies or None)
+                if response.status_code == 304 and cached is not None:
+                    raise FeedNotModified(rss_url, "304")
+                response.raise_for_status()
+                break
+            except httpx.HTTPError as exc:
+                if attempt == 3:
+                    raise
+                delay = min(1.5 * attempt, 8.0)
+                LOGGER.debug("预取 feed 失败 %s (attempt %s/3); %.1fs 后重试", exc, attempt, delay)
+                await asyncio.sleep(delay)
+        assert response is not None
+        # feedparser/JSON 解析是 CPU 工作，放到线程里避免阻塞其他下载。
+        return await asyncio.to_thread(self._parse_response, rss_url, response, cached)
+
+    def _prepare_request(
+        self, rss_url: str
+    ) -> tuple[dict[str, str], dict[str, str] | None, FeedValidators | None]:
+        headers = _headers_for_feed(rss_url)
+        cookies = _cookies_for_feed(rss_url)
+        cached = self._feed_cache.get(rss_url) if self._feed_cache and not self._refresh else None
+        if cached is not None and self._feed_cache is not None:
+            headers.update(self._feed_cache.conditional_headers(rss_url))
+        return headers, cookies, cached
+
+    def _parse_response(
+        self,
+        rss_url: str,
+        response: httpx.Response,
+        cached: FeedValidators | None,
+    ) -> list[NormalizedFeedEntry]:
+        self._remember(
+            rss_url,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            cached=cached,
+        )
         if _looks_like_json(response):
             return self._parse_json_payload(rss_url, response.text)
         return self._parse_rss_feed(rss_url, response.text)
 
+    def close(self) -> None:
+        """关闭连接池与浏览器抓取器。"""
+        self._http.close()
+        with self._browser_lock:
+            fetcher = self._browser_fetcher
+            self._browser_fetcher = None
+        close = getattr(fetcher, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                LOGGER.debug("关闭浏览器抓取器失败", exc_info=True)
+
+    def prefetch(self, rss_url: str) -> int:
+        """
+        预先拉取并解析 feed，结果留给下一次 fetch(rss_url) 直接使用。
+        未更新时抛出 FeedNotModified，调用方据此跳过整个期刊。
+        """
+        entries = self.fetch(rss_url)
+        with self._prefetched_lock:
+            self._prefetched[rss_url] = entries
+        return len(entries)
+
+    def commit_feed(self, rss_url: str) -> None:
+        """期刊处理成功后提交本轮的 ETag / Last-Modified / 内容哈希。"""
+        if self._feed_cache is not None:
+            self._feed_cache.commit(rss_url)
+
+    def discard_feed(self, rss_url: str) -> None:
+        """期刊处理失败：丢弃暂存的校验信息与未消费的预取结果，下次照常拉取。"""
+        with self._prefetched_lock:
+            self._prefetched.pop(rss_url, None)
+            self._not_modified.pop(rss_url, None)
+        if self._feed_cache is not None:
+            self._feed_cache.discard(rss_url)
+
+    def _remember(
+        self,
+        rss_url: str,
+        content: bytes,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        cached: FeedValidators | None,
+    ) -> None:
+        if self._feed_cache is None:
+            return
+        digest = body_hash(content)
+        self._feed_cache.stage(
+            rss_url,
+            FeedValidators(etag=etag, last_modified=last_modified, body_hash=digest),
+        )
+        if cached is not None and cached.body_hash == digest:
+            raise FeedNotModified(rss_url, "内容未变化")
+
     def _parse_rss_feed(self, rss_url: str, text: str) -> list[NormalizedFeedEntry]:
         parsed = feedparser.parse(text)
         if getattr(parsed, "bozo", False):
@@ -209,13 +409,54 @@ class FeedClient:
         return html_bytes.decode("utf-8", errors="ignore")
 
     def _ensure_browser_fetcher(self) -> BrowserFetcher:
-        if self._browser_fetcher is None:
-            fetcher: BrowserFetcher = _ThreadedBrowserFetcher()
-            self._browser_fetcher = fetcher
+        with self._browser_lock:
+            if self._browser_fetcher is None:
+                fetcher: BrowserFetcher = _ThreadedBrowserFetcher()
+                self._browser_fetcher = fetcher
         assert self._browser_fetcher is not None
         return self._browser_fetcher
 
 
+def _build_http_client(timeout: float) -> httpx.Client:
+    return httpx.Client(timeout=timeout, limits=_http_limits(), http2=_http2_enabled())
+
+
+def _build_async_http_client(timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=timeout, limits=_http_limits(), http2=_http2_enabled())
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=_int_from_env("FEED_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=_int_from_env("FEED_MAX_KEEPALIVE_CONNECTIONS", 10),
+        keepalive_expiry=30.0,
+    )
+
+
+def _http2_enabled() -> bool:
+    """安装了 h2（`httpx[http2]`）时默认启用 HTTP/2；FEED_HTTP2=false 可关闭。"""
+    raw = os.getenv("FEED_HTTP2")
+    if raw and raw.strip().lower() in {"0", "false", "no", "off"}:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _int_from_env(env_key: str, default: int) -> int:
+    raw = os.getenv(env_key)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return default
+
+
 def _normalize_entry(entry: Any) -> NormalizedFeedEntry:
     entry_id = (
         _first_non_empty(
@@ -0,0 +1,104 @@
+# ruff: noqa: N999
+"""
+Feed 缓存：按 rss_url 持久化 ETag / Last-Modified / 内容哈希，支持条件请求。
+新的校验信息先暂存，期刊处理成功后再提交，避免失败的一轮被误判为“未更新”。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FeedNotModified(Exception):
+    """Feed 自上次成功抓取以来未变化（304 或内容哈希一致）。"""
+
+    def __init__(self, rss_url: str, reason: str) -> None:
+        super().__init__(f"{rss_url} 未更新（{reason}）")
+        self.rss_url = rss_url
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class FeedValidators:
+    etag: str | None
+    last_modified: str | None
+    body_hash: str
+
+
+class FeedCache:
+    """`.cache/feeds/<sha1(url)>.json`，每个 feed 一个文件。"""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._staged: dict[str, FeedValidators] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def get(self, rss_url: str) -> FeedValidators | None:
+        path = self._path_for(rss_url)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return FeedValidators(
+                etag=payload.get("etag"),
+                last_modified=payload.get("last_modified"),
+                body_hash=str(payload["body_hash"]),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception:
+            LOGGER.debug("读取 feed 缓存失败 %s", path, exc_info=True)
+            return None
+
+    def conditional_headers(self, rss_url: str) -> dict[str, str]:
+        cached = self.get(rss_url)
+        headers: dict[str, str] = {}
+        if cached is None:
+            return headers
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def stage(self, rss_url: str, validators: FeedValidators) -> None:
+        """暂存本轮拿到的校验信息，等待 commit。"""
+        with self._lock:
+            self._staged[rss_url] = validators
+
+    def commit(self, rss_url: str) -> None:
+        with self._lock:
+            validators = self._staged.pop(rss_url, None)
+        if validators is None:
+            return
+        path = self._path_for(rss_url)
+        payload = {"url": rss_url, **asdict(validators)}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except Exception:
+            LOGGER.debug("写入 feed 缓存失败 %s", path, exc_info=True)
+
+    def discard(self, rss_url: str) -> None:
+        with self._lock:
+            self._staged.pop(rss_url, None)
+
+    def _path_for(self, rss_url: str) -> Path:
+        digest = hashlib.sha1(rss_url.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
@@ -13,7 +13,17 @@ JournalListLoader = _list_mod.JournalListLoader  # type: ignore[attr-defined]
 ALLOWED_SOURCE_TYPES = _list_mod.ALLOWED_SOURCE_TYPES  # type: ignore[attr-defined]
 
 FeedClient = _rss.FeedClient  # type: ignore[attr-defined]
+FeedCache = _rss.FeedCache  # type: ignore[attr-defined]
+FeedNotModified = _rss.FeedNotModified  # type: ignore[attr-defined]
 BrowserFetcher = _rss.BrowserFetcher  # type: ignore[attr-defined]
 strip = _rss.strip  # type: ignore[attr-defined]
 
-__all__ = ["FeedClient", "BrowserFetcher", "strip", "JournalListLoader", "ALLOWED_SOURCE_TYPES"]
+__all__ = [
+    "ALLOWED_SOURCE_TYPES",
+    "BrowserFetcher",
+    "FeedCache",
+    "FeedClient",
+    "FeedNotModified",
+    "JournalListLoader",
+    "strip",
+]
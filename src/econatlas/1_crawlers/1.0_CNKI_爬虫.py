@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import html
+from collections.abc import Collection
 from datetime import datetime, timezone
 from urllib.parse import quote_plus, urlparse
 
@@ -28,7 +29,8 @@ class CNKI爬虫:
     def __init__(self, feed_client: FeedClient) -> None:
         self._feed_client = feed_client
 
-    def crawl(self, journal: JournalSource) -> list[ArticleRecord]:
+    def crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None) -> list[ArticleRecord]:
+        """无逐条网络增强，skip_ids 仅为与其他爬虫接口一致。"""
         entries = self._feed_client.fetch(journal.rss_url)
         records: list[ArticleRecord] = []
         for entry in entries:
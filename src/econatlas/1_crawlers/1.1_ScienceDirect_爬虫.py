@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 import os
 import time
+from collections.abc import Collection
 from datetime import datetime, timezone
 
 from econatlas._loader import load_local_module
@@ -17,6 +18,9 @@ ElsevierApiConfig = _enricher.ElsevierApiConfig  # type: ignore[attr-defined]
 ScienceDirectApiClient = _enricher.ScienceDirectApiClient  # type: ignore[attr-defined]
 ScienceDirectEnricher = _enricher.ScienceDirectEnricher  # type: ignore[attr-defined]
 
+_browser_pool_mod = load_local_module(__file__, "../5_samples/5.5_浏览器池.py", "econatlas._samples_browser_pool")
+iter_feed_records = _browser_pool_mod.iter_feed_records  # type: ignore[attr-defined]
+
 _feed_mod = load_local_module(__file__, "../0_feeds/0.1_RSS_抓取.py", "econatlas._feed_rss")
 FeedClient = _feed_mod.FeedClient  # type: ignore[attr-defined]
 
@@ -39,21 +43,28 @@ class ScienceDirect爬虫:
                 api_client=ScienceDirectApiClient(ElsevierApiConfig(api_key=api_key, inst_token=inst_token))
             )
 
-    def iter_crawl(self, journal: JournalSource):
-        entries = self._feed_client.fetch(journal.rss_url)
-        for entry in entries:
-            if self._throttle_seconds > 0:
-                time.sleep(self._throttle_seconds)
-            record = _构建基础记录(entry)
-            if self._enricher:
-                try:
-                    record, _ok = self._enricher.enrich(record, entry)
-                except Exception as exc:  # noqa: BLE001
-                    LOGGER.warning("ScienceDirect 增强失败 %s: %s", entry.link or entry.entry_id, exc)
-            yield record
-
-    def crawl(self, journal: JournalSource) -> list[ArticleRecord]:
-        return list(self.iter_crawl(journal))
+    def iter_crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None):
+        """逐条产出记录，按节流间隔串行调用 Elsevier API 增强。"""
+        yield from iter_feed_records(
+            self._feed_client.fetch(journal.rss_url),
+            _构建基础记录,
+            self._增强,
+            skip_ids=skip_ids,
+        )
+
+    def _增强(self, record: ArticleRecord, entry: NormalizedFeedEntry) -> ArticleRecord:
+        if self._throttle_seconds > 0:
+            time.sleep(self._throttle_seconds)
+        if not self._enricher:
+            return record
+        try:
+            record, _ok = self._enricher.enrich(record, entry)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("ScienceDirect 增强失败 %s: %s", entry.link or entry.entry_id, exc)
+        return record
+
+    def crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None) -> list[ArticleRecord]:
+        return list(self.iter_crawl(journal, skip_ids=skip_ids))
 
 
 def _构建基础记录(entry: NormalizedFeedEntry) -> ArticleRecord:
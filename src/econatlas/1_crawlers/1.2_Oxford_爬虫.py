@@ -4,6 +4,7 @@ Oxford 爬虫：RSS 获取后用浏览器抓取作者，翻译另行处理。
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import datetime, timezone
 
 from econatlas._loader import load_local_module
@@ -12,6 +13,10 @@ from econatlas.models import ArticleRecord, JournalSource, NormalizedFeedEntry,
 _enricher = load_local_module(__file__, "../2_enrichers/2.2_Oxford_增强器.py", "econatlas._enricher_oxford")
 OxfordEnricher = _enricher.OxfordEnricher  # type: ignore[attr-defined]
 
+_browser_pool_mod = load_local_module(__file__, "../5_samples/5.5_浏览器池.py", "econatlas._samples_browser_pool")
+BrowserPool = _browser_pool_mod.BrowserPool  # type: ignore[attr-defined]
+iter_feed_records = _browser_pool_mod.iter_feed_records  # type: ignore[attr-defined]
+
 _feed_mod = load_local_module(__file__, "../0_feeds/0.1_RSS_抓取.py", "econatlas._feed_rss")
 FeedClient = _feed_mod.FeedClient  # type: ignore[attr-defined]
 
@@ -23,19 +28,23 @@ skipped_translation = _trans_mod.skipped_translation  # type: ignore[attr-define
 class Oxford爬虫:
     """Oxford 来源：RSS + 浏览器补全作者。"""
 
-    def __init__(self, feed_client: FeedClient) -> None:
+    def __init__(self, feed_client: FeedClient, *, browser_pool: BrowserPool | None = None) -> None:
         self._feed_client = feed_client
-        self._enricher = OxfordEnricher()
+        self._enricher = OxfordEnricher(browser_pool=browser_pool)
 
-    def iter_crawl(self, journal: JournalSource):
-        entries = self._feed_client.fetch(journal.rss_url)
-        for entry in entries:
-            record = _构建基础记录(entry)
-            record = self._enricher.enrich(record, entry)
-            yield record
+    def iter_crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None):
+        """逐条产出记录，经 Oxford 增强器补全页面信息。"""
+        # 最多 max_pages 篇同时增强（默认 1 即串行），按 feed 顺序产出。
+        yield from iter_feed_records(
+            self._feed_client.fetch(journal.rss_url),
+            _构建基础记录,
+            self._enricher.enrich,
+            skip_ids=skip_ids,
+            max_in_flight=self._enricher.max_pages,
+        )
 
-    def crawl(self, journal: JournalSource) -> list[ArticleRecord]:
-        return list(self.iter_crawl(journal))
+    def crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None) -> list[ArticleRecord]:
+        return list(self.iter_crawl(journal, skip_ids=skip_ids))
 
     def close(self) -> None:
         try:
@@ -4,6 +4,7 @@ Cambridge 爬虫：直接使用 RSS/JSON 数据，不做额外增强。
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import datetime, timezone
 
 from econatlas._loader import load_local_module
@@ -23,7 +24,8 @@ class Cambridge爬虫:
     def __init__(self, feed_client: FeedClient) -> None:
         self._feed_client = feed_client
 
-    def crawl(self, journal: JournalSource) -> list[ArticleRecord]:
+    def crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None) -> list[ArticleRecord]:
+        """无逐条网络增强，skip_ids 仅为与其他爬虫接口一致。"""
         entries = self._feed_client.fetch(journal.rss_url)
         return [_构建基础记录(entry) for entry in entries]
 
@@ -4,6 +4,7 @@ NBER 爬虫：直接使用 RSS/JSON 数据，不做额外增强。
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from datetime import datetime, timezone
 
 from econatlas._loader import load_local_module
@@ -12,6 +13,10 @@ from econatlas.models import ArticleRecord, JournalSource, NormalizedFeedEntry,
 _enricher_mod = load_local_module(__file__, "../2_enrichers/2.4_NBER_增强器.py", "econatlas._enricher_nber")
 NBEREnricher = _enricher_mod.NBEREnricher  # type: ignore[attr-defined]
 
+_browser_pool_mod = load_local_module(__file__, "../5_samples/5.5_浏览器池.py", "econatlas._samples_browser_pool")
+BrowserPool = _browser_pool_mod.BrowserPool  # type: ignore[attr-defined]
+iter_feed_records = _browser_pool_mod.iter_feed_records  # type: ignore[attr-defined]
+
 _feed_mod = load_local_module(__file__, "../0_feeds/0.1_RSS_抓取.py", "econatlas._feed_rss")
 FeedClient = _feed_mod.FeedClient  # type: ignore[attr-defined]
 
@@ -23,19 +28,26 @@ skipped_translation = _trans_mod.skipped_translation  # type: ignore[attr-define
 class NBER爬虫:
     """NBER 来源：直接拉取 feed 并构建记录。"""
 
-    def __init__(self, feed_client: FeedClient) -> None:
+    def __init__(self, feed_client: FeedClient, *, browser_pool: BrowserPool | None = None) -> None:
         self._feed_client = feed_client
-        self._enricher = NBEREnricher()
+        self._enricher = NBEREnricher(browser_pool=browser_pool)
+
+    def iter_crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None):
+        """逐条产出记录，经 NBER 增强器补全页面信息。"""
+        # 最多 max_pages 篇同时增强（默认 1 即串行），按 feed 顺序产出。
+        yield from iter_feed_records(
+            self._feed_client.fetch(journal.rss_url),
+            _构建基础记录,
+            self._enricher.enrich,
+            skip_ids=skip_ids,
+            max_in_flight=self._enricher.max_pages,
+        )
 
-    def iter_crawl(self, journal: JournalSource):
-        entries = self._feed_client.fetch(journal.rss_url)
-        for entry in entries:
-            record = _构建基础记录(entry)
-            record = self._enricher.enrich(record, entry)
-            yield record
+    def crawl(self, journal: JournalSource, *, skip_ids: Collection[str] | None = None) -> list[ArticleRecord]:
+        return list(self.iter_crawl(journal, skip_ids=skip_ids))
 
-    def crawl(self, journal: JournalSource) -> list[ArticleRecord]:
-        return list(self.iter_crawl(journal))
+    def close(self) -> None:
+        self._enricher.close()
 
 
 def _构建基础记录(entry: NormalizedFeedEntry) -> ArticleRecord:
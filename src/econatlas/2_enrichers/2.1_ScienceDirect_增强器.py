@@ -5,9 +5,10 @@ ScienceDirect 增强器：使用 Elsevier API 拉取元数据并翻译摘要。
 from __future__ import annotations
 
 import logging
+import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, cast
 
@@ -34,7 +35,7 @@ class ScienceDirectApiError(RuntimeError):
 class ElsevierApiConfig:
     api_key: str
     inst_token: str | None = None
-    base_url: str = DEFAULT_BASE_URL
+    base_url: str = field(default_factory=lambda: os.getenv("ELSEVIER_API_BASE_URL") or DEFAULT_BASE_URL)
     timeout: float = 15.0
     max_retries: int = 5
     backoff_seconds: float = 1.0
@@ -7,216 +7,75 @@ from __future__ import annotations
 import json
 import logging
 import os
-import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from typing import Any
 
 from bs4 import BeautifulSoup
 
 from econatlas.models import ArticleRecord, NormalizedFeedEntry
-from econatlas.samples import (
-    BrowserCredentials,
-    PlaywrightFetcher,
-    browser_credentials_for_source,
-    browser_headless_for_source,
-    cleanup_user_data_dir,
-    browser_user_data_dir_for_source,
-    browser_launch_overrides,
-    browser_local_storage_for_source,
-    browser_user_agent_for_source,
-    browser_wait_selector_for_source,
-    build_browser_headers,
-    cookies_for_source,
-    local_storage_script,
-)
+from econatlas._loader import load_local_module
 
-LOGGER = logging.getLogger(__name__)
-OXFORD_SOURCE_TYPE = "oxford"
-
-
-class PersistentOxfordSession:
-    """维持单个 Playwright 会话，减少 Cloudflare 触发。"""
-
-    def __init__(self) -> None:
-        self._playwright = None
-        self._browser = None
-        self._context = None
-        self._throttle_seconds = _throttle_seconds_from_env()
-        self._executor = ThreadPoolExecutor(max_workers=1)
-
-    def _ensure_session(
-        self,
-        *,
-        headers: dict[str, str],
-        cookies: dict[str, str] | None,
-        credentials: BrowserCredentials | None,
-        user_agent: str,
-        wait_selector: str | None,
-        init_scripts: list[str] | None,
-        user_data_dir: str | None,
-        headless: bool,
-        browser_channel: str | None,
-        executable_path: str | None,
-    ) -> None:
-        if self._context:
-            return
-        if user_data_dir:
-            cleanup_user_data_dir(user_data_dir)
-
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError as exc:  # pragma: no cover
-            raise RuntimeError(
-                "Playwright 未安装。运行 `uv add playwright` 和 `uv run playwright install chromium`。"
-            ) from exc
-
-        self._playwright = sync_playwright().start()
-        launch_kwargs: dict[str, Any] = {"headless": headless}
-        if executable_path:
-            launch_kwargs["executable_path"] = executable_path
-        elif browser_channel:
-            launch_kwargs["channel"] = browser_channel
-
-        if user_data_dir:
-            context = self._playwright.chromium.launch_persistent_context(
-                user_data_dir,
-                **launch_kwargs,
-                user_agent=user_agent,
-                http_credentials=credentials.as_dict() if credentials else None,
-            )
-        else:
-            browser = self._playwright.chromium.launch(**launch_kwargs)
-            context_kwargs: dict[str, Any] = {"user_agent": user_agent}
-            if credentials:
-                context_kwargs["http_credentials"] = credentials.as_dict()
-            context = browser.new_context(**context_kwargs)
-            self._browser = browser
-
-        if headers:
-            context.set_extra_http_headers(headers)
-        if cookies:
-            context.add_cookies(
-                [
-                    {
-                        "name": name,
-                        "value": value,
-                        "domain": "academic.oup.com",
-                        "path": "/",
-                    }
-                    for name, value in cookies.items()
-                ]
-            )
-        if init_scripts:
-            for script in init_scripts:
-                context.add_init_script(script)
-
-        # 关闭默认空白页，避免 GUI 下残留 about:blank
-        for page in list(context.pages):
-            try:
-                page.close()
-            except Exception:
-                LOGGER.debug("关闭默认页面失败", exc_info=True)
-
-        self._context = context
+_browser_pool_mod = load_local_module(__file__, "../5_samples/5.5_浏览器池.py", "econatlas._samples_browser_pool")
+BrowserPool = _browser_pool_mod.BrowserPool  # type: ignore[attr-defined]
+SourceBrowserSession = _browser_pool_mod.SourceBrowserSession  # type: ignore[attr-defined]
 
-    def fetch(self, url: str, wait_selector: str | None) -> str:
-        def _run() -> str:
-            if not self._context:
-                raise RuntimeError("会话未初始化")
-            page = self._context.new_page()
-            if self._throttle_seconds > 0:
-                time.sleep(self._throttle_seconds)
-            page.goto(url, wait_until="domcontentloaded", timeout=45_000)
-            if wait_selector:
-                try:
-                    page.wait_for_selector(wait_selector, timeout=45_000)
-                except Exception:  # noqa: BLE001
-                    LOGGER.debug("等待选择器 %s 超时: %s", wait_selector, url)
-            html_text = page.content()
-            page.close()
-            return html_text
+_tiered_mod = load_local_module(__file__, "2.5_HTTP优先抓取.py", "econatlas._enricher_tiered")
+TieredFetcher = _tiered_mod.TieredFetcher  # type: ignore[attr-defined]
 
-        return self._executor.submit(_run).result()
-
-    def close(self) -> None:
-        def _close() -> None:
-            try:
-                if self._context:
-                    self._context.close()
-                if self._browser:
-                    self._browser.close()
-                if self._playwright:
-                    self._playwright.stop()
-            except Exception:
-                LOGGER.debug("关闭 Oxford 会话失败", exc_info=True)
-            finally:
-                self._context = None
-                self._browser = None
-                self._playwright = None
-
-        try:
-            self._executor.submit(_close).result(timeout=10)
-        except FuturesTimeout:
-            LOGGER.debug("关闭 Oxford 会话超时", exc_info=True)
-        except Exception:
-            LOGGER.debug("关闭 Oxford 会话失败", exc_info=True)
-        self._executor.shutdown(wait=True, cancel_futures=True)
+LOGGER = logging.getLogger(__name__)
+OXFORD_SOURCE_TYPE = "oxford"
 
 
 class OxfordArticleFetcher:
-    def __init__(self, fetcher: PlaywrightFetcher | None = None) -> None:
-        self._fetcher = fetcher or PlaywrightFetcher()
-        self._session = PersistentOxfordSession()
+    """通过浏览器池抓取 Oxford 文章页（与其他来源共用 Chromium，独立上下文）。"""
+
+    def __init__(self, *, browser_pool: BrowserPool | None = None) -> None:
+        self._session = SourceBrowserSession(
+            OXFORD_SOURCE_TYPE,
+            browser_pool=browser_pool,
+            referer="https://academic.oup.com/",
+            cookie_domain="academic.oup.com",
+            throttle_seconds=_throttle_seconds_from_env(),
+        )
+        # 部分文章页可直接 HTTP 获取作者 meta；遇到 Cloudflare 验证页再用浏览器。
+        self._tiered = TieredFetcher(
+            OXFORD_SOURCE_TYPE,
+            browser=self._session,
+            referer="https://academic.oup.com/",
+            accept=_has_author_meta,
+            wait=self._session.rate_limiter.wait,
+        )
+
+    @property
+    def max_pages(self) -> int:
+        return self._session.max_pages
 
     def fetch_html(self, url: str) -> str:
-        headers = build_browser_headers({"Referer": "https://academic.oup.com/"}, OXFORD_SOURCE_TYPE)
-        cookies = cookies_for_source(OXFORD_SOURCE_TYPE)
-        credentials = browser_credentials_for_source(OXFORD_SOURCE_TYPE)
-        user_agent = browser_user_agent_for_source(OXFORD_SOURCE_TYPE, headers)
-        wait_selector = browser_wait_selector_for_source(OXFORD_SOURCE_TYPE)
-        init_scripts = []
-        local_storage_entries = browser_local_storage_for_source(OXFORD_SOURCE_TYPE)
-        if local_storage_entries:
-            init_scripts.append(local_storage_script(local_storage_entries))
-        user_data_dir = browser_user_data_dir_for_source(OXFORD_SOURCE_TYPE)
-        if user_data_dir:
-            cleanup_user_data_dir(user_data_dir)
-        headless = browser_headless_for_source(OXFORD_SOURCE_TYPE)
-        browser_channel, executable_path = browser_launch_overrides(OXFORD_SOURCE_TYPE)
-        self._session._executor.submit(  # type: ignore[attr-defined]
-            self._session._ensure_session,  # type: ignore[attr-defined]
-            headers=headers,
-            cookies=cookies,
-            credentials=credentials,
-            user_agent=user_agent,
-            wait_selector=wait_selector,
-            init_scripts=init_scripts or None,
-            user_data_dir=user_data_dir,
-            headless=headless,
-            browser_channel=browser_channel,
-            executable_path=executable_path,
-        ).result()
-        html_text = self._session.fetch(url, wait_selector=wait_selector)
-        return html_text
+        return str(self._tiered.fetch_html(url))
+
+    def close(self) -> None:
+        self._tiered.close()
 
 
 class OxfordEnricher:
-    def __init__(self, fetcher: OxfordArticleFetcher | None = None) -> None:
-        self._fetcher = fetcher or OxfordArticleFetcher()
-        throttle_env = os.getenv("OXFORD_THROTTLE_SECONDS")
-        try:
-            self._throttle_seconds = float(throttle_env) if throttle_env else 3.0
-        except ValueError:
-            self._throttle_seconds = 3.0
+    def __init__(
+        self,
+        fetcher: OxfordArticleFetcher | None = None,
+        *,
+        browser_pool: BrowserPool | None = None,
+    ) -> None:
+        # 节流由共享会话的来源限速器负责（OXFORD_THROTTLE_SECONDS），此处不再额外等待。
+        self._fetcher = fetcher or OxfordArticleFetcher(browser_pool=browser_pool)
         self._closed = False
 
+    @property
+    def max_pages(self) -> int:
+        return self._fetcher.max_pages
+
     def enrich(self, record: ArticleRecord, entry: NormalizedFeedEntry) -> ArticleRecord:
         if record.authors:
             return record
         if not entry.link:
             return record
-        if self._throttle_seconds > 0:
-            time.sleep(self._throttle_seconds)
         try:
             html = self._fetcher.fetch_html(entry.link)
         except Exception as exc:  # noqa: BLE001
@@ -230,7 +89,7 @@ class OxfordEnricher:
     def close(self) -> None:
         if not self._closed:
             try:
-                self._fetcher._session.close()  # type: ignore[attr-defined]
+                self._fetcher.close()
             except Exception:
                 LOGGER.debug("关闭 Oxford 会话失败", exc_info=True)
             self._closed = True
@@ -248,6 +107,10 @@ def _throttle_seconds_from_env() -> float:
         return 3.0
 
 
+def _has_author_meta(html: str) -> bool:
+    return "citation_author" in html
+
+
 def _extract_authors(html: str) -> list[str]:
     soup = BeautifulSoup(html, "html.parser")
     authors = _authors_from_json_ld(soup)
@@ -18,6 +18,13 @@ from econatlas.models import ArticleRecord, NormalizedFeedEntry
 from econatlas.translation import detect_language
 from econatlas._loader import load_local_module
 
+_browser_pool_mod = load_local_module(__file__, "../5_samples/5.5_浏览器池.py", "econatlas._samples_browser_pool")
+BrowserPool = _browser_pool_mod.BrowserPool  # type: ignore[attr-defined]
+SourceBrowserSession = _browser_pool_mod.SourceBrowserSession  # type: ignore[attr-defined]
+
+_tiered_mod = load_local_module(__file__, "2.5_HTTP优先抓取.py", "econatlas._enricher_tiered")
+TieredFetcher = _tiered_mod.TieredFetcher  # type: ignore[attr-defined]
+
 LOGGER = logging.getLogger(__name__)
 
 NBER_ID_REGEX = re.compile(r"/w(\d+)", re.IGNORECASE)
@@ -34,15 +41,36 @@ class NberConfig:
 class NBEREnricher:
     """为 NBER 文章补充摘要，优先使用官方 JSON API。"""
 
-    def __init__(self, config: NberConfig | None = None) -> None:
+    def __init__(self, config: NberConfig | None = None, *, browser_pool: BrowserPool | None = None) -> None:
         raw_cookies = os.getenv("NBER_COOKIES")
         throttle = _throttle_seconds_from_env()
         self._config = config or NberConfig(cookies=raw_cookies, throttle_seconds=throttle)
-        self._browser = _PersistentBrowserSession(throttle_seconds=self._config.throttle_seconds)
+        self._browser = SourceBrowserSession(
+            "nber",
+            browser_pool=browser_pool,
+            referer="https://www.nber.org/",
+            cookie_domain=".nber.org",
+            extra_headers={"Accept-Language": "en-US,en;q=0.9,zh;q=0.6"},
+            wait_selector="#abstract",
+            throttle_seconds=self._config.throttle_seconds,
+        )
+        # 工作论文页通常可直接 HTTP 获取；拿到 teaser（无摘要节点）或验证页时再用浏览器。
+        self._fetcher = TieredFetcher(
+            "nber",
+            browser=self._browser,
+            referer="https://www.nber.org/",
+            accept=_has_abstract_node,
+            extra_headers={"Accept-Language": "en-US,en;q=0.9,zh;q=0.6"},
+            wait=self._browser.rate_limiter.wait,
+        )
+
+    @property
+    def max_pages(self) -> int:
+        return self._browser.max_pages
 
     def close(self) -> None:
         try:
-            self._browser.close()
+            self._fetcher.close()
         except Exception:
             LOGGER.debug("关闭 NBER 浏览器会话失败", exc_info=True)
 
@@ -75,8 +103,8 @@ class NBEREnricher:
         return record
 
     def _fetch_html(self, url: str) -> str:
-        # 直接使用浏览器会话抓取，避免 teaser。
-        return self._browser.fetch(url)
+        # HTTP 优先，缺少摘要节点（teaser）时升级浏览器；节流由会话的共享限速器负责。
+        return str(self._fetcher.fetch_html(url))
 
 
 def _extract_nber_id(url: str) -> str | None:
@@ -93,6 +121,10 @@ def _extract_abstract_from_api(payload: dict[str, Any]) -> str | None:
     return None
 
 
+def _has_abstract_node(html: str) -> bool:
+    return "page-header__intro" in html or 'id="abstract"' in html
+
+
 def _extract_abstract(html: str) -> str | None:
     soup = BeautifulSoup(html, "html.parser")
     # 0) 页头 intro（NBER 摘要常在此处），存在则直接返回最长 intro 文本。
@@ -177,122 +209,6 @@ def _extract_abstract(html: str) -> str | None:
     return None
 
 
-# 浏览器持久会话（复用全局设置，与 Wiley/Chicago 模式一致）
-_samples_env = load_local_module(__file__, "../5_samples/5.3_浏览器环境.py", "econatlas._samples_env")
-build_browser_headers = _samples_env.build_browser_headers  # type: ignore[attr-defined]
-browser_credentials_for_source = _samples_env.browser_credentials_for_source  # type: ignore[attr-defined]
-browser_user_agent_for_source = _samples_env.browser_user_agent_for_source  # type: ignore[attr-defined]
-browser_user_data_dir_for_source = _samples_env.browser_user_data_dir_for_source  # type: ignore[attr-defined]
-browser_headless_for_source = _samples_env.browser_headless_for_source  # type: ignore[attr-defined]
-browser_launch_overrides = _samples_env.browser_launch_overrides  # type: ignore[attr-defined]
-cookies_for_source = _samples_env.cookies_for_source  # type: ignore[attr-defined]
-cleanup_user_data_dir = _samples_env.cleanup_user_data_dir  # type: ignore[attr-defined]
-
-
-class _PersistentBrowserSession:
-    def __init__(self, throttle_seconds: float) -> None:
-        self._throttle_seconds = throttle_seconds
-        self._cookies = cookies_for_source("nber")
-        self._playwright = None
-        self._browser = None
-        self._context = None
-
-    def _ensure_session(self) -> None:
-        if self._context:
-            return
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError as exc:  # pragma: no cover
-            raise RuntimeError(
-                "Playwright 未安装。运行 `uv add playwright` 和 `uv run playwright install chromium`。"
-            ) from exc
-
-        user_agent = browser_user_agent_for_source("nber", {})
-        headers = build_browser_headers(
-            {
-                "Referer": "https://www.nber.org/",
-                "Accept-Language": "en-US,en;q=0.9,zh;q=0.6",
-            },
-            "nber",
-        )
-        credentials = browser_credentials_for_source("nber")
-        user_data_dir = browser_user_data_dir_for_source("nber") or os.getenv("BROWSER_USER_DATA_DIR")
-        headless = browser_headless_for_source("nber")
-        browser_channel, executable_path = browser_launch_overrides("nber")
-
-        if user_data_dir:
-            cleanup_user_data_dir(user_data_dir)
-
-        self._playwright = sync_playwright().start()
-        launch_kwargs: dict[str, Any] = {"headless": headless}
-        if executable_path:
-            launch_kwargs["executable_path"] = executable_path
-        elif browser_channel:
-            launch_kwargs["channel"] = browser_channel
-
-        if user_data_dir:
-            context = self._playwright.chromium.launch_persistent_context(
-                user_data_dir,
-                **launch_kwargs,
-                user_agent=user_agent,
-                http_credentials=credentials.as_dict() if credentials else None,
-            )
-        else:
-            browser = self._playwright.chromium.launch(**launch_kwargs)
-            self._browser = browser
-            context_kwargs: dict[str, Any] = {"user_agent": user_agent}
-            if credentials:
-                context_kwargs["http_credentials"] = credentials.as_dict()
-            context = browser.new_context(**context_kwargs)
-
-        if headers:
-            context.set_extra_http_headers(headers)
-        if self._cookies:
-            context.add_cookies(
-                [
-                    {"name": name, "value": value, "domain": ".nber.org", "path": "/"}
-                    for name, value in self._cookies.items()
-                ]
-            )
-        # 关闭默认空白页
-        for page in list(context.pages):
-            try:
-                page.close()
-            except Exception:
-                LOGGER.debug("关闭默认页面失败", exc_info=True)
-        self._context = context
-
-    def fetch(self, url: str) -> str:
-        self._ensure_session()
-        assert self._context is not None
-        if self._throttle_seconds > 0:
-            time.sleep(self._throttle_seconds)
-        page = self._context.new_page()
-        page.goto(url, wait_until="domcontentloaded", timeout=45_000)
-        try:
-            page.wait_for_selector("#abstract", timeout=30_000)
-        except Exception:
-            LOGGER.debug("等待摘要节点超时: %s", url)
-        html_text = page.content()
-        page.close()
-        return html_text
-
-    def close(self) -> None:
-        try:
-            if self._context:
-                self._context.close()
-            if self._browser:
-                self._browser.close()
-            if self._playwright:
-                self._playwright.stop()
-        except Exception:
-            LOGGER.debug("关闭 NBER 会话失败", exc_info=True)
-        finally:
-            self._context = None
-            self._browser = None
-            self._playwright = None
-
-
 def _throttle_seconds_from_env() -> float:
     raw = os.getenv("NBER_THROTTLE_SECONDS")
     if not raw:
@@ -0,0 +1,161 @@
+# ruff: noqa: N999
+"""
+HTTP 优先抓取：先用连接池化的 httpx 请求文章页，遇到验证页或缺少目标内容时再升级到浏览器。
+按主机统计升级率，便于调整哪些来源值得先走 HTTP。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import urlsplit
+
+import httpx
+
+from econatlas._loader import load_local_module
+
+_samples_env = load_local_module(__file__, "../5_samples/5.3_浏览器环境.py", "econatlas._samples_env")
+build_browser_headers = _samples_env.build_browser_headers  # type: ignore[attr-defined]
+browser_user_agent_for_source = _samples_env.browser_user_agent_for_source  # type: ignore[attr-defined]
+cookies_for_source = _samples_env.cookies_for_source  # type: ignore[attr-defined]
+looks_like_challenge = _samples_env.looks_like_challenge  # type: ignore[attr-defined]
+
+LOGGER = logging.getLogger(__name__)
+
+HTTP_FIRST_DEFAULT_SOURCES = frozenset({"nber", "oxford"})
+
+
+class BrowserHtmlSession(Protocol):
+    def fetch_html(self, url: str, *, throttle: bool = True, cache_lookup: bool = True) -> str: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass
+class HostEscalationStats:
+    http_ok: int = 0
+    escalated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.http_ok + self.escalated
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.total if self.total else 0.0
+
+
+class TieredFetcher:
+    """
+    先 HTTP、后浏览器的文章页抓取器。
+    accept(html) 返回 False 表示 HTTP 结果缺少所需内容（如摘要节点），需要升级到浏览器。
+    与浏览器会话共用页面缓存：命中时两层都跳过，HTTP 成功的结果同样写入缓存。
+    升级到浏览器时不再重复查缓存；HTTP 尝试前已等待过 wait 时也不再重复等待同一限速器。
+    """
+
+    def __init__(
+        self,
+        source_type: str,
+        *,
+        browser: BrowserHtmlSession,
+        referer: str,
+        accept: Callable[[str], bool],
+        extra_headers: dict[str, str] | None = None,
+        http_client: httpx.Client | None = None,
+        wait: Callable[[], None] | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        self._source_type = source_type
+        self._browser = browser
+        self._referer = referer
+        self._accept = accept
+        self._extra_headers = extra_headers or {}
+        self._wait = wait
+        self._enabled = http_first_enabled(source_type) if enabled is None else enabled
+        self._owns_client = http_client is None
+        self._http = http_client or httpx.Client(
+            timeout=20.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0),
+        )
+        self._lock = threading.Lock()
+        self._stats: dict[str, HostEscalationStats] = {}
+
+    def fetch_html(self, url: str) -> str:
+        if self._enabled:
+            cache = getattr(self._browser, "html_cache", None)
+            if cache is not None:
+                cached = cache.get(url)
+                if cached is not None:
+                    return str(cached.html)
+            html = self._try_http(url)
+            if html is not None:
+                self._record(url, escalated=False)
+                if cache is not None:
+                    cache.put(url, html, source=self._source_type)
+                return html
+            self._record(url, escalated=True)
+            return self._browser.fetch_html(url, throttle=self._wait is None, cache_lookup=False)
+        return self._browser.fetch_html(url)
+
+    def escalation_stats(self) -> dict[str, HostEscalationStats]:
+        """按主机返回 HTTP 成功/升级浏览器次数。"""
+        with self._lock:
+            return {host: HostEscalationStats(stats.http_ok, stats.escalated) for host, stats in self._stats.items()}
+
+    def close(self) -> None:
+        for host, stats in self.escalation_stats().items():
+            LOGGER.info(
+                "%s HTTP 优先：%s 升级浏览器 %d/%d（%.0f%%）",
+                self._source_type,
+                host,
+                stats.escalated,
+                stats.total,
+                stats.escalation_rate * 100,
+            )
+        if self._owns_client:
+            self._http.close()
+        self._browser.close()
+
+    def _try_http(self, url: str) -> str | None:
+        headers = build_browser_headers({"Referer": self._referer, **self._extra_headers}, self._source_type)
+        headers["User-Agent"] = browser_user_agent_for_source(self._source_type, headers)
+        if self._wait is not None:
+            self._wait()
+        try:
+            response = self._http.get(url, headers=headers, cookies=cookies_for_source(self._source_type))
+        except httpx.HTTPError as exc:
+            LOGGER.debug("HTTP 抓取失败，改用浏览器 %s: %s", url, exc)
+            return None
+        if response.status_code != 200:
+            LOGGER.debug("HTTP 状态 %s，改用浏览器 %s", response.status_code, url)
+            return None
+        html = response.text
+        if looks_like_challenge(html):
+            LOGGER.debug("命中验证页，改用浏览器 %s", url)
+            return None
+        if not self._accept(html):
+            LOGGER.debug("HTTP 页面缺少目标内容，改用浏览器 %s", url)
+            return None
+        return html
+
+    def _record(self, url: str, *, escalated: bool) -> None:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            stats = self._stats.setdefault(host, HostEscalationStats())
+            if escalated:
+                stats.escalated += 1
+            else:
+                stats.http_ok += 1
+
+
+def http_first_enabled(source_type: str) -> bool:
+    """`<SOURCE>_HTTP_FIRST` 控制是否先走 HTTP；NBER/Oxford 默认开启。"""
+    raw = os.getenv(f"{source_type.upper()}_HTTP_FIRST")
+    if raw is None or not raw.strip():
+        return source_type in HTTP_FIRST_DEFAULT_SOURCES
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
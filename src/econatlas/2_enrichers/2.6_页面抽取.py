@@ -0,0 +1,167 @@
+# ruff: noqa: N999
+"""
+出版商文章页的公共抽取：每页只解析一次，一次遍历同时取出作者、摘要、DOI 与发表日期。
+快速路径先流式扫描 <head> 的 meta 标签，读到 </head> 即停止；head 中已有完整摘要时不再构建 DOM。
+全量解析在安装了 lxml 时用 lxml，否则退回 html.parser。
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup, Tag
+from dateutil import parser as date_parser
+
+# 正文摘要容器：id 或 class 中含 abstract 的 section/div（id 匹配优先）。
+_ABSTRACT_RE = re.compile("abstract", re.IGNORECASE)
+_DOI_RE = re.compile(r"10\.\d{4,9}/\S+")
+_ABSTRACT_META_NAMES = ("citation_abstract", "dc.Description", "description")
+_DOI_META_NAMES = ("citation_doi", "dc.Identifier", "prism.doi")
+_DATE_META_NAMES = ("citation_publication_date", "citation_date", "dc.Date", "citation_online_date")
+_WANTED_META_NAMES = frozenset({"citation_author", *_ABSTRACT_META_NAMES, *_DOI_META_NAMES, *_DATE_META_NAMES})
+# 这两个 meta 通常是完整摘要；description/og:description 常被截断，仍需看正文。
+_FULL_ABSTRACT_META_NAMES = ("citation_abstract", "dc.Description")
+_OG_DESCRIPTION = "og:description"
+_HEAD_CHUNK_CHARS = 16_384
+
+
+@dataclass(frozen=True)
+class PageMetadata:
+    authors: tuple[str, ...] = ()
+    abstract: str | None = None
+    doi: str | None = None
+    published_at: datetime | None = None
+
+
+def html_parser_backend() -> str:
+    """返回 BeautifulSoup 使用的解析器名称：lxml（已安装时）或 html.parser。"""
+    return _PARSER
+
+
+def extract_page_metadata(html: str) -> PageMetadata:
+    head_metas = _scan_head_metas(html)
+    if head_metas is not None and _first_meta(head_metas, _FULL_ABSTRACT_META_NAMES):
+        return _metadata_from(head_metas, body_abstract=None)
+    return _extract_full(html)
+
+
+def _extract_full(html: str) -> PageMetadata:
+    soup = BeautifulSoup(html, _PARSER)
+    metas: dict[str, list[str]] = {}
+    by_id: list[Tag] = []
+    by_class: list[Tag] = []
+    for node in soup.find_all(["meta", "section", "div"]):
+        if not isinstance(node, Tag):
+            continue
+        if node.name == "meta":
+            _collect_meta(metas, node.get("name"), node.get("property"), node.get("content"))
+            continue
+        node_id = node.get("id")
+        if node_id and _ABSTRACT_RE.search(str(node_id)):
+            by_id.append(node)
+        classes = node.get("class")
+        if classes and _ABSTRACT_RE.search(classes if isinstance(classes, str) else " ".join(classes)):
+            by_class.append(node)
+    return _metadata_from(metas, body_abstract=_body_abstract(by_id) or _body_abstract(by_class))
+
+
+def _metadata_from(metas: dict[str, list[str]], *, body_abstract: str | None) -> PageMetadata:
+    return PageMetadata(
+        authors=tuple(metas.get("citation_author", ())),
+        abstract=body_abstract or _first_meta(metas, (*_ABSTRACT_META_NAMES, _OG_DESCRIPTION)),
+        doi=_doi_from_metas(metas),
+        published_at=_date_from_metas(metas),
+    )
+
+
+def _collect_meta(metas: dict[str, list[str]], name: object, prop: object, content: object) -> None:
+    if not isinstance(content, str) or not content.strip():
+        return
+    if isinstance(name, str) and name in _WANTED_META_NAMES:
+        metas.setdefault(name, []).append(content.strip())
+    elif prop == _OG_DESCRIPTION:
+        metas.setdefault(_OG_DESCRIPTION, []).append(content.strip())
+
+
+class _HeadMetaScanner(HTMLParser):
+    """只收集 meta 标签；遇到 </head> 或 <body> 即标记结束。"""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.metas: dict[str, list[str]] = {}
+        self.done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "meta":
+            values = dict(attrs)
+            _collect_meta(self.metas, values.get("name"), values.get("property"), values.get("content"))
+        elif tag == "body":
+            self.done = True
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.done = True
+
+
+def _scan_head_metas(html: str) -> dict[str, list[str]] | None:
+    """分块喂给流式解析器，读完 head 即返回；没有找到 head 结束位置时返回 None。"""
+    scanner = _HeadMetaScanner()
+    for offset in range(0, len(html), _HEAD_CHUNK_CHARS):
+        scanner.feed(html[offset : offset + _HEAD_CHUNK_CHARS])
+        if scanner.done:
+            return scanner.metas
+    return None
+
+
+def _body_abstract(nodes: list[Tag]) -> str | None:
+    # 优先从正文区域抓取完整摘要，避免 meta 描述被截断。
+    for node in nodes:
+        text = " ".join(p.get_text(" ", strip=True) for p in node.find_all(["p", "div"], recursive=True))
+        if text:
+            return text
+    return None
+
+
+def _first_meta(metas: dict[str, list[str]], names: tuple[str, ...]) -> str | None:
+    for name in names:
+        values = metas.get(name)
+        if values:
+            return values[0]
+    return None
+
+
+def _doi_from_metas(metas: dict[str, list[str]]) -> str | None:
+    for name in _DOI_META_NAMES:
+        for value in metas.get(name, ()):
+            match = _DOI_RE.search(value)
+            if match:
+                return match.group(0)
+    return None
+
+
+def _date_from_metas(metas: dict[str, list[str]]) -> datetime | None:
+    raw = _first_meta(metas, _DATE_META_NAMES)
+    if raw is None:
+        return None
+    try:
+        parsed = date_parser.parse(raw)
+    except (ValueError, OverflowError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _detect_parser() -> str:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+_PARSER = _detect_parser()
@@ -1,5 +1,5 @@
 """
-出版商增强器集合：ScienceDirect API、Oxford 作者补全等。
+出版商增强器集合：ScienceDirect API、Oxford 作者补全、HTTP 优先抓取、文章页公共抽取等。
 """
 
 from __future__ import annotations
@@ -8,6 +8,8 @@ from econatlas._loader import load_local_module
 
 _scd = load_local_module(__file__, "2.1_ScienceDirect_增强器.py", "econatlas._enricher_scd")
 _oxford = load_local_module(__file__, "2.2_Oxford_增强器.py", "econatlas._enricher_oxford")
+_tiered = load_local_module(__file__, "2.5_HTTP优先抓取.py", "econatlas._enricher_tiered")
+_extract = load_local_module(__file__, "2.6_页面抽取.py", "econatlas._enricher_extract")
 
 ScienceDirectEnricher = _scd.ScienceDirectEnricher
 ScienceDirectApiClient = _scd.ScienceDirectApiClient
@@ -16,7 +18,13 @@ ScienceDirectApiError = _scd.ScienceDirectApiError
 
 OxfordEnricher = _oxford.OxfordEnricher
 OxfordArticleFetcher = _oxford.OxfordArticleFetcher
-PersistentOxfordSession = _oxford.PersistentOxfordSession
+
+TieredFetcher = _tiered.TieredFetcher
+HostEscalationStats = _tiered.HostEscalationStats
+
+PageMetadata = _extract.PageMetadata
+extract_page_metadata = _extract.extract_page_metadata
+html_parser_backend = _extract.html_parser_backend
 
 __all__ = [
     "ScienceDirectEnricher",
@@ -25,5 +33,9 @@ __all__ = [
     "ScienceDirectApiError",
     "OxfordEnricher",
     "OxfordArticleFetcher",
-    "PersistentOxfordSession",
+    "TieredFetcher",
+    "HostEscalationStats",
+    "PageMetadata",
+    "extract_page_metadata",
+    "html_parser_backend",
 ]
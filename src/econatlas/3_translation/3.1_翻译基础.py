@@ -4,25 +4,96 @@
 
 from __future__ import annotations
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Protocol, cast
-
-from langdetect import DetectorFactory, LangDetectException, detect
+from typing import Any, Protocol, cast
 
 from econatlas.models import TranslationStatus
 
-DetectorFactory.seed = 0
+# 语言检测：先按 Unicode 文字比例判断明显的中文/英文，只有拿不准时才调用 langdetect。
+_HAN_RANGES = ((0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF))
+_KANA_RANGE = (0x3040, 0x30FF)
+_HANGUL_RANGES = ((0x1100, 0x11FF), (0xAC00, 0xD7AF))
+_EN_WORD_RE = re.compile(r"[a-z]+")
+_EN_STOPWORDS = frozenset(
+    {"the", "of", "and", "in", "to", "a", "is", "that", "we", "for", "this", "on", "with", "are", "by", "as", "our"}
+)
+_CJK_MIN_RATIO = 0.5
+_LATIN_MIN_RATIO = 0.98
+_EN_MIN_WORDS = 8
+_EN_MIN_STOPWORD_RATIO = 0.15
+_CACHE_SIZE = 4096
+
+_cache: OrderedDict[bytes, str | None] = OrderedDict()
+_cache_lock = threading.Lock()
+_langdetect: Any = None
 
 
 def detect_language(text: str) -> str | None:
-    """检测文本语言代码。"""
+    """检测文本语言代码（中文统一返回 zh-cn）；结果按内容哈希做 LRU 缓存。"""
     trimmed = text.strip()
     if not trimmed:
         return None
+    key = hashlib.blake2b(trimmed.encode("utf-8"), digest_size=16).digest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    language = _detect_by_script(trimmed)
+    if language is None:
+        language = _detect_with_langdetect(trimmed)
+    with _cache_lock:
+        _cache[key] = language
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return language
+
+
+def _detect_by_script(text: str) -> str | None:
+    han = kana = hangul = latin = letters = 0
+    for char in text:
+        if not char.isalpha():
+            continue
+        letters += 1
+        code = ord(char)
+        if code < 0x250:
+            latin += 1
+        elif any(low <= code <= high for low, high in _HAN_RANGES):
+            han += 1
+        elif _KANA_RANGE[0] <= code <= _KANA_RANGE[1]:
+            kana += 1
+        elif any(low <= code <= high for low, high in _HANGUL_RANGES):
+            hangul += 1
+    if not letters:
+        return None
+    if han / letters >= _CJK_MIN_RATIO and not kana and not hangul:
+        return "zh-cn"
+    if latin / letters >= _LATIN_MIN_RATIO:
+        # 拉丁字母只说明是西文，再用英文虚词比例确认是英文；法/德/西等交给 langdetect。
+        words = _EN_WORD_RE.findall(text.lower())
+        if len(words) >= _EN_MIN_WORDS:
+            stopwords = sum(1 for word in words if word in _EN_STOPWORDS)
+            if stopwords / len(words) >= _EN_MIN_STOPWORD_RATIO:
+                return "en"
+    return None
+
+
+def _detect_with_langdetect(text: str) -> str | None:
+    global _langdetect
+    if _langdetect is None:
+        # 延迟导入：语料档案较大，只有文字比例判断不了时才加载。
+        import langdetect
+
+        langdetect.DetectorFactory.seed = 0
+        _langdetect = langdetect
     try:
-        return cast(str, detect(trimmed))
-    except LangDetectException:
+        return cast(str, _langdetect.detect(text))
+    except _langdetect.LangDetectException:
         return None
 
 
@@ -63,6 +134,22 @@ def failed_translation(error: str) -> TranslationResult:
     )
 
 
+def translate_texts(
+    translator: Translator,
+    texts: Sequence[str],
+    *,
+    source_languages: Sequence[str | None],
+) -> list[TranslationResult]:
+    """翻译器支持 translate_batch 时批量提交，否则逐条调用 translate；结果顺序与输入一致。"""
+    translate_batch = getattr(translator, "translate_batch", None)
+    if translate_batch is not None and len(texts) > 1:
+        return list(translate_batch(texts, source_languages=source_languages))
+    return [
+        translator.translate(text, source_language=language or "unknown")
+        for text, language in zip(texts, source_languages)
+    ]
+
+
 class NoOpTranslator(Translator):
     """禁用翻译的占位实现。"""
 
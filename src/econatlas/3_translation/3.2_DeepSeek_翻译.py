@@ -1,12 +1,16 @@
 """
-DeepSeek 翻译适配器：调用官方 API 翻译摘要。
+DeepSeek 翻译适配器：调用官方 API 翻译摘要，支持把多篇摘要打包进一次请求。
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import time
-from datetime import datetime, timezone
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
 
 import httpx
 
@@ -19,6 +23,17 @@ Translator = _base.Translator  # type: ignore[attr-defined]
 LOGGER = logging.getLogger(__name__)
 
 DEEPSEEK_API_URL = "https://api.deepseek.com/chat/completions"
+SYSTEM_PROMPT = "You translate academic abstracts into fluent, formal Simplified Chinese while preserving terminology."
+BATCH_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + " You will receive a JSON array of abstracts, each with an integer id."
+    " Reply with a JSON object of the form {\"translations\": [{\"id\": <id>, \"text\": <translation>}]}"
+    " containing exactly one entry per input id and nothing else."
+)
+# 提示词或输出格式变化时递增，翻译记忆据此失效旧译文。
+PROMPT_VERSION = "1"
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_BATCH_MAX_TOKENS = 3000
 
 
 class DeepSeekTranslator(Translator):
@@ -32,12 +47,23 @@ class DeepSeekTranslator(Translator):
         timeout: float = 30.0,
         max_retries: int = 5,
         backoff_seconds: float = 1.0,
+        batch_size: int | None = None,
+        batch_max_tokens: int | None = None,
+        http_client: httpx.Client | None = None,
+        memory: Any | None = None,
+        api_url: str | None = None,
     ):
         self._api_key = api_key
         self._model = model
         self._max_retries = max(1, max_retries)
         self._backoff_seconds = backoff_seconds
-        self._client = httpx.Client(timeout=timeout)
+        self._batch_size = batch_size or _int_from_env("TRANSLATION_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        self._batch_max_tokens = batch_max_tokens or _int_from_env(
+            "TRANSLATION_BATCH_MAX_TOKENS", DEFAULT_BATCH_MAX_TOKENS
+        )
+        self._client = http_client or httpx.Client(timeout=timeout)
+        self._memory = memory
+        self._api_url = api_url or deepseek_api_url()
 
     def translate(self, text: str, *, source_language: str | None = None, target_language: str = "zh") -> TranslationResult:
         if not text.strip():
@@ -45,81 +71,262 @@ class DeepSeekTranslator(Translator):
                 status="skipped",
                 translated_text="",
                 translator="deepseek",
-                translated_at=datetime.now(timezone.utc),
+                translated_at=datetime.now(UTC),
+            )
+        if self._memory is not None:
+            remembered = self._memory.get(
+                text, model=self._model, prompt_version=PROMPT_VERSION, target_language=target_language
             )
+            if remembered is not None:
+                return remembered_result(remembered)
 
-        payload = {
-            "model": self._model,
-            "temperature": 0.2,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You translate academic abstracts into fluent, formal Simplified Chinese while preserving terminology.",
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Source language: {source_language or 'unknown'}\n"
-                        f"Target language: {target_language}\n"
-                        "Translate the following abstract:\n"
-                        f"{text}"
-                    ),
-                },
-            ],
-        }
+        payload = build_translation_payload(self._model, text, source_language, target_language)
+        data, error = self._post(payload)
+        if data is None:
+            return failed_result(error or "empty response")
+
+        message = message_content(data)
+        if not message:
+            LOGGER.error("DeepSeek 返回空内容: %s", data)
+            return failed_result("empty response")
+
+        self._remember(text, message, target_language)
+        return TranslationResult(
+            status="success",
+            translated_text=message,
+            translator="deepseek",
+            translated_at=datetime.now(UTC),
+        )
+
+    def translate_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        source_languages: Sequence[str | None] | None = None,
+        target_language: str = "zh",
+    ) -> list[TranslationResult]:
+        """
+        按条数上限与 token 预算把摘要分组，每组一次请求，要求模型返回带 id 的 JSON。
+        某组解析失败或缺少条目时，只对缺失的条目逐条重译；结果顺序与输入一致。
+        """
+        languages = list(source_languages) if source_languages is not None else [None] * len(texts)
+        results: list[TranslationResult | None] = [None] * len(texts)
+        pending = [index for index, text in enumerate(texts) if text.strip()]
+        for index, text in enumerate(texts):
+            if not text.strip():
+                results[index] = self.translate(text)
+        if self._memory is not None and pending:
+            remembered = self._memory.get_many(
+                [texts[index] for index in pending],
+                model=self._model,
+                prompt_version=PROMPT_VERSION,
+                target_language=target_language,
+            )
+            for index, hit in zip(pending, remembered, strict=True):
+                if hit is not None:
+                    results[index] = remembered_result(hit)
+            pending = [index for index in pending if results[index] is None]
+        for group in pack_batches(pending, texts, max_items=self._batch_size, max_tokens=self._batch_max_tokens):
+            if len(group) == 1:
+                index = group[0]
+                results[index] = self.translate(
+                    texts[index], source_language=languages[index], target_language=target_language
+                )
+                continue
+            translated, error = self._translate_group(group, texts, languages, target_language)
+            if error is not None and not translated:
+                # 请求本身已按重试策略失败，逐条重试只会放大失败，直接记为失败。
+                for index in group:
+                    results[index] = failed_result(error)
+                continue
+            missing = [index for index in group if index not in translated]
+            if missing:
+                LOGGER.info("DeepSeek 批量结果缺少 %d/%d 条，逐条补译", len(missing), len(group))
+            now = datetime.now(UTC)
+            for index in group:
+                if index in translated:
+                    self._remember(texts[index], translated[index], target_language)
+                    results[index] = TranslationResult(
+                        status="success",
+                        translated_text=translated[index],
+                        translator="deepseek",
+                        translated_at=now,
+                    )
+                else:
+                    results[index] = self.translate(
+                        texts[index], source_language=languages[index], target_language=target_language
+                    )
+        return [result for result in results if result is not None]
+
+    def _remember(self, text: str, translated: str, target_language: str) -> None:
+        if self._memory is not None:
+            self._memory.put(
+                text, translated, model=self._model, prompt_version=PROMPT_VERSION, target_language=target_language
+            )
+
+    def _translate_group(
+        self,
+        group: list[int],
+        texts: Sequence[str],
+        languages: Sequence[str | None],
+        target_language: str,
+    ) -> tuple[dict[int, str], str | None]:
+        items = [(index, texts[index], languages[index]) for index in group]
+        payload = build_batch_payload(self._model, items, target_language)
+        data, error = self._post(payload)
+        if data is None:
+            return {}, error or "empty response"
+        return parse_batch_translations(message_content(data), expected_ids=group), None
+
+    def _post(self, payload: dict[str, Any]) -> tuple[dict[str, Any] | None, str | None]:
         headers = {
             "Authorization": f"Bearer {self._api_key}",
             "Content-Type": "application/json",
         }
-        data: dict[str, object] | None = None
         last_error: str | None = None
         for attempt in range(1, self._max_retries + 1):
             try:
-                response = self._client.post(DEEPSEEK_API_URL, headers=headers, json=payload)
+                response = self._client.post(self._api_url, headers=headers, json=payload)
                 response.raise_for_status()
-                data = response.json()
-                break
+                return response.json(), None
             except httpx.HTTPError as exc:
                 last_error = str(exc)
                 if attempt == self._max_retries:
                     LOGGER.warning("DeepSeek 请求失败（已达上限）: %s", exc)
-                    return TranslationResult(
-                        status="failed",
-                        translated_text=None,
-                        translator="deepseek",
-                        translated_at=datetime.now(timezone.utc),
-                        error=str(exc),
-                    )
+                    break
                 delay = min(self._backoff_seconds * (2 ** (attempt - 1)), 10.0)
                 time.sleep(delay)
-        if data is None:
-            return TranslationResult(
-                status="failed",
-                translated_text=None,
-                translator="deepseek",
-                translated_at=datetime.now(timezone.utc),
-                error=last_error or "empty response",
-            )
+        return None, last_error
 
-        message = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-            .strip()
-        )
-        if not message:
-            LOGGER.error("DeepSeek 返回空内容: %s", data)
-            return TranslationResult(
-                status="failed",
-                translated_text=None,
-                translator="deepseek",
-                translated_at=datetime.now(timezone.utc),
-                error="empty response",
-            )
 
-        return TranslationResult(
-            status="success",
-            translated_text=message,
-            translator="deepseek",
-            translated_at=datetime.now(timezone.utc),
-        )
+def build_translation_payload(
+    model: str, text: str, source_language: str | None, target_language: str
+) -> dict[str, Any]:
+    return {
+        "model": model,
+        "temperature": 0.2,
+        "messages": [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Source language: {source_language or 'unknown'}\n"
+                    f"Target language: {target_language}\n"
+                    "Translate the following abstract:\n"
+                    f"{text}"
+                ),
+            },
+        ],
+    }
+
+
+def build_batch_payload(
+    model: str, items: Sequence[tuple[int, str, str | None]], target_language: str
+) -> dict[str, Any]:
+    """items 为 (id, 原文, 源语言)；要求模型按 id 返回 JSON。"""
+    entries = [{"id": item_id, "source_language": language or "unknown", "text": text} for item_id, text, language in items]
+    return {
+        "model": model,
+        "temperature": 0.2,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Target language: {target_language}\n" + json.dumps(entries, ensure_ascii=False)},
+        ],
+    }
+
+
+def parse_batch_translations(content: str, *, expected_ids: Sequence[int]) -> dict[int, str]:
+    """解析批量翻译的 JSON 回复，只保留 id 在 expected_ids 中且译文非空的条目。"""
+    text = content.strip()
+    if text.startswith("```"):
+        # 兼容模型把 JSON 包在代码块里的情况。
+        text = text.strip("`")
+        text = text[text.find("\n") + 1 :] if "\n" in text else ""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return {}
+    entries = data.get("translations") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+    wanted = set(expected_ids)
+    parsed: dict[int, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        raw_id, value = entry.get("id"), entry.get("text")
+        try:
+            entry_id = int(raw_id)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+        if entry_id in wanted and entry_id not in parsed and isinstance(value, str) and value.strip():
+            parsed[entry_id] = value.strip()
+    return parsed
+
+
+def estimate_tokens(text: str) -> int:
+    """粗略估算 token 数：CJK 字符按 1 个，其余按 4 个字符 1 个。"""
+    cjk = sum(1 for char in text if "\u3400" <= char <= "\u9fff")
+    return cjk + (len(text) - cjk) // 4 + 1
+
+
+def pack_batches(indices: list[int], texts: Sequence[str], *, max_items: int, max_tokens: int) -> list[list[int]]:
+    # 译文长度与原文相当，请求与回复都要装进预算，超长的单篇自成一组。
+    groups: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for index in indices:
+        tokens = estimate_tokens(texts[index])
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def message_content(data: dict[str, Any]) -> str:
+    choices = data.get("choices") or [{}]
+    return str(choices[0].get("message", {}).get("content", "") or "").strip()
+
+
+def remembered_result(translated_text: str) -> TranslationResult:
+    return TranslationResult(
+        status="success",
+        translated_text=translated_text,
+        translator="deepseek",
+        translated_at=datetime.now(UTC),
+    )
+
+
+def failed_result(error: str) -> TranslationResult:
+    return TranslationResult(
+        status="failed",
+        translated_text=None,
+        translator="deepseek",
+        translated_at=datetime.now(UTC),
+        error=error,
+    )
+
+
+def deepseek_api_url() -> str:
+    """DEEPSEEK_API_URL 可指向兼容接口（如本地模拟服务），未设置时使用官方地址。"""
+    return os.getenv("DEEPSEEK_API_URL") or DEEPSEEK_API_URL
+
+
+def _int_from_env(env_key: str, default: int) -> int:
+    raw = os.getenv(env_key)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return default
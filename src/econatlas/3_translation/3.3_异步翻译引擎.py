@@ -0,0 +1,426 @@
+# ruff: noqa: N999
+"""
+异步翻译引擎：基于 httpx.AsyncClient 同时保持多个 DeepSeek 请求在途。
+请求数/每分钟与 token/每分钟由令牌桶限速；遇到 429/5xx 时按 Retry-After 暂停并降低速率，成功后逐步恢复。
+引擎在后台线程运行自己的事件循环，同步代码可直接调用 translate/translate_batch 或 submit 拿到 Future。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from concurrent.futures import Future
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Self, TypeVar
+
+import httpx
+
+from econatlas._loader import load_local_module
+
+_base = load_local_module(__file__, "3.1_翻译基础.py", "econatlas._trans_base")
+TranslationResult = _base.TranslationResult  # type: ignore[attr-defined]
+
+_deepseek = load_local_module(__file__, "3.2_DeepSeek_翻译.py", "econatlas._deepseek")
+deepseek_api_url = _deepseek.deepseek_api_url  # type: ignore[attr-defined]
+DEFAULT_BATCH_SIZE = _deepseek.DEFAULT_BATCH_SIZE  # type: ignore[attr-defined]
+DEFAULT_BATCH_MAX_TOKENS = _deepseek.DEFAULT_BATCH_MAX_TOKENS  # type: ignore[attr-defined]
+PROMPT_VERSION = _deepseek.PROMPT_VERSION  # type: ignore[attr-defined]
+build_translation_payload = _deepseek.build_translation_payload  # type: ignore[attr-defined]
+build_batch_payload = _deepseek.build_batch_payload  # type: ignore[attr-defined]
+parse_batch_translations = _deepseek.parse_batch_translations  # type: ignore[attr-defined]
+pack_batches = _deepseek.pack_batches  # type: ignore[attr-defined]
+estimate_tokens = _deepseek.estimate_tokens  # type: ignore[attr-defined]
+message_content = _deepseek.message_content  # type: ignore[attr-defined]
+failed_result = _deepseek.failed_result  # type: ignore[attr-defined]
+remembered_result = _deepseek.remembered_result  # type: ignore[attr-defined]
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 4
+# 与旧版每次请求前固定等待 0.5 秒相当。
+DEFAULT_REQUESTS_PER_MINUTE = 120
+_MIN_RATE_SCALE = 0.1
+_RECOVER_STEP = 0.05
+_MAX_BACKOFF_SECONDS = 60.0
+
+_T = TypeVar("_T")
+
+
+class AdaptiveRateLimiter:
+    """
+    请求数与 token 两个令牌桶；tokens_per_minute 为 None 时不限 token。
+    backoff() 把速率减半（不低于 10%）并暂停指定秒数，recover() 每次成功回升 5%。
+    只在引擎的事件循环线程中使用，无需加锁。
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._request_rate = requests_per_minute / 60.0
+        self._token_rate = tokens_per_minute / 60.0 if tokens_per_minute else None
+        self._clock = clock
+        self._sleep = sleep
+        self._scale = 1.0
+        self._request_capacity = max(1.0, self._request_rate)
+        self._token_capacity = max(1.0, self._token_rate) if self._token_rate else 0.0
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self.backoffs = 0
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    async def acquire(self, tokens: int = 0) -> None:
+        while True:
+            now = self._clock()
+            if now < self._paused_until:
+                await self._sleep(self._paused_until - now)
+                continue
+            self._refill(now)
+            # 超过桶容量的大请求在桶满时放行（余额记为负数），避免永远等不到。
+            needed = min(float(tokens), self._token_capacity) if self._token_rate else 0.0
+            if self._requests >= 1.0 and (not self._token_rate or self._tokens >= needed):
+                self._requests -= 1.0
+                if self._token_rate:
+                    self._tokens -= tokens
+                return
+            wait = (1.0 - self._requests) / (self._request_rate * self._scale) if self._requests < 1.0 else 0.0
+            if self._token_rate and self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) / (self._token_rate * self._scale))
+            await self._sleep(max(wait, 0.001))
+
+    def backoff(self, retry_after: float | None) -> None:
+        self.backoffs += 1
+        self._scale = max(_MIN_RATE_SCALE, self._scale / 2)
+        pause = retry_after if retry_after is not None else 1.0 / (self._request_rate * self._scale)
+        self._paused_until = max(self._paused_until, self._clock() + min(pause, _MAX_BACKOFF_SECONDS))
+        self._requests = min(self._requests, 0.0)
+
+    def recover(self) -> None:
+        self._scale = min(1.0, self._scale + _RECOVER_STEP)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._requests = min(self._request_capacity, self._requests + elapsed * self._request_rate * self._scale)
+        if self._token_rate:
+            self._tokens = min(self._token_capacity, self._tokens + elapsed * self._token_rate * self._scale)
+
+
+class AsyncTranslationEngine:
+    """
+    DeepSeek 翻译引擎，接口与 DeepSeekTranslator 相同（translate / translate_batch），可直接替换。
+    max_in_flight 为同时在途的请求上限；自带限速，调用方无需再按固定间隔等待。
+    """
+
+    rate_limited = True
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        model: str = "deepseek-chat",
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff_seconds: float = 1.0,
+        max_in_flight: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        batch_size: int | None = None,
+        batch_max_tokens: int | None = None,
+        api_url: str | None = None,
+        client_factory: Callable[[], httpx.AsyncClient] | None = None,
+        memory: Any | None = None,
+    ) -> None:
+        self._api_key = api_key
+        self._model = model
+        self._max_retries = max(1, max_retries)
+        self._backoff_seconds = backoff_seconds
+        self._max_in_flight = max_in_flight or _int_from_env("TRANSLATION_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)
+        self._requests_per_minute = requests_per_minute or _float_from_env(
+            "TRANSLATION_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE
+        )
+        self._tokens_per_minute = tokens_per_minute or _float_from_env("TRANSLATION_TOKENS_PER_MINUTE", 0.0) or None
+        self._batch_size = batch_size or _int_from_env("TRANSLATION_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        self._batch_max_tokens = batch_max_tokens or _int_from_env("TRANSLATION_BATCH_MAX_TOKENS", DEFAULT_BATCH_MAX_TOKENS)
+        self._api_url = api_url or deepseek_api_url()
+        self._timeout = timeout
+        self._client_factory = client_factory
+        self._memory = memory
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._limiter: AdaptiveRateLimiter | None = None
+        self._closed = False
+        self.requests = 0
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def translate(self, text: str, *, source_language: str | None = None, target_language: str = "zh") -> TranslationResult:
+        return self.submit(text, source_language=source_language, target_language=target_language).result()
+
+    def translate_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        source_languages: Sequence[str | None] | None = None,
+        target_language: str = "zh",
+    ) -> list[TranslationResult]:
+        languages = list(source_languages) if source_languages is not None else [None] * len(texts)
+        return self._run(self._translate_batch(list(texts), languages, target_language)).result()
+
+    def submit(
+        self, text: str, *, source_language: str | None = None, target_language: str = "zh"
+    ) -> Future[TranslationResult]:
+        """提交一条翻译并立即返回 Future，不阻塞调用线程。"""
+        return self._run(self._translate_one(text, source_language, target_language))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        if self._limiter is not None:
+            LOGGER.info("翻译引擎：%d 次请求，限流退避 %d 次", self.requests, self._limiter.backoffs)
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+        except Exception:
+            LOGGER.debug("关闭翻译引擎失败", exc_info=True)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> Future[_T]:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("翻译引擎已关闭")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="translation-engine", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _ensure_session(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore, AdaptiveRateLimiter]:
+        # 只在事件循环线程中调用，首次使用时创建客户端与限速器。
+        if self._client is None or self._slots is None or self._limiter is None:
+            self._client = (
+                self._client_factory()
+                if self._client_factory is not None
+                else httpx.AsyncClient(
+                    timeout=self._timeout,
+                    limits=httpx.Limits(max_connections=self._max_in_flight, max_keepalive_connections=self._max_in_flight),
+                )
+            )
+            self._slots = asyncio.Semaphore(self._max_in_flight)
+            self._limiter = AdaptiveRateLimiter(self._requests_per_minute, self._tokens_per_minute)
+        return self._client, self._slots, self._limiter
+
+    async def _shutdown(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def _translate_one(
+        self, text: str, source_language: str | None, target_language: str, *, consult_memory: bool = True
+    ) -> TranslationResult:
+        if not text.strip():
+            return TranslationResult(
+                status="skipped",
+                translated_text="",
+                translator="deepseek",
+                translated_at=datetime.now(UTC),
+            )
+        if consult_memory and self._memory is not None:
+            remembered = self._memory.get(
+                text, model=self._model, prompt_version=PROMPT_VERSION, target_language=target_language
+            )
+            if remembered is not None:
+                return remembered_result(remembered)
+        payload = build_translation_payload(self._model, text, source_language, target_language)
+        data, error = await self._post(payload, tokens=estimate_tokens(text) * 2)
+        if data is None:
+            return failed_result(error or "empty response")
+        message = message_content(data)
+        if not message:
+            LOGGER.error("DeepSeek 返回空内容: %s", data)
+            return failed_result("empty response")
+        self._remember(text, message, target_language)
+        return TranslationResult(
+            status="success",
+            translated_text=message,
+            translator="deepseek",
+            translated_at=datetime.now(UTC),
+        )
+
+    async def _translate_batch(
+        self, texts: list[str], languages: list[str | None], target_language: str
+    ) -> list[TranslationResult]:
+        pending = [index for index, text in enumerate(texts) if text.strip()]
+        results: dict[int, TranslationResult] = {}
+        if self._memory is not None and pending:
+            remembered = self._memory.get_many(
+                [texts[index] for index in pending],
+                model=self._model,
+                prompt_version=PROMPT_VERSION,
+                target_language=target_language,
+            )
+            for index, hit in zip(pending, remembered, strict=True):
+                if hit is not None:
+                    results[index] = remembered_result(hit)
+            pending = [index for index in pending if index not in results]
+        groups = pack_batches(pending, texts, max_items=self._batch_size, max_tokens=self._batch_max_tokens)
+
+        async def _group(group: list[int]) -> None:
+            if len(group) == 1:
+                index = group[0]
+                results[index] = await self._translate_one(
+                    texts[index], languages[index], target_language, consult_memory=False
+                )
+                return
+            payload = build_batch_payload(
+                self._model, [(index, texts[index], languages[index]) for index in group], target_language
+            )
+            data, error = await self._post(payload, tokens=sum(estimate_tokens(texts[index]) for index in group) * 2)
+            if data is None:
+                for index in group:
+                    results[index] = failed_result(error or "empty response")
+                return
+            translated = parse_batch_translations(message_content(data), expected_ids=group)
+            now = datetime.now(UTC)
+            missing = [index for index in group if index not in translated]
+            if missing:
+                LOGGER.info("DeepSeek 批量结果缺少 %d/%d 条，逐条补译", len(missing), len(group))
+            for index in group:
+                if index in translated:
+                    self._remember(texts[index], translated[index], target_language)
+                    results[index] = TranslationResult(
+                        status="success", translated_text=translated[index], translator="deepseek", translated_at=now
+                    )
+            fallbacks = await asyncio.gather(
+                *(
+                    self._translate_one(texts[index], languages[index], target_language, consult_memory=False)
+                    for index in missing
+                )
+            )
+            results.update(zip(missing, fallbacks))
+
+        await asyncio.gather(*(_group(group) for group in groups))
+        for index, text in enumerate(texts):
+            if index not in results:
+                results[index] = await self._translate_one(text, languages[index], target_language)
+        return [results[index] for index in range(len(texts))]
+
+    def _remember(self, text: str, translated: str, target_language: str) -> None:
+        if self._memory is not None:
+            self._memory.put(
+                text, translated, model=self._model, prompt_version=PROMPT_VERSION, target_language=target_language
+            )
+
+    async def _post(self, payload: dict[str, Any], *, tokens: int) -> tuple[dict[str, Any] | None, str | None]:
+        client, slots, limiter = self._ensure_session()
+        headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+        last_error: str | None = None
+        for attempt in range(1, self._max_retries + 1):
+            await limiter.acquire(tokens)
+            async with slots:
+                self.requests += 1
+                try:
+                    response = await client.post(self._api_url, headers=headers, json=payload)
+                except httpx.HTTPError as exc:
+                    response = None
+                    last_error = str(exc)
+            if response is not None:
+                if response.status_code == 429 or response.status_code >= 500:
+                    last_error = f"HTTP {response.status_code}"
+                    limiter.backoff(_retry_after_seconds(response.headers.get("Retry-After")))
+                    LOGGER.debug("DeepSeek %s，降速至 %.0f%%", last_error, limiter.scale * 100)
+                    continue
+                if response.status_code >= 400:
+                    # 其余 4xx（鉴权、参数错误）重试无意义。
+                    LOGGER.warning("DeepSeek 请求失败: HTTP %s", response.status_code)
+                    return None, f"HTTP {response.status_code}"
+                limiter.recover()
+                try:
+                    return response.json(), None
+                except ValueError as exc:
+                    last_error = str(exc)
+            if attempt < self._max_retries:
+                await asyncio.sleep(min(self._backoff_seconds * (2 ** (attempt - 1)), 10.0))
+        LOGGER.warning("DeepSeek 请求失败（已达上限）: %s", last_error)
+        return None, last_error
+
+
+def _retry_after_seconds(raw: str | None) -> float | None:
+    """Retry-After 可以是秒数或 HTTP 日期。"""
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _int_from_env(env_key: str, default: int) -> int:
+    raw = os.getenv(env_key)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+        return value if value > 0 else default
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return default
+
+
+def _float_from_env(env_key: str, default: float) -> float:
+    raw = os.getenv(env_key)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+        return value if value > 0 else default
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return default
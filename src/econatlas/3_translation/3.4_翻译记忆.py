@@ -0,0 +1,188 @@
+# ruff: noqa: N999
+"""
+翻译记忆：按「规范化原文 + 模型 + 提示词版本 + 目标语言」的哈希缓存译文（SQLite，默认 .cache/translation_memory.sqlite3）。
+重复抓取、工作论文转正式发表、API 重新拉取摘要时直接命中，不再调用翻译接口。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_PATH = Path(".cache/translation_memory.sqlite3")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_memory_last_used ON memory(last_used_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationMemoryStats:
+    entries: int
+    hits: int
+    misses: int
+    stored_hits: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TranslationMemory:
+    """线程安全；hits/misses 为本进程内的统计，stored_hits 为库中累计命中次数。"""
+
+    def __init__(self, db_path: Path = DEFAULT_MEMORY_PATH) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def get(self, text: str, *, model: str, prompt_version: str, target_language: str = "zh") -> str | None:
+        return self.get_many([text], model=model, prompt_version=prompt_version, target_language=target_language)[0]
+
+    def get_many(
+        self,
+        texts: Sequence[str],
+        *,
+        model: str,
+        prompt_version: str,
+        target_language: str = "zh",
+    ) -> list[str | None]:
+        keys = [memory_key(text, model=model, prompt_version=prompt_version, target_language=target_language) for text in texts]
+        now = time.time()
+        with self._lock:
+            found: dict[str, str] = {}
+            for key in set(keys):
+                row = self._conn.execute("SELECT translated_text FROM memory WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    found[key] = row[0]
+            if found:
+                self._conn.executemany(
+                    "UPDATE memory SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+            results = [found.get(key) for key in keys]
+            self.hits += sum(1 for result in results if result is not None)
+            self.misses += sum(1 for result in results if result is None)
+        return results
+
+    def put(
+        self,
+        text: str,
+        translated_text: str,
+        *,
+        model: str,
+        prompt_version: str,
+        target_language: str = "zh",
+    ) -> None:
+        key = memory_key(text, model=model, prompt_version=prompt_version, target_language=target_language)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO memory(key, model, prompt_version, target_language, source_text, translated_text, "
+                "created_at, last_used_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET translated_text = excluded.translated_text, "
+                "last_used_at = excluded.last_used_at",
+                (key, model, prompt_version, target_language, text, translated_text, now, now),
+            )
+
+    def stats(self) -> TranslationMemoryStats:
+        with self._lock:
+            entries, stored_hits = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM memory").fetchone()
+            return TranslationMemoryStats(entries=entries, hits=self.hits, misses=self.misses, stored_hits=stored_hits)
+
+    def evict(self, *, older_than_days: float | None = None, max_entries: int | None = None) -> int:
+        """删除超过 older_than_days 未使用的条目，并按最久未用裁剪到 max_entries 条；返回删除数。"""
+        removed = 0
+        with self._lock:
+            if older_than_days is not None:
+                cutoff = time.time() - older_than_days * 86400
+                removed += self._conn.execute("DELETE FROM memory WHERE last_used_at < ?", (cutoff,)).rowcount
+            if max_entries is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM memory WHERE key IN ("
+                    "SELECT key FROM memory ORDER BY last_used_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                    (max(0, max_entries),),
+                ).rowcount
+            if removed:
+                self._conn.execute("VACUUM")
+        return removed
+
+    def export(self, output: Path) -> int:
+        """导出为 JSONL（每行一条），返回条数。"""
+        count = 0
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, model, prompt_version, target_language, source_text, translated_text, hits, last_used_at "
+                "FROM memory ORDER BY created_at"
+            ).fetchall()
+        with output.open("w", encoding="utf-8") as handle:
+            for key, model, prompt_version, target, source, translated, hits, last_used in rows:
+                handle.write(
+                    json.dumps(
+                        {
+                            "key": key,
+                            "model": model,
+                            "prompt_version": prompt_version,
+                            "target_language": target,
+                            "source_text": source,
+                            "translated_text": translated,
+                            "hits": hits,
+                            "last_used_at": last_used,
+                        },
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+                count += 1
+        return count
+
+    def close(self) -> None:
+        stats = self.stats()
+        if stats.hits or stats.misses:
+            LOGGER.info("翻译记忆：命中 %d，未命中 %d（%.0f%%）", stats.hits, stats.misses, stats.hit_rate * 100)
+        with self._lock:
+            self._conn.close()
+
+
+def normalize_source_text(text: str) -> str:
+    """NFKC 归一化并折叠空白，使排版差异不影响命中。"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def memory_key(text: str, *, model: str, prompt_version: str, target_language: str = "zh") -> str:
+    payload = "\0".join((normalize_source_text(text), model, prompt_version, target_language))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
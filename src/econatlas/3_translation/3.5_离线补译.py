@@ -0,0 +1,185 @@
+# ruff: noqa: N999
+"""
+离线补译：扫描已存档案中 translation.status 为 failed/skipped 且摘要非中文的条目，并发翻译后分批写回。
+不访问 feed 与浏览器，可与抓取同时运行（写回走存储的合并逻辑：JSON 后端有 WAL 文件锁，SQLite 为事务 upsert）。
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from econatlas._loader import load_local_module
+from econatlas.models import ArticleRecord, JournalSource, TranslationRecord
+
+_base = load_local_module(__file__, "3.1_翻译基础.py", "econatlas._trans_base")
+TranslationResult = _base.TranslationResult  # type: ignore[attr-defined]
+detect_language = _base.detect_language  # type: ignore[attr-defined]
+translate_texts = _base.translate_texts  # type: ignore[attr-defined]
+
+_deepseek = load_local_module(__file__, "3.2_DeepSeek_翻译.py", "econatlas._deepseek")
+estimate_tokens = _deepseek.estimate_tokens  # type: ignore[attr-defined]
+
+LOGGER = logging.getLogger(__name__)
+
+BACKFILL_STATUSES = frozenset({"failed", "skipped"})
+DEFAULT_BACKFILL_BATCH = 16
+
+
+@dataclass
+class BackfillReport:
+    scanned: int = 0
+    candidates: int = 0
+    translated: int = 0
+    failed: int = 0
+    budget_exhausted: bool = False
+    journals: dict[str, int] = field(default_factory=dict)
+
+
+def needs_backfill(record: ArticleRecord) -> bool:
+    """failed/skipped 且有非中文原文摘要的条目需要补译。"""
+    if record.translation.status not in BACKFILL_STATUSES:
+        return False
+    summary = (record.abstract_original or "").strip()
+    if not summary:
+        return False
+    # 无法识别语言（纯数字符号、langdetect 失败）时按非中文处理，交给翻译接口。
+    language = record.abstract_language or detect_language(summary)
+    return not (language or "").startswith("zh")
+
+
+def find_backfill_candidates(
+    store: Any,
+    journals: Iterable[JournalSource],
+    *,
+    since: datetime | None = None,
+    done: Any | None = None,
+) -> tuple[list[tuple[JournalSource, ArticleRecord]], int]:
+    """
+    返回 (待补译条目, 扫描条目数)。since 按发表时间（缺失时用抓取时间）过滤；
+    done 为 ProgressJournal，已尝试过的条目跳过以便断点续跑。
+    """
+    candidates: list[tuple[JournalSource, ArticleRecord]] = []
+    scanned = 0
+    for journal in journals:
+        entries = store.compact(journal)
+        finished = done.entries_for(journal.slug) if done is not None else set()
+        for record in entries.values():
+            scanned += 1
+            if record.id in finished or not needs_backfill(record):
+                continue
+            if since is not None and _utc(record.published_at or record.fetched_at) < _utc(since):
+                continue
+            candidates.append((journal, record))
+    return candidates, scanned
+
+
+def run_backfill(
+    store: Any,
+    journals: Sequence[JournalSource],
+    translator: Any,
+    *,
+    since: datetime | None = None,
+    limit: int | None = None,
+    token_budget: int | None = None,
+    batch_size: int = DEFAULT_BACKFILL_BATCH,
+    progress: Any | None = None,
+) -> BackfillReport:
+    """
+    按期刊把候选条目切成 batch_size 一组并发翻译（并发数取 translator.max_in_flight，缺省为 1），
+    每组完成即写回存储并记录进度。token_budget 为原文估算 token 上限，用尽后不再提交新组。
+    """
+    candidates, scanned = find_backfill_candidates(store, journals, since=since, done=progress)
+    if limit:
+        candidates = candidates[:limit]
+    report = BackfillReport(scanned=scanned, candidates=len(candidates))
+
+    groups: list[tuple[JournalSource, list[ArticleRecord]]] = []
+    spent = 0
+    by_journal: dict[str, tuple[JournalSource, list[ArticleRecord]]] = {}
+    for journal, record in candidates:
+        cost = estimate_tokens(record.abstract_original or "")
+        if token_budget is not None and spent + cost > token_budget:
+            report.budget_exhausted = True
+            break
+        spent += cost
+        by_journal.setdefault(journal.slug, (journal, []))[1].append(record)
+    for journal, records in by_journal.values():
+        for start in range(0, len(records), max(1, batch_size)):
+            groups.append((journal, records[start : start + max(1, batch_size)]))
+
+    workers = max(1, int(getattr(translator, "max_in_flight", 1) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as executor:
+        in_flight: dict[Future[list[TranslationResult]], tuple[JournalSource, list[ArticleRecord]]] = {}
+        queue = iter(groups)
+
+        def _submit_next() -> bool:
+            group = next(queue, None)
+            if group is None:
+                return False
+            _, records = group
+            future = executor.submit(
+                translate_texts,
+                translator,
+                [record.abstract_original or "" for record in records],
+                source_languages=[record.abstract_language for record in records],
+            )
+            in_flight[future] = group
+            return True
+
+        while len(in_flight) < workers and _submit_next():
+            pass
+        while in_flight:
+            completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in completed:
+                journal, records = in_flight.pop(future)
+                # 写回只在调用线程进行，存储无需额外加锁。
+                _write_back(store, journal, records, future.result(), report, progress)
+                _submit_next()
+    if progress is not None:
+        progress.compact()
+    return report
+
+
+def apply_translation(record: ArticleRecord, result: TranslationResult) -> ArticleRecord:
+    return record.model_copy(
+        update={
+            "abstract_zh": result.translated_text or record.abstract_zh,
+            "translation": TranslationRecord(
+                status=result.status,
+                translator=result.translator,
+                translated_at=result.translated_at,
+                error=result.error,
+            ),
+        }
+    )
+
+
+def _write_back(
+    store: Any,
+    journal: JournalSource,
+    records: list[ArticleRecord],
+    results: list[TranslationResult],
+    report: BackfillReport,
+    progress: Any | None,
+) -> None:
+    updated = [apply_translation(record, result) for record, result in zip(records, results, strict=True)]
+    succeeded = sum(1 for result in results if result.status == "success")
+    if succeeded:
+        # 失败结果不写回，保持原状态，避免覆盖抓取期间写入的更新。
+        store.persist(journal, [record for record, result in zip(updated, results) if result.status == "success"])
+    report.translated += succeeded
+    report.failed += len(results) - succeeded
+    report.journals[journal.slug] = report.journals.get(journal.slug, 0) + succeeded
+    if progress is not None:
+        for record in records:
+            progress.mark(journal.slug, record.id)
+    LOGGER.info("补译 %s：成功 %d/%d", journal.slug, succeeded, len(records))
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
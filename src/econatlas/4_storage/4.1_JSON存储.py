@@ -1,5 +1,7 @@
 """
 JSON 存储：按期刊归档文章记录，负责合并与写盘。
+逐条写入先追加到 data/<slug>.wal（JSONL），压实时再折叠进 data/<slug>.json 并删除 WAL。
+跨进程互斥锁放在 data 同级的 .cache/locks/<slug>.lock，data/ 中不留空文件。
 """
 
 from __future__ import annotations
@@ -7,14 +9,32 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from types import TracebackType
+from typing import Self
 
-from econatlas.models import ArticleRecord, JournalArchive, JournalMetadata, JournalSource, TranslationRecord
+from econatlas.models import (
+    ArticleRecord,
+    JournalArchive,
+    JournalMetadata,
+    JournalSource,
+    TranslationRecord,
+)
+
+try:  # pragma: no cover - Windows 无 fcntl，退化为进程内无锁
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
 
 LOGGER = logging.getLogger(__name__)
+DEFAULT_FLUSH_RECORDS = 50
+DEFAULT_FLUSH_SECONDS = 30.0
+DEFAULT_WAL_MAX_BYTES = 4 * 1024 * 1024
 
 
 @dataclass
@@ -26,9 +46,10 @@ class StorageResult:
 class JournalStore:
     """管理按期刊存储的 JSON 档案。"""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, *, lock_dir: Path | None = None):
         self._output_dir = output_dir
         self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_dir = lock_dir or output_dir.parent / ".cache" / "locks"
 
     def archive_path(self, journal: JournalSource) -> Path:
         """返回期刊 JSON 档案路径（不保证存在）。"""
@@ -50,41 +71,76 @@ class JournalStore:
         )
         self._write_archive(journal, archive)
 
+    def wal_path(self, journal: JournalSource) -> Path:
+        """返回期刊 WAL（追加日志）路径（不保证存在）。"""
+        return self._path_for(journal).with_suffix(".wal")
+
+    def has_pending_wal(self, journal: JournalSource) -> bool:
+        """WAL 中是否存在尚未压实进 JSON 的记录。"""
+        path = self.wal_path(journal)
+        try:
+            return path.stat().st_size > 0
+        except FileNotFoundError:
+            return False
+
+    def load_payload(self, journal: JournalSource) -> object:
+        """
+        读取期刊档案的 JSON 结构（dict），未压实的 WAL 会被透明回放。
+        无 WAL 时直接返回原始 JSON，不做模型校验。
+        """
+        if self.has_pending_wal(journal):
+            return self._load_archive(journal).model_dump(mode="json")
+        return json.loads(self._path_for(journal).read_text(encoding="utf-8"))
+
     def persist(self, journal: JournalSource, entries: list[ArticleRecord]) -> StorageResult:
-        archive = self._load_archive(journal)
-        by_id: Dict[str, ArticleRecord] = {entry.id: entry for entry in archive.entries}
-        added = 0
-        updated = 0
-
-        for entry in entries:
-            existing = by_id.get(entry.id)
-            if existing is None:
-                by_id[entry.id] = entry
-                added += 1
-                continue
-            merged = _merge_entries(existing, entry)
-            if merged != existing:
-                by_id[entry.id] = merged
-                updated += 1
-
-        sorted_entries = sorted(
-            by_id.values(),
-            key=lambda e: (e.published_at or e.fetched_at),
-        )
-        archive.entries = sorted_entries
-        archive.journal = JournalMetadata(
-            name=journal.name,
-            rss_url=journal.rss_url,
-            notes=journal.notes,
-            last_run_at=datetime.now(timezone.utc),
+        with self._wal_lock(journal):
+            archive = self._load_archive(journal)
+            by_id: dict[str, ArticleRecord] = {entry.id: entry for entry in archive.entries}
+            result = _merge_into(by_id, entries)
+            self._write_entries(journal, by_id.values())
+            self._truncate_wal(journal)
+        return result
+
+    def replace_archive(self, journal: JournalSource, archive: JournalArchive) -> None:
+        """用给定档案整体覆盖 JSON（并清空 WAL），用于从其他后端导出。"""
+        with self._wal_lock(journal):
+            self._write_archive(journal, archive)
+            self._truncate_wal(journal)
+
+    def compact(self, journal: JournalSource) -> dict[str, ArticleRecord]:
+        """把 WAL 折叠进 JSON 档案并清空 WAL，返回压实后的全部条目。"""
+        with self._wal_lock(journal):
+            archive = self._load_archive(journal)
+            by_id = {entry.id: entry for entry in archive.entries}
+            if self.has_pending_wal(journal):
+                self._write_entries(journal, by_id.values())
+                self._truncate_wal(journal)
+        return by_id
+
+    def open_session(
+        self,
+        journal: JournalSource,
+        *,
+        flush_every: int | None = None,
+        flush_interval: float | None = None,
+    ) -> JournalWriteSession:
+        """
+        打开期刊的缓冲写入会话：整刊期间档案常驻内存，逐条追加 WAL，按条数/时间/WAL 大小压实。
+        未指定时读取 STORAGE_FLUSH_RECORDS / STORAGE_FLUSH_SECONDS / STORAGE_WAL_MAX_BYTES。
+        """
+        env_records, env_seconds, env_wal_bytes = _flush_policy_from_env()
+        return JournalWriteSession(
+            self,
+            journal,
+            flush_every=flush_every if flush_every is not None else env_records,
+            flush_interval=flush_interval if flush_interval is not None else env_seconds,
+            wal_max_bytes=env_wal_bytes,
         )
-        self._write_archive(journal, archive)
-        return StorageResult(added=added, updated=updated)
 
     def _load_archive(self, journal: JournalSource) -> JournalArchive:
         path = self._path_for(journal)
         if not path.exists():
-            return JournalArchive(
+            empty = JournalArchive(
                 journal=JournalMetadata(
                     name=journal.name,
                     rss_url=journal.rss_url,
@@ -93,19 +149,92 @@ class JournalStore:
                 ),
                 entries=[],
             )
+            return self._replay_wal(journal, empty)
         try:
             data = json.loads(path.read_text(encoding="utf-8"))
-            return JournalArchive.model_validate(data)
+            archive = JournalArchive.model_validate(data)
         except Exception as exc:  # noqa: BLE001
             LOGGER.error("读取 %s 失败: %s", path, exc)
             raise
+        return self._replay_wal(journal, archive)
+
+    def _replay_wal(self, journal: JournalSource, archive: JournalArchive) -> JournalArchive:
+        wal_path = self.wal_path(journal)
+        if not self.has_pending_wal(journal):
+            return archive
+        by_id: dict[str, ArticleRecord] = {entry.id: entry for entry in archive.entries}
+        replayed = 0
+        with wal_path.open("r", encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, start=1):
+                text = line.strip()
+                if not text:
+                    continue
+                try:
+                    record = ArticleRecord.model_validate_json(text)
+                except Exception:  # noqa: BLE001
+                    # 崩溃时最后一行可能只写了一半，跳过即可。
+                    LOGGER.warning("跳过损坏的 WAL 行 %s:%d", wal_path, line_no)
+                    continue
+                _merge_into(by_id, [record])
+                replayed += 1
+        LOGGER.debug("回放 %s：%d 条", wal_path, replayed)
+        archive.entries = sorted(by_id.values(), key=lambda e: (e.published_at or e.fetched_at))
+        return archive
+
+    def _append_wal(self, journal: JournalSource, entries: Iterable[ArticleRecord]) -> int:
+        """追加记录到 WAL 并 fsync，返回追加后的 WAL 字节数。"""
+        lines = "".join(entry.model_dump_json() + "\n" for entry in entries)
+        path = self.wal_path(journal)
+        with self._wal_lock(journal):
+            if not lines:
+                return path.stat().st_size if path.exists() else 0
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(lines)
+                handle.flush()
+                os.fsync(handle.fileno())
+                return handle.tell()
+
+    def _truncate_wal(self, journal: JournalSource) -> None:
+        # 调用方已持有旁路锁，WAL 只在锁内打开，可直接删除。
+        self.wal_path(journal).unlink(missing_ok=True)
+
+    @contextmanager
+    def _wal_lock(self, journal: JournalSource) -> Iterator[None]:
+        """以 .cache/locks 下的旁路锁文件串行化跨进程的追加与压实。"""
+        if fcntl is None:
+            yield
+            return
+        self._lock_dir.mkdir(parents=True, exist_ok=True)
+        path = self._lock_dir / self._path_for(journal).with_suffix(".lock").name
+        with path.open("a", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _write_entries(self, journal: JournalSource, entries: Iterable[ArticleRecord]) -> None:
+        archive = JournalArchive(
+            journal=JournalMetadata(
+                name=journal.name,
+                rss_url=journal.rss_url,
+                notes=journal.notes,
+                last_run_at=datetime.now(timezone.utc),
+            ),
+            entries=sorted(entries, key=lambda e: (e.published_at or e.fetched_at)),
+        )
+        self._write_archive(journal, archive)
 
     def _write_archive(self, journal: JournalSource, archive: JournalArchive) -> None:
         path = self._path_for(journal)
         payload = archive.model_dump(mode="json")
         payload_str = json.dumps(payload, ensure_ascii=False, indent=2)
         tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(payload_str, encoding="utf-8")
+        # 先落盘临时文件再原子替换，进程中途退出也不会留下半截 JSON。
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(payload_str)
+            handle.flush()
+            os.fsync(handle.fileno())
         os.replace(tmp_path, path)
 
     def _path_for(self, journal: JournalSource) -> Path:
@@ -115,6 +244,129 @@ class JournalStore:
         return self._output_dir / f"{journal.slug}.json"
 
 
+class JournalWriteSession:
+    """
+    单个期刊的缓冲写入会话：append 在内存中合并并追加到 WAL（O(1)），
+    flush 时把 WAL 压实进 JSON 档案。WAL 超过阈值、达到条数/时间阈值，
+    以及 close（或 with 块退出，包括异常/Ctrl-C）时都会压实。
+    """
+
+    def __init__(
+        self,
+        store: JournalStore,
+        journal: JournalSource,
+        *,
+        flush_every: int,
+        flush_interval: float,
+        wal_max_bytes: int = DEFAULT_WAL_MAX_BYTES,
+    ) -> None:
+        self._store = store
+        self._journal = journal
+        self._flush_every = max(1, flush_every)
+        self._flush_interval = max(0.0, flush_interval)
+        self._wal_max_bytes = max(1, wal_max_bytes)
+        archive = store._load_archive(journal)
+        self._by_id: dict[str, ArticleRecord] = {entry.id: entry for entry in archive.entries}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """尚未压实进 JSON 的变更条数。"""
+        return self._pending
+
+    def entry_ids(self) -> set[str]:
+        return set(self._by_id)
+
+    def append(self, entries: list[ArticleRecord]) -> StorageResult:
+        if self._closed:
+            raise RuntimeError("写入会话已关闭")
+        before = {entry.id: self._by_id.get(entry.id) for entry in entries}
+        result = _merge_into(self._by_id, entries)
+        changed = [self._by_id[entry_id] for entry_id, old in before.items() if self._by_id[entry_id] is not old]
+        if not changed:
+            return result
+        wal_size = self._store._append_wal(self._journal, changed)
+        self._pending += len(changed)
+        if (
+            wal_size >= self._wal_max_bytes
+            or self._pending >= self._flush_every
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+        return result
+
+    def flush(self) -> None:
+        if not self._pending and not self._store.has_pending_wal(self._journal):
+            return
+        # 压实时重新读取磁盘上的 JSON + WAL，以纳入其他进程追加的记录。
+        self._by_id = self._store.compact(self._journal)
+        LOGGER.debug("压实 %s：%d 条变更", self._journal.slug, self._pending)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _merge_into(by_id: dict[str, ArticleRecord], entries: Iterable[ArticleRecord]) -> StorageResult:
+    added = 0
+    updated = 0
+    for entry in entries:
+        existing = by_id.get(entry.id)
+        if existing is None:
+            by_id[entry.id] = entry
+            added += 1
+            continue
+        merged = _merge_entries(existing, entry)
+        if merged != existing:
+            by_id[entry.id] = merged
+            updated += 1
+    return StorageResult(added=added, updated=updated)
+
+
+def _flush_policy_from_env() -> tuple[int, float, int]:
+    records = DEFAULT_FLUSH_RECORDS
+    seconds = DEFAULT_FLUSH_SECONDS
+    wal_bytes = DEFAULT_WAL_MAX_BYTES
+    raw_records = os.getenv("STORAGE_FLUSH_RECORDS")
+    if raw_records:
+        try:
+            records = max(1, int(raw_records))
+        except ValueError:
+            LOGGER.warning("Invalid STORAGE_FLUSH_RECORDS value: %s", raw_records)
+    raw_seconds = os.getenv("STORAGE_FLUSH_SECONDS")
+    if raw_seconds:
+        try:
+            seconds = max(0.0, float(raw_seconds))
+        except ValueError:
+            LOGGER.warning("Invalid STORAGE_FLUSH_SECONDS value: %s", raw_seconds)
+    raw_wal_bytes = os.getenv("STORAGE_WAL_MAX_BYTES")
+    if raw_wal_bytes:
+        try:
+            wal_bytes = max(1, int(raw_wal_bytes))
+        except ValueError:
+            LOGGER.warning("Invalid STORAGE_WAL_MAX_BYTES value: %s", raw_wal_bytes)
+    return records, seconds, wal_bytes
+
+
 def _merge_entries(existing: ArticleRecord, new_entry: ArticleRecord) -> ArticleRecord:
     abstract_zh = existing.abstract_zh or new_entry.abstract_zh
     translation = _prefer_translation(existing.translation, new_entry.translation)
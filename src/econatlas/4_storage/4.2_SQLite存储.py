@@ -0,0 +1,313 @@
+# ruff: noqa: N999
+"""
+SQLite 存储：与 JournalStore 接口一致，按 (期刊 slug, 条目 id) upsert，支持按索引字段查询。
+data/*.json 仍由 export 生成，供查看器读取。
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from econatlas._loader import load_local_module
+from econatlas.models import (
+    ArticleRecord,
+    JournalArchive,
+    JournalMetadata,
+    JournalSource,
+    TranslationStatus,
+)
+
+_json_store = load_local_module(__file__, "4.1_JSON存储.py", "econatlas._storage_json")
+JournalStore = _json_store.JournalStore  # type: ignore[attr-defined]
+StorageResult = _json_store.StorageResult  # type: ignore[attr-defined]
+_merge_into = _json_store._merge_into  # type: ignore[attr-defined]
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS journals (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    rss_url TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    notes TEXT,
+    last_run_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    journal_slug TEXT NOT NULL,
+    id TEXT NOT NULL,
+    published_at TEXT,
+    translation_status TEXT NOT NULL,
+    abstract_language TEXT,
+    sort_key TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (journal_slug, id)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_translation_status ON articles (translation_status);
+CREATE INDEX IF NOT EXISTS idx_articles_abstract_language ON articles (abstract_language);
+"""
+
+
+class SqliteJournalStore:
+    """
+    管理 SQLite 中的期刊档案。整条记录以 JSON 无损保存在 record 列，
+    published_at（统一为 UTC）、translation.status、abstract_language 单独成列并建索引。
+    """
+
+    def __init__(self, db_path: Path, *, seed_store: JournalStore | None = None):
+        self._db_path = db_path
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 首次遇到某期刊时，从已有的 JSON 档案导入，避免切换后端后 export 覆盖历史数据。
+        self._seed_store = seed_store
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def ensure_archive(self, journal: JournalSource) -> None:
+        """保证期刊元数据存在；首次出现时从 JSON 档案导入已有条目。"""
+        if self.has_journal(journal):
+            return
+        entries: list[ArticleRecord] = []
+        if self._seed_store is not None:
+            json_path = self._seed_store.archive_path(journal)
+            if json_path.exists() or self._seed_store.has_pending_wal(journal):
+                entries = list(self._seed_store._load_archive(journal).entries)
+                LOGGER.info("从 %s 导入 %d 条到 SQLite", json_path, len(entries))
+        self.persist(journal, entries)
+
+    def has_journal(self, journal: JournalSource) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM journals WHERE slug = ?", (journal.slug,)).fetchone()
+        return row is not None
+
+    def has_pending_wal(self, journal: JournalSource) -> bool:
+        """SQLite 每次 persist 即提交事务，没有待压实的追加日志。"""
+        return False
+
+    def compact(self, journal: JournalSource) -> dict[str, ArticleRecord]:
+        return {entry.id: entry for entry in self._load_archive(journal).entries}
+
+    def entry_ids(self, journal: JournalSource) -> set[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT id FROM articles WHERE journal_slug = ?", (journal.slug,)).fetchall()
+        return {entry_id for (entry_id,) in rows}
+
+    def persist(self, journal: JournalSource, entries: list[ArticleRecord]) -> StorageResult:
+        """在单个事务内合并并 upsert 条目，同时刷新期刊元数据。"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                by_id = self._select_by_ids(cursor, journal.slug, [entry.id for entry in entries])
+                before = dict(by_id)
+                result = _merge_into(by_id, entries)
+                changed = [record for entry_id, record in by_id.items() if before.get(entry_id) is not record]
+                cursor.executemany(
+                    """
+                    INSERT INTO articles (
+                        journal_slug, id, published_at, translation_status, abstract_language, sort_key, record
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (journal_slug, id) DO UPDATE SET
+                        published_at = excluded.published_at,
+                        translation_status = excluded.translation_status,
+                        abstract_language = excluded.abstract_language,
+                        sort_key = excluded.sort_key,
+                        record = excluded.record
+                    """,
+                    [_row_for(journal.slug, record) for record in changed],
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO journals (slug, name, rss_url, source_type, notes, last_run_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (slug) DO UPDATE SET
+                        name = excluded.name,
+                        rss_url = excluded.rss_url,
+                        source_type = excluded.source_type,
+                        notes = excluded.notes,
+                        last_run_at = excluded.last_run_at
+                    """,
+                    (
+                        journal.slug,
+                        journal.name,
+                        journal.rss_url,
+                        journal.source_type,
+                        journal.notes,
+                        datetime.now(UTC).isoformat(),
+                    ),
+                )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+        return result
+
+    def open_session(
+        self,
+        journal: JournalSource,
+        *,
+        flush_every: int | None = None,
+        flush_interval: float | None = None,
+    ) -> SqliteWriteSession:
+        """与 JournalStore.open_session 对齐；每次 append 即一个事务，无需缓冲。"""
+        return SqliteWriteSession(self, journal)
+
+    def query(
+        self,
+        *,
+        journal_slug: str | None = None,
+        status: TranslationStatus | None = None,
+        since: datetime | None = None,
+        language: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, ArticleRecord]]:
+        """按索引字段查询条目，返回 (期刊 slug, 记录) 列表，按发表/抓取时间升序。"""
+        clauses: list[str] = []
+        params: list[object] = []
+        if journal_slug:
+            clauses.append("journal_slug = ?")
+            params.append(journal_slug)
+        if status:
+            clauses.append("translation_status = ?")
+            params.append(status)
+        if since:
+            clauses.append("published_at >= ?")
+            params.append(_utc_iso(since))
+        if language:
+            clauses.append("abstract_language LIKE ?")
+            params.append(f"{language}%")
+        sql = "SELECT journal_slug, record FROM articles"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY sort_key"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(slug, ArticleRecord.model_validate_json(record)) for slug, record in rows]
+
+    def export_json(self, journal: JournalSource, json_store: JournalStore) -> int:
+        """把期刊档案导出为 data/<slug>.json（覆盖写），返回条目数。"""
+        archive = self._load_archive(journal)
+        json_store.replace_archive(journal, archive)
+        return len(archive.entries)
+
+    def _load_archive(self, journal: JournalSource) -> JournalArchive:
+        with self._lock:
+            meta = self._conn.execute(
+                "SELECT name, rss_url, notes, last_run_at FROM journals WHERE slug = ?",
+                (journal.slug,),
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT record FROM articles WHERE journal_slug = ? ORDER BY sort_key",
+                (journal.slug,),
+            ).fetchall()
+        if meta:
+            name, rss_url, notes, last_run_at = meta
+            metadata = JournalMetadata(
+                name=name,
+                rss_url=rss_url,
+                notes=notes,
+                last_run_at=datetime.fromisoformat(last_run_at),
+            )
+        else:
+            metadata = JournalMetadata(
+                name=journal.name,
+                rss_url=journal.rss_url,
+                notes=journal.notes,
+                last_run_at=datetime.now(UTC),
+            )
+        return JournalArchive(
+            journal=metadata,
+            entries=[ArticleRecord.model_validate_json(record) for (record,) in rows],
+        )
+
+    def _select_by_ids(self, cursor: sqlite3.Cursor, slug: str, ids: Iterable[str]) -> dict[str, ArticleRecord]:
+        by_id: dict[str, ArticleRecord] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        # SQLite 默认单条语句最多 999 个参数，分块查询。
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start : start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = cursor.execute(
+                f"SELECT id, record FROM articles WHERE journal_slug = ? AND id IN ({placeholders})",
+                [slug, *chunk],
+            ).fetchall()
+            for entry_id, record in rows:
+                by_id[entry_id] = ArticleRecord.model_validate_json(record)
+        return by_id
+
+
+class SqliteWriteSession:
+    """SQLite 写入会话：接口与 JournalWriteSession 一致，append 直接提交。"""
+
+    def __init__(self, store: SqliteJournalStore, journal: JournalSource) -> None:
+        self._store = store
+        self._journal = journal
+
+    @property
+    def pending(self) -> int:
+        return 0
+
+    def entry_ids(self) -> set[str]:
+        return self._store.entry_ids(self._journal)
+
+    def append(self, entries: list[ArticleRecord]) -> StorageResult:
+        return self._store.persist(self._journal, entries)
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _row_for(slug: str, record: ArticleRecord) -> tuple[object, ...]:
+    published = _utc_iso(record.published_at) if record.published_at else None
+    sort_key = published or _utc_iso(record.fetched_at)
+    return (
+        slug,
+        record.id,
+        published,
+        record.translation.status,
+        record.abstract_language,
+        sort_key,
+        record.model_dump_json(),
+    )
+
+
+def _utc_iso(value: datetime) -> str:
+    """统一转为 UTC ISO 字符串，保证索引列可按字典序比较（naive 视为 UTC）。"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
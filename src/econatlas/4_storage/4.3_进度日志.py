@@ -0,0 +1,144 @@
+# ruff: noqa: N999
+"""
+断点续跑进度：快照 JSON + 追加日志。
+每完成一篇只向日志追加一行 `slug/entry_id`，累计到阈值或关闭时再压实成快照。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_COMPACT_EVERY = 500
+
+
+class ProgressJournal:
+    """
+    管理 `.cache/crawl_progress.json`（快照）与同名 `.log`（追加日志）。
+    快照格式保持不变：{"completed_entries": {slug: [entry_id, ...]}}，
+    同时兼容旧版仅记录 slug 列表的进度文件（legacy_completed_slugs）。
+    """
+
+    def __init__(self, snapshot_path: Path, *, compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        self._snapshot_path = snapshot_path
+        self._log_path = snapshot_path.with_suffix(".log")
+        self._compact_every = max(1, compact_every)
+        self._lock = threading.Lock()
+        self._appended = 0
+        self._dirty = False
+        self._completed, self._legacy_slugs = load_progress(snapshot_path)
+
+    @property
+    def log_path(self) -> Path:
+        return self._log_path
+
+    @property
+    def legacy_completed_slugs(self) -> set[str]:
+        return set(self._legacy_slugs)
+
+    def entries_for(self, slug: str) -> set[str]:
+        with self._lock:
+            return set(self._completed.get(slug, set()))
+
+    def mark(self, slug: str, entry_id: str) -> None:
+        """记录一篇已完成条目：追加一行日志，达到阈值时压实。"""
+        with self._lock:
+            entries = self._completed.setdefault(slug, set())
+            if entry_id in entries:
+                return
+            entries.add(entry_id)
+            line = f"{slug}/{_single_line(entry_id)}\n"
+            try:
+                self._log_path.parent.mkdir(parents=True, exist_ok=True)
+                with self._log_path.open("a", encoding="utf-8") as handle:
+                    handle.write(line)
+            except Exception:
+                LOGGER.debug("写入进度日志失败 %s", self._log_path, exc_info=True)
+                self._dirty = True
+                return
+            self._appended += 1
+            if self._appended >= self._compact_every:
+                self._compact_locked()
+
+    def forget(self, slug: str, entry_ids: set[str]) -> None:
+        """移除条目（如存档缺失需重抓）；日志只追加，故标记为待压实。"""
+        with self._lock:
+            entries = self._completed.get(slug)
+            if not entries:
+                return
+            entries -= entry_ids
+            if not entries:
+                self._completed.pop(slug, None)
+            self._dirty = True
+
+    def compact(self) -> None:
+        """把内存中的进度写成快照（原子替换）并清空日志。"""
+        with self._lock:
+            self._compact_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._appended or self._dirty:
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        payload = {"completed_entries": {slug: sorted(entries) for slug, entries in self._completed.items()}}
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._snapshot_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self._snapshot_path)
+            # 快照落盘后再清空日志；中途崩溃时日志重放是幂等的。
+            self._log_path.unlink(missing_ok=True)
+        except Exception:
+            LOGGER.debug("压实进度文件失败 %s", self._snapshot_path, exc_info=True)
+            return
+        self._appended = 0
+        self._dirty = False
+
+
+def load_progress(path: Path) -> tuple[dict[str, set[str]], set[str]]:
+    """
+    返回 (per_entry, legacy_completed_slugs)：读取快照，再回放追加日志。
+    per_entry: slug -> 已处理 entry.id 集合。
+    legacy_completed_slugs: 兼容旧版仅记录 slug 的进度文件。
+    """
+    per_entry: dict[str, set[str]] = {}
+    legacy_completed_slugs: set[str] = set()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, list):
+            legacy_completed_slugs = {str(item) for item in data}
+        elif isinstance(data, dict):
+            raw_entries = data.get("completed_entries", {}) if isinstance(data.get("completed_entries", {}), dict) else {}
+            per_entry = {slug: {str(item) for item in items or []} for slug, items in raw_entries.items()}
+            legacy_raw = data.get("completed_slugs", [])
+            if isinstance(legacy_raw, list):
+                legacy_completed_slugs = {str(item) for item in legacy_raw}
+    except FileNotFoundError:
+        pass
+    except Exception:
+        LOGGER.debug("读取进度文件失败 %s", path, exc_info=True)
+
+    log_path = path.with_suffix(".log")
+    try:
+        with log_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                # slug 由 slugify 生成，不含 "/"；entry_id（常为 URL）可能含 "/"。
+                slug, sep, entry_id = line.rstrip("\n").partition("/")
+                if not sep or not slug or not entry_id:
+                    continue
+                per_entry.setdefault(slug, set()).add(entry_id)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        LOGGER.debug("读取进度日志失败 %s", log_path, exc_info=True)
+    return per_entry, legacy_completed_slugs
+
+
+def _single_line(value: str) -> str:
+    return value.replace("\r", " ").replace("\n", " ")
@@ -0,0 +1,214 @@
+# ruff: noqa: N999
+"""
+文章页 HTML 缓存：按规范化 URL 建索引（SQLite），正文按内容哈希存放（gzip）。
+支持 TTL 与按总大小的 LRU 淘汰；解析规则修复后可直接从缓存重新抽取，无需联网。
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    url: str
+    html: str
+    source: str
+    fetched_at: datetime
+
+
+class HtmlCache:
+    """
+    `.cache/html/index.sqlite3` + `objects/<hash[:2]>/<hash>.html.gz`。
+    相同内容只存一份；get 命中会刷新访问时间，put 后超过 max_bytes 时按最久未访问淘汰。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        allow_stale: bool = False,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._objects_dir = cache_dir / "objects"
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._allow_stale = allow_stale
+        self._lock = threading.Lock()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(cache_dir / "index.sqlite3"), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def get(self, url: str) -> CachedPage | None:
+        """返回未过期的缓存页；allow_stale=True 时忽略 TTL（用于离线重新抽取）。"""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, source, content_hash, fetched_at FROM pages WHERE url_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (not self._allow_stale and time.time() - row[3] > self._ttl_seconds):
+                self.misses += 1
+                return None
+            html = self._read_object(row[2])
+            if html is None:
+                self._conn.execute("DELETE FROM pages WHERE url_key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE url_key = ?", (time.time(), key))
+            self.hits += 1
+        return CachedPage(
+            url=row[0],
+            html=html,
+            source=row[1],
+            fetched_at=datetime.fromtimestamp(row[3], tz=UTC),
+        )
+
+    def put(self, url: str, html: str, *, source: str) -> None:
+        payload = html.encode("utf-8")
+        content_hash = hashlib.sha256(payload).hexdigest()
+        now = time.time()
+        with self._lock:
+            try:
+                size = self._write_object(content_hash, payload)
+            except OSError:
+                LOGGER.debug("写入页面缓存失败 %s", url, exc_info=True)
+                return
+            self._conn.execute(
+                "INSERT INTO pages(url_key, url, source, content_hash, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url_key) DO UPDATE SET url = excluded.url, source = excluded.source, "
+                "content_hash = excluded.content_hash, size = excluded.size, "
+                "fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at",
+                (normalize_url(url), url, source, content_hash, size, now, now),
+            )
+            self._evict_locked()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _total_bytes_locked(self) -> int:
+        # 同一内容可能被多个 URL 引用，按去重后的对象计算。
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT content_hash, MAX(size) AS size FROM pages GROUP BY content_hash)"
+        ).fetchone()
+        return int(row[0])
+
+    def _evict_locked(self) -> None:
+        total = self._total_bytes_locked()
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute("SELECT url_key, content_hash FROM pages ORDER BY accessed_at ASC").fetchall()
+        evicted = 0
+        for url_key, content_hash in rows:
+            if total <= self._max_bytes:
+                break
+            self._conn.execute("DELETE FROM pages WHERE url_key = ?", (url_key,))
+            still_used = self._conn.execute(
+                "SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1", (content_hash,)
+            ).fetchone()
+            if still_used is None:
+                path = self._object_path(content_hash)
+                try:
+                    total -= path.stat().st_size
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            evicted += 1
+        LOGGER.debug("页面缓存淘汰 %d 条", evicted)
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self._objects_dir / content_hash[:2] / f"{content_hash}.html.gz"
+
+    def _write_object(self, content_hash: str, payload: bytes) -> int:
+        path = self._object_path(content_hash)
+        if path.exists():
+            return path.stat().st_size
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(gzip.compress(payload))
+        os.replace(tmp_path, path)
+        return path.stat().st_size
+
+    def _read_object(self, content_hash: str) -> str | None:
+        try:
+            return gzip.decompress(self._object_path(content_hash).read_bytes()).decode("utf-8")
+        except (OSError, EOFError):
+            return None
+
+
+def normalize_url(url: str) -> str:
+    """小写 scheme/host、去掉片段与跟踪参数、查询参数排序，作为缓存键。"""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    ]
+    path = parts.path or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""))
+
+
+def html_cache_from_env(cache_dir: Path, *, allow_stale: bool = False) -> HtmlCache:
+    """读取 HTML_CACHE_TTL_DAYS（默认 7）与 HTML_CACHE_MAX_MB（默认 512）。"""
+    return HtmlCache(
+        cache_dir,
+        ttl_seconds=_float_from_env("HTML_CACHE_TTL_DAYS", DEFAULT_TTL_SECONDS / 86400) * 86400,
+        max_bytes=int(_float_from_env("HTML_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)) * 1024 * 1024),
+        allow_stale=allow_stale,
+    )
+
+
+def _float_from_env(env_key: str, default: float) -> float:
+    raw = os.getenv(env_key)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+        return value if value > 0 else default
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return default
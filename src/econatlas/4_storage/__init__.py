@@ -1,5 +1,5 @@
 """
-存储层导出：JSON 持久化。
+存储层导出：JSON / SQLite 持久化、断点续跑进度、文章页缓存。
 """
 
 from __future__ import annotations
@@ -7,8 +7,35 @@ from __future__ import annotations
 from econatlas._loader import load_local_module
 
 _json_store = load_local_module(__file__, "4.1_JSON存储.py", "econatlas._storage_json")
+_sqlite_store = load_local_module(__file__, "4.2_SQLite存储.py", "econatlas._storage_sqlite")
+_progress = load_local_module(__file__, "4.3_进度日志.py", "econatlas._storage_progress")
+_html_cache = load_local_module(__file__, "4.4_页面缓存.py", "econatlas._storage_html_cache")
 
 JournalStore = _json_store.JournalStore
 StorageResult = _json_store.StorageResult
+JournalWriteSession = _json_store.JournalWriteSession
 
-__all__ = ["JournalStore", "StorageResult"]
+SqliteJournalStore = _sqlite_store.SqliteJournalStore
+SqliteWriteSession = _sqlite_store.SqliteWriteSession
+
+ProgressJournal = _progress.ProgressJournal
+load_progress = _progress.load_progress
+
+HtmlCache = _html_cache.HtmlCache
+CachedPage = _html_cache.CachedPage
+html_cache_from_env = _html_cache.html_cache_from_env
+normalize_url = _html_cache.normalize_url
+
+__all__ = [
+    "CachedPage",
+    "HtmlCache",
+    "JournalStore",
+    "JournalWriteSession",
+    "ProgressJournal",
+    "SqliteJournalStore",
+    "SqliteWriteSession",
+    "StorageResult",
+    "html_cache_from_env",
+    "load_progress",
+    "normalize_url",
+]
@@ -291,9 +291,18 @@ class SampleCollector:
 
     def _ensure_browser_fetcher(self) -> BrowserHtmlFetcher:
         if self._browser_fetcher is None:
-            self._browser_fetcher = PlaywrightFetcher(timeout_seconds=DEFAULT_BROWSER_TIMEOUT)
+            self._browser_fetcher = PlaywrightFetcher(timeout_seconds=DEFAULT_BROWSER_TIMEOUT, reuse_browser=True)
         return self._browser_fetcher
 
+    def close(self) -> None:
+        """释放复用的浏览器。"""
+        close = getattr(self._browser_fetcher, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                LOGGER.debug("关闭浏览器抓取器失败", exc_info=True)
+
 
 def _default_fetch_html(
     url: str,
@@ -7,6 +7,10 @@ from __future__ import annotations
 import logging
 import json
 import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, TYPE_CHECKING, cast
@@ -30,11 +34,31 @@ class BrowserCredentials:
 
 
 class PlaywrightFetcher:
-    """使用 Playwright 无头浏览器抓取 HTML。"""
+    """
+    使用 Playwright 无头浏览器抓取 HTML。
+    默认每次调用启动并关闭浏览器；reuse_browser=True 时按启动参数复用浏览器
+    （持久化 profile 则复用同一上下文），空闲超过 idle_timeout_seconds 自动关闭，close() 立即释放。
+    复用模式下所有浏览器操作在内部单线程上执行，可从任意线程调用。
+    """
 
-    def __init__(self, *, timeout_seconds: float = 45.0, idle_wait_seconds: float = 5.0):
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float = 45.0,
+        idle_wait_seconds: float = 5.0,
+        reuse_browser: bool = False,
+        idle_timeout_seconds: float = 300.0,
+    ):
         self._timeout_ms = int(timeout_seconds * 1000)
         self._idle_wait_ms = int(idle_wait_seconds * 1000)
+        self._reuse_browser = reuse_browser
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._idle_timer: threading.Timer | None = None
+        self._playwright: Any = None
+        self._sessions: dict[_LaunchKey, _ReusableSession] = {}
+        self.launches = 0
 
     def fetch(
         self,
@@ -55,136 +79,385 @@ class PlaywrightFetcher:
         browser_channel: str | None = None,
         executable_path: str | None = None,
     ) -> bytes:
-        lock_files: list[Path] = []
-        if user_data_dir:
-            base = Path(user_data_dir)
-            lock_files = [
-                base / "SingletonLock",
-                base / "SingletonCookie",
-                base / "SingletonSocket",
-            ]
-            for lock_path in lock_files:
-                try:
-                    lock_path.unlink()
-                except FileNotFoundError:
-                    pass
-                except OSError:
-                    LOGGER.debug("无法删除旧锁文件 %s", lock_path)
         try:
             from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.sync_api import sync_playwright
         except ImportError as exc:  # pragma: no cover
             raise RuntimeError(
                 "Playwright 未安装。运行 `uv add playwright` 和 `uv run playwright install chromium`。"
             ) from exc
 
-        extra_headers = dict(headers)
-        extra_headers.setdefault("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
-        extra_headers.setdefault("Accept-Language", "en-US,en;q=0.9")
-        extra_headers.pop("User-Agent", None)
+        request = _PageRequest(
+            url=url,
+            extra_headers=_extra_headers(headers),
+            cookies=cookies,
+            http_credentials=cast("HttpCredentials", credentials.as_dict()) if credentials else None,
+            user_agent=user_agent,
+            wait_selector=wait_selector,
+            extract_script=extract_script,
+            init_scripts=list(init_scripts or []),
+            debug_dir=debug_dir,
+            debug_label=debug_label,
+            trace_path=trace_path,
+        )
+        key = _LaunchKey(
+            headless=headless,
+            browser_channel=browser_channel,
+            executable_path=executable_path,
+            user_data_dir=user_data_dir,
+            # 持久化上下文的 UA/凭据在启动时确定，需区分。
+            persistent_identity=(user_agent, repr(request.http_credentials)) if user_data_dir else None,
+        )
+        try:
+            if self._reuse_browser:
+                html_text = self._run_serialized(self._fetch_reused, key, request)
+            else:
+                html_text = self._fetch_once(key, request)
+        except PlaywrightTimeoutError as exc:
+            raise TimeoutError(f"等待 {url} 完成加载超时") from exc
+        return html_text.encode("utf-8")
+
+    def close(self) -> None:
+        """关闭复用的浏览器与 Playwright（复用模式之外为空操作）。"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            timer = self._idle_timer
+            self._idle_timer = None
+        if timer is not None:
+            timer.cancel()
+        if executor is None:
+            return
+        try:
+            executor.submit(self._close_all).result(timeout=30)
+        except Exception:
+            LOGGER.debug("关闭复用浏览器失败", exc_info=True)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_once(self, key: _LaunchKey, request: _PageRequest) -> str:
+        from playwright.sync_api import sync_playwright
 
+        lock_files = _clear_profile_locks(key.user_data_dir)
         try:
             with sync_playwright() as playwright:
                 browser = None
-                http_credentials: HttpCredentials | None = None
-                if credentials:
-                    http_credentials = cast(HttpCredentials, credentials.as_dict())
-                launch_kwargs: dict[str, Any] = {"headless": headless}
-                if executable_path:
-                    launch_kwargs["executable_path"] = executable_path
-                elif browser_channel:
-                    launch_kwargs["channel"] = browser_channel
-                if user_data_dir:
+                launch_kwargs = key.launch_kwargs()
+                if key.user_data_dir:
                     context = playwright.chromium.launch_persistent_context(
-                        user_data_dir,
+                        key.user_data_dir,
                         **launch_kwargs,
-                        user_agent=user_agent,
-                        http_credentials=http_credentials,
+                        user_agent=request.user_agent,
+                        http_credentials=request.http_credentials,
                     )
                 else:
                     browser = playwright.chromium.launch(**launch_kwargs)
-                    context_kwargs: dict[str, Any] = {"user_agent": user_agent}
-                    if http_credentials:
-                        context_kwargs["http_credentials"] = http_credentials
-                    context = browser.new_context(**context_kwargs)
-                if extra_headers:
-                    context.set_extra_http_headers(extra_headers)
-                if cookies:
-                    domain = _cookie_domain(url)
-                    if domain:
-                        context.add_cookies(
-                            [
-                                {
-                                    "name": name,
-                                    "value": value,
-                                    "domain": domain,
-                                    "path": "/",
-                                }
-                                for name, value in cookies.items()
-                            ]
-                        )
-                if init_scripts:
-                    for script in init_scripts:
-                        context.add_init_script(script)
-                if trace_path:
-                    context.tracing.start(screenshots=True, snapshots=True, sources=False)
+                    context = browser.new_context(**request.context_kwargs())
+                self.launches += 1
+                _prepare_context(context, request)
+                for script in request.init_scripts:
+                    context.add_init_script(script)
                 page = context.new_page()
-                page.goto(url, wait_until="domcontentloaded", timeout=self._timeout_ms)
-                if wait_selector:
-                    try:
-                        page.wait_for_selector(wait_selector, timeout=self._timeout_ms)
-                    except PlaywrightTimeoutError:
-                        LOGGER.debug("等待选择器 %s 超时：%s", wait_selector, url)
-                if self._idle_wait_ms:
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=self._idle_wait_ms)
-                    except PlaywrightTimeoutError:
-                        LOGGER.debug("networkidle 等待超时：%s，返回 DOM", url)
-                if extract_script:
-                    script_content = page.evaluate(f"JSON.stringify({extract_script})")
-                    if script_content and script_content != "null":
-                        encoded = json.dumps(script_content)
-                        page.evaluate(
-                            f"""
+                html_text = self._render(context, page, request)
+                context.close()
+                if browser:
+                    browser.close()
+        finally:
+            _clear_lock_files(lock_files)
+        return html_text
+
+    def _fetch_reused(self, key: _LaunchKey, request: _PageRequest) -> str:
+        session = self._session_for(key, request)
+        session.last_used = time.monotonic()
+        if session.persistent:
+            # 共享持久化上下文：请求头与脚本按页面设置，Cookies 累加到上下文。
+            context = session.context
+            _add_cookies(context, request)
+            page = context.new_page()
+            if request.extra_headers:
+                page.set_extra_http_headers(request.extra_headers)
+            for script in request.init_scripts:
+                page.add_init_script(script)
+            try:
+                return self._render(context, page, request)
+            finally:
+                page.close()
+        # 复用浏览器进程，每次新建轻量上下文，保证 UA/凭据/Cookies 互不干扰。
+        context = session.browser.new_context(**request.context_kwargs())
+        try:
+            _prepare_context(context, request)
+            for script in request.init_scripts:
+                context.add_init_script(script)
+            return self._render(context, context.new_page(), request)
+        finally:
+            context.close()
+
+    def _session_for(self, key: _LaunchKey, request: _PageRequest) -> _ReusableSession:
+        session = self._sessions.get(key)
+        if session is not None and session.is_alive():
+            return session
+        if session is not None:
+            self._close_session(key)
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright
+
+            self._playwright = sync_playwright().start()
+        launch_kwargs = key.launch_kwargs()
+        if key.user_data_dir:
+            lock_files = _clear_profile_locks(key.user_data_dir)
+            context = self._playwright.chromium.launch_persistent_context(
+                key.user_data_dir,
+                **launch_kwargs,
+                user_agent=request.user_agent,
+                http_credentials=request.http_credentials,
+            )
+            session = _ReusableSession(browser=None, context=context, lock_files=lock_files)
+            context.on("close", lambda *_: session.mark_closed())
+        else:
+            browser = self._playwright.chromium.launch(**launch_kwargs)
+            session = _ReusableSession(browser=browser, context=None, lock_files=[])
+        self._sessions[key] = session
+        self.launches += 1
+        return session
+
+    def _render(self, context: Any, page: Any, request: _PageRequest) -> str:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        url = request.url
+        if request.trace_path:
+            context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        page.goto(url, wait_until="domcontentloaded", timeout=self._timeout_ms)
+        if request.wait_selector:
+            try:
+                page.wait_for_selector(request.wait_selector, timeout=self._timeout_ms)
+            except PlaywrightTimeoutError:
+                LOGGER.debug("等待选择器 %s 超时：%s", request.wait_selector, url)
+        if self._idle_wait_ms:
+            try:
+                page.wait_for_load_state("networkidle", timeout=self._idle_wait_ms)
+            except PlaywrightTimeoutError:
+                LOGGER.debug("networkidle 等待超时：%s，返回 DOM", url)
+        extract_script = request.extract_script
+        if extract_script:
+            script_content = page.evaluate(f"JSON.stringify({extract_script})")
+            if script_content and script_content != "null":
+                encoded = json.dumps(script_content)
+                page.evaluate(
+                    f"""
 const pre = document.createElement('pre');
 pre.id = 'browser-snapshot-data';
 pre.setAttribute('data-source', {repr(extract_script)});
 pre.textContent = {encoded};
 document.body.appendChild(pre);
 """
-                        )
-                html_text = page.content()
-                if debug_dir:
-                    debug_dir.mkdir(parents=True, exist_ok=True)
-                    safe_label = _safe_label(debug_label or url)
-                    screenshot_path = debug_dir / f"{safe_label}.png"
-                    meta_path = debug_dir / f"{safe_label}.json"
-                    dom_path = debug_dir / f"{safe_label}.html"
-                    page.screenshot(path=str(screenshot_path), full_page=True)
-                    meta = {"url": page.url, "title": page.title()}
-                    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
-                    dom_path.write_text(html_text, encoding="utf-8")
-                    LOGGER.info("已保存调试截图 %s", screenshot_path)
-                if trace_path:
-                    trace_path.parent.mkdir(parents=True, exist_ok=True)
-                    context.tracing.stop(path=str(trace_path))
-                    LOGGER.info("已保存浏览器 trace %s", trace_path)
-                context.close()
-                if browser:
-                    browser.close()
-        except PlaywrightTimeoutError as exc:
-            raise TimeoutError(f"等待 {url} 完成加载超时") from exc
+                )
+        html_text = str(page.content())
+        debug_dir = request.debug_dir
+        if debug_dir:
+            debug_dir.mkdir(parents=True, exist_ok=True)
+            safe_label = _safe_label(request.debug_label or url)
+            screenshot_path = debug_dir / f"{safe_label}.png"
+            meta_path = debug_dir / f"{safe_label}.json"
+            dom_path = debug_dir / f"{safe_label}.html"
+            page.screenshot(path=str(screenshot_path), full_page=True)
+            meta = {"url": page.url, "title": page.title()}
+            meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+            dom_path.write_text(html_text, encoding="utf-8")
+            LOGGER.info("已保存调试截图 %s", screenshot_path)
+        if request.trace_path:
+            request.trace_path.parent.mkdir(parents=True, exist_ok=True)
+            context.tracing.stop(path=str(request.trace_path))
+            LOGGER.info("已保存浏览器 trace %s", request.trace_path)
+        return html_text
+
+    def _run_serialized(self, func: Callable[..., str], *args: Any) -> str:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright-fetcher")
+            executor = self._executor
+        try:
+            return executor.submit(func, *args).result()
+        finally:
+            self._arm_idle_timer()
+
+    def _arm_idle_timer(self) -> None:
+        if self._idle_timeout_seconds <= 0:
+            return
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            timer = threading.Timer(self._idle_timeout_seconds, self._reap_idle)
+            timer.daemon = True
+            self._idle_timer = timer
+        timer.start()
+
+    def _reap_idle(self) -> None:
+        with self._lock:
+            executor = self._executor
+        if executor is None:
+            return
+        try:
+            executor.submit(self._close_idle_sessions)
+        except RuntimeError:
+            pass
+
+    def _close_idle_sessions(self) -> None:
+        deadline = time.monotonic() - self._idle_timeout_seconds
+        for key, session in list(self._sessions.items()):
+            if session.last_used <= deadline:
+                LOGGER.debug("关闭空闲浏览器 %s", key)
+                self._close_session(key)
+        if not self._sessions and self._playwright is not None:
+            self._stop_playwright()
+
+    def _close_session(self, key: _LaunchKey) -> None:
+        session = self._sessions.pop(key, None)
+        if session is None:
+            return
+        try:
+            if session.context is not None:
+                session.context.close()
+            if session.browser is not None:
+                session.browser.close()
         except Exception:
-            raise
+            LOGGER.debug("关闭复用浏览器失败", exc_info=True)
         finally:
-            for lock_path in lock_files:
-                try:
-                    lock_path.unlink()
-                except FileNotFoundError:
-                    pass
-                except OSError:
-                    LOGGER.debug("无法删除锁文件 %s", lock_path)
-        return html_text.encode("utf-8")
+            _clear_lock_files(session.lock_files)
+
+    def _close_all(self) -> None:
+        for key in list(self._sessions):
+            self._close_session(key)
+        self._stop_playwright()
+
+    def _stop_playwright(self) -> None:
+        playwright = self._playwright
+        self._playwright = None
+        if playwright is None:
+            return
+        try:
+            playwright.stop()
+        except Exception:
+            LOGGER.debug("停止 Playwright 失败", exc_info=True)
+
+
+@dataclass(frozen=True)
+class _LaunchKey:
+    headless: bool
+    browser_channel: str | None
+    executable_path: str | None
+    user_data_dir: str | None
+    persistent_identity: tuple[str, str] | None = None
+
+    def launch_kwargs(self) -> dict[str, Any]:
+        launch_kwargs: dict[str, Any] = {"headless": self.headless}
+        if self.executable_path:
+            launch_kwargs["executable_path"] = self.executable_path
+        elif self.browser_channel:
+            launch_kwargs["channel"] = self.browser_channel
+        return launch_kwargs
+
+
+@dataclass
+class _PageRequest:
+    url: str
+    extra_headers: dict[str, str]
+    cookies: dict[str, str] | None
+    http_credentials: HttpCredentials | None
+    user_agent: str
+    wait_selector: str | None
+    extract_script: str | None
+    init_scripts: list[str]
+    debug_dir: Path | None
+    debug_label: str | None
+    trace_path: Path | None
+
+    def context_kwargs(self) -> dict[str, Any]:
+        context_kwargs: dict[str, Any] = {"user_agent": self.user_agent}
+        if self.http_credentials:
+            context_kwargs["http_credentials"] = self.http_credentials
+        return context_kwargs
+
+
+@dataclass
+class _ReusableSession:
+    browser: Any
+    context: Any
+    lock_files: list[Path]
+    last_used: float = 0.0
+    closed: bool = False
+
+    @property
+    def persistent(self) -> bool:
+        return self.context is not None
+
+    def mark_closed(self) -> None:
+        self.closed = True
+
+    def is_alive(self) -> bool:
+        if self.closed:
+            return False
+        if self.browser is not None:
+            return bool(self.browser.is_connected())
+        return True
+
+
+def _extra_headers(headers: dict[str, str]) -> dict[str, str]:
+    extra_headers = dict(headers)
+    extra_headers.setdefault("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
+    extra_headers.setdefault("Accept-Language", "en-US,en;q=0.9")
+    extra_headers.pop("User-Agent", None)
+    return extra_headers
+
+
+def _prepare_context(context: Any, request: _PageRequest) -> None:
+    if request.extra_headers:
+        context.set_extra_http_headers(request.extra_headers)
+    _add_cookies(context, request)
+
+
+def _add_cookies(context: Any, request: _PageRequest) -> None:
+    if not request.cookies:
+        return
+    domain = _cookie_domain(request.url)
+    if domain:
+        context.add_cookies(
+            [
+                {
+                    "name": name,
+                    "value": value,
+                    "domain": domain,
+                    "path": "/",
+                }
+                for name, value in request.cookies.items()
+            ]
+        )
+
+
+def _clear_profile_locks(user_data_dir: str | None) -> list[Path]:
+    if not user_data_dir:
+        return []
+    base = Path(user_data_dir)
+    lock_files = [
+        base / "SingletonLock",
+        base / "SingletonCookie",
+        base / "SingletonSocket",
+    ]
+    for lock_path in lock_files:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            LOGGER.debug("无法删除旧锁文件 %s", lock_path)
+    return lock_files
+
+
+def _clear_lock_files(lock_files: list[Path]) -> None:
+    for lock_path in lock_files:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            LOGGER.debug("无法删除锁文件 %s", lock_path)
 
 
 def _cookie_domain(url: str) -> str | None:
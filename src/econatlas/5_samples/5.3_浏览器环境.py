@@ -7,7 +7,9 @@ from __future__ import annotations
 import json
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from econatlas._loader import load_local_module
 
@@ -40,6 +42,68 @@ COOKIE_ENV_MAP = {
     "nber": "NBER_COOKIES",
 }
 
+# 文章增强只读取 meta 与摘要 DOM：默认拦截图片/媒体/字体/样式表与常见统计广告域名。
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adnxs.com",
+    "facebook.net",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "crazyegg.com",
+    "nr-data.net",
+    "trendmd.com",
+    "altmetric.com",
+)
+# 反爬校验依赖的域名永不拦截。
+ANTI_BOT_DOMAINS = (
+    "challenges.cloudflare.com",
+    "hcaptcha.com",
+    "recaptcha.net",
+    "www.google.com",
+    "www.gstatic.com",
+)
+
+
+# 反爬/验证页的特征片段（小写匹配）。
+CHALLENGE_MARKERS = (
+    "cf-chl-",
+    "challenge-platform",
+    "cf-browser-verification",
+    "just a moment...",
+    "attention required! | cloudflare",
+    "captcha-delivery",
+    "px-captcha",
+    "<title>access denied",
+    "请输入验证码",
+    "安全验证",
+)
+
+
+@dataclass(frozen=True)
+class ResourceBlockPolicy:
+    """浏览器请求拦截策略：按资源类型与域名中止请求，反爬域名始终放行。"""
+
+    resource_types: frozenset[str] = frozenset()
+    domains: tuple[str, ...] = ()
+    allow_domains: tuple[str, ...] = ANTI_BOT_DOMAINS
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.resource_types or self.domains)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        host = (urlsplit(url).hostname or "").lower()
+        if _host_matches(host, self.allow_domains):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        return _host_matches(host, self.domains)
+
+
 SCIDIR_FINGERPRINT_SCRIPT = """
 (() => {
   Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
@@ -205,6 +269,52 @@ def browser_headless_for_source(source_type: str) -> bool:
     return value.strip().lower() not in {"0", "false", "no"}
 
 
+def browser_max_pages_for_source(source_type: str) -> int:
+    """单个来源同时打开的页面数（`<SOURCE>_BROWSER_MAX_PAGES`），默认 1，适合 Cloudflare 敏感站点。"""
+    env_key = f"{source_type.upper()}_BROWSER_MAX_PAGES"
+    raw = os.getenv(env_key)
+    if not raw:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return 1
+
+
+def looks_like_challenge(html: str) -> bool:
+    # 验证页通常很短，只检查开头部分即可。
+    head = html[:20_000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def browser_block_policy_for_source(source_type: str) -> ResourceBlockPolicy:
+    """
+    拦截策略：`<SOURCE>_BROWSER_BLOCK_RESOURCES` 优先于 `BROWSER_BLOCK_RESOURCES`，
+    取值为逗号分隔的资源类型（image,media,font,stylesheet,...），`none` 表示不按类型拦截；
+    `BROWSER_BLOCK_DOMAINS` 追加拦截域名，`none` 关闭域名拦截。
+    """
+    raw_types = os.getenv(f"{source_type.upper()}_BROWSER_BLOCK_RESOURCES") or os.getenv("BROWSER_BLOCK_RESOURCES")
+    resource_types = DEFAULT_BLOCKED_RESOURCE_TYPES
+    if raw_types is not None and raw_types.strip():
+        resource_types = frozenset(_split_csv(raw_types))
+    raw_domains = os.getenv("BROWSER_BLOCK_DOMAINS")
+    domains = DEFAULT_BLOCKED_DOMAINS
+    if raw_domains is not None and raw_domains.strip():
+        extra = _split_csv(raw_domains)
+        domains = tuple(extra) if "none" in raw_domains.lower() else DEFAULT_BLOCKED_DOMAINS + tuple(extra)
+    return ResourceBlockPolicy(resource_types=resource_types, domains=domains)
+
+
+def _split_csv(raw: str) -> list[str]:
+    values = [item.strip().lower() for item in raw.split(",")]
+    return [item for item in values if item and item not in {"none", "off", "false", "0"}]
+
+
+def _host_matches(host: str, domains: tuple[str, ...]) -> bool:
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
 def browser_launch_overrides(source_type: str) -> tuple[str | None, str | None]:
     channel = os.getenv("BROWSER_CHANNEL")
     executable = os.getenv("BROWSER_EXECUTABLE")
@@ -0,0 +1,619 @@
+# ruff: noqa: N999
+"""
+共享浏览器池：整轮抓取只启动一次 Chromium，按来源分配独立的浏览器上下文。
+Playwright 异步 API 运行在后台事件循环线程中，调用方通过同步方法提交抓取任务。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from dataclasses import dataclass, field, replace
+from typing import Any, Self, TypeVar
+
+from econatlas._loader import load_local_module
+from econatlas.models import ArticleRecord, NormalizedFeedEntry
+
+_fetcher_mod = load_local_module(__file__, "5.2_浏览器抓取.py", "econatlas._samples_fetcher")
+BrowserCredentials = _fetcher_mod.BrowserCredentials  # type: ignore[attr-defined]
+
+_env = load_local_module(__file__, "5.3_浏览器环境.py", "econatlas._samples_env")
+build_browser_headers = _env.build_browser_headers  # type: ignore[attr-defined]
+browser_credentials_for_source = _env.browser_credentials_for_source  # type: ignore[attr-defined]
+browser_user_agent_for_source = _env.browser_user_agent_for_source  # type: ignore[attr-defined]
+browser_init_scripts_for_source = _env.browser_init_scripts_for_source  # type: ignore[attr-defined]
+browser_local_storage_for_source = _env.browser_local_storage_for_source  # type: ignore[attr-defined]
+browser_user_data_dir_for_source = _env.browser_user_data_dir_for_source  # type: ignore[attr-defined]
+browser_headless_for_source = _env.browser_headless_for_source  # type: ignore[attr-defined]
+browser_max_pages_for_source = _env.browser_max_pages_for_source  # type: ignore[attr-defined]
+browser_block_policy_for_source = _env.browser_block_policy_for_source  # type: ignore[attr-defined]
+ResourceBlockPolicy = _env.ResourceBlockPolicy  # type: ignore[attr-defined]
+browser_launch_overrides = _env.browser_launch_overrides  # type: ignore[attr-defined]
+browser_wait_selector_for_source = _env.browser_wait_selector_for_source  # type: ignore[attr-defined]
+cookies_for_source = _env.cookies_for_source  # type: ignore[attr-defined]
+cleanup_user_data_dir = _env.cleanup_user_data_dir  # type: ignore[attr-defined]
+local_storage_script = _env.local_storage_script  # type: ignore[attr-defined]
+looks_like_challenge = _env.looks_like_challenge  # type: ignore[attr-defined]
+
+_html_cache_mod = load_local_module(__file__, "../4_storage/4.4_页面缓存.py", "econatlas._storage_html_cache")
+HtmlCache = _html_cache_mod.HtmlCache  # type: ignore[attr-defined]
+
+LOGGER = logging.getLogger(__name__)
+PAGE_TIMEOUT_MS = 45_000
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class BrowserLaunchOptions:
+    """决定需要哪个 Chromium 进程；相同选项的来源共用同一个浏览器。"""
+
+    headless: bool
+    browser_channel: str | None = None
+    executable_path: str | None = None
+    user_data_dir: str | None = None
+
+
+@dataclass
+class SourceContextOptions:
+    """单个来源的上下文配置（UA、请求头、Cookies、凭据、初始化脚本）。"""
+
+    source_type: str
+    user_agent: str
+    launch: BrowserLaunchOptions
+    headers: dict[str, str] = field(default_factory=dict)
+    cookies: dict[str, str] | None = None
+    cookie_domain: str | None = None
+    credentials: BrowserCredentials | None = None
+    init_scripts: list[str] = field(default_factory=list)
+    max_pages: int = 1
+    block_policy: ResourceBlockPolicy | None = None
+
+
+def source_context_options(
+    source_type: str,
+    *,
+    referer: str,
+    cookie_domain: str | None,
+    extra_headers: dict[str, str] | None = None,
+) -> SourceContextOptions:
+    """按环境变量构建来源上下文配置，与各来源原先的浏览器会话保持一致。"""
+    headers = build_browser_headers({"Referer": referer, **(extra_headers or {})}, source_type)
+    init_scripts: list[str] = list(browser_init_scripts_for_source(source_type) or [])
+    local_storage_entries = browser_local_storage_for_source(source_type)
+    if local_storage_entries:
+        init_scripts.append(local_storage_script(local_storage_entries))
+    browser_channel, executable_path = browser_launch_overrides(source_type)
+    return SourceContextOptions(
+        source_type=source_type,
+        user_agent=browser_user_agent_for_source(source_type, headers),
+        launch=BrowserLaunchOptions(
+            headless=browser_headless_for_source(source_type),
+            browser_channel=browser_channel,
+            executable_path=executable_path,
+            user_data_dir=browser_user_data_dir_for_source(source_type),
+        ),
+        headers=headers,
+        cookies=cookies_for_source(source_type),
+        cookie_domain=cookie_domain,
+        credentials=browser_credentials_for_source(source_type),
+        init_scripts=init_scripts,
+        max_pages=browser_max_pages_for_source(source_type),
+        block_policy=browser_block_policy_for_source(source_type),
+    )
+
+
+class RateLimiter:
+    """跨线程共享的最小间隔限速：每次 wait() 预约下一个时间槽，保证请求启动间隔不小于 interval。"""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval = max(0.0, interval_seconds)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval
+
+    def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class BrowserPoolStats:
+    """页面与流量统计：对比开启/关闭拦截（BROWSER_BLOCK_RESOURCES=none）时的每页加载字节即为节省量。"""
+
+    pages: int = 0
+    launches: int = 0
+    restarts: int = 0
+    blocked_requests: int = 0
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    loaded_bytes: int = 0
+
+    @property
+    def loaded_bytes_per_page(self) -> float:
+        return self.loaded_bytes / self.pages if self.pages else 0.0
+
+
+@dataclass
+class _SourceContext:
+    launch: BrowserLaunchOptions
+    context: Any
+    shared: bool
+
+
+class BrowserPool:
+    """
+    管理 Playwright 与 Chromium 的生命周期：
+    - 相同启动选项只启动一个浏览器；每个来源一个独立上下文（Cookies/请求头/脚本互不干扰）。
+    - 配置了持久化 profile（BROWSER_USER_DATA_DIR）时，各来源共用该持久化上下文，
+      请求头与初始化脚本改为按页面设置。
+    - 浏览器断开或崩溃后自动重启并重试一次；health() 返回当前状态。
+    - 传入 html_cache 时，各来源会话先查页面缓存，命中则不打开浏览器。
+    """
+
+    def __init__(
+        self,
+        *,
+        playwright_factory: Callable[[], Awaitable[Any]] | None = None,
+        html_cache: HtmlCache | None = None,
+    ) -> None:
+        self._playwright_factory = playwright_factory or _start_async_playwright
+        self._html_cache = html_cache
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._setup_lock: asyncio.Lock | None = None
+        self._playwright: Any = None
+        self._browsers: dict[BrowserLaunchOptions, Any] = {}
+        self._contexts: dict[str, _SourceContext] = {}
+        self._page_slots: dict[str, asyncio.Semaphore] = {}
+        self._rate_limiters: dict[str, RateLimiter] = {}
+        self._dead: set[BrowserLaunchOptions] = set()
+        self._closed = False
+        self._stats = BrowserPoolStats()
+
+    def fetch_html(
+        self,
+        options: SourceContextOptions,
+        url: str,
+        *,
+        wait_selector: str | None = None,
+        timeout_seconds: float = 60.0,
+    ) -> str:
+        """在来源对应的上下文中打开页面并返回 HTML；超时抛出 TimeoutError。"""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._fetch(options, url, wait_selector), loop)
+        try:
+            return future.result(timeout=timeout_seconds)
+        except FuturesTimeout as exc:
+            future.cancel()
+            raise TimeoutError(f"{options.source_type} 抓取超时 {url}") from exc
+
+    @property
+    def html_cache(self) -> HtmlCache | None:
+        return self._html_cache
+
+    def rate_limiter(self, source_type: str, interval_seconds: float) -> RateLimiter:
+        """返回来源共享的限速器；同一来源的所有会话/线程共用一个。"""
+        with self._lock:
+            limiter = self._rate_limiters.get(source_type)
+            if limiter is None:
+                limiter = RateLimiter(interval_seconds)
+                self._rate_limiters[source_type] = limiter
+            return limiter
+
+    def stats(self) -> BrowserPoolStats:
+        """返回统计快照。"""
+        with self._lock:
+            return replace(self._stats, blocked_by_type=dict(self._stats.blocked_by_type))
+
+    def health(self) -> dict[str, str]:
+        """返回各来源上下文的状态：ok / disconnected。"""
+        with self._lock:
+            return {
+                source: "disconnected" if entry.launch in self._dead else "ok"
+                for source, entry in self._contexts.items()
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop = self._loop
+            thread = self._thread
+        if self._html_cache is not None:
+            LOGGER.info("页面缓存：命中 %d，未命中 %d", self._html_cache.hits, self._html_cache.misses)
+            self._html_cache.close()
+        if loop is None:
+            return
+        stats = self.stats()
+        if stats.pages:
+            LOGGER.info(
+                "浏览器池：%d 页，拦截 %d 个请求，平均每页加载 %.1f KB",
+                stats.pages,
+                stats.blocked_requests,
+                stats.loaded_bytes_per_page / 1024,
+            )
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception:
+            LOGGER.debug("关闭浏览器池失败", exc_info=True)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=10)
+        loop.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("浏览器池已关闭")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    async def _fetch(self, options: SourceContextOptions, url: str, wait_selector: str | None) -> str:
+        slots = self._page_slots.get(options.source_type)
+        if slots is None:
+            # 每个来源的页面上限：超过 max_pages 的请求在事件循环里排队。
+            slots = asyncio.Semaphore(max(1, options.max_pages))
+            self._page_slots[options.source_type] = slots
+        async with slots:
+            return await self._fetch_with_restart(options, url, wait_selector)
+
+    async def _fetch_with_restart(self, options: SourceContextOptions, url: str, wait_selector: str | None) -> str:
+        for attempt in (1, 2):
+            entry = await self._context_for(options)
+            try:
+                return await self._load_page(entry, options, url, wait_selector)
+            except Exception:
+                if attempt == 1 and entry.launch in self._dead:
+                    LOGGER.warning("浏览器已断开，重启后重试 %s", url)
+                    continue
+                raise
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def _load_page(
+        self,
+        entry: _SourceContext,
+        options: SourceContextOptions,
+        url: str,
+        wait_selector: str | None,
+    ) -> str:
+        page = await entry.context.new_page()
+        with self._lock:
+            self._stats.pages += 1
+        try:
+            policy = options.block_policy
+            if policy is not None and policy.enabled:
+                await page.route("**/*", lambda route: self._route_request(route, policy))
+            page.on("response", self._record_response)
+            if entry.shared:
+                # 共用持久化上下文时，来源相关的请求头与脚本按页面设置。
+                if options.headers:
+                    await page.set_extra_http_headers(options.headers)
+                for script in options.init_scripts:
+                    await page.add_init_script(script)
+            await page.goto(url, wait_until="domcontentloaded", timeout=PAGE_TIMEOUT_MS)
+            if wait_selector:
+                try:
+                    await page.wait_for_selector(wait_selector, timeout=PAGE_TIMEOUT_MS)
+                except Exception:  # noqa: BLE001
+                    LOGGER.debug("等待选择器 %s 超时: %s", wait_selector, url)
+            return str(await page.content())
+        finally:
+            try:
+                await page.close()
+            except Exception:
+                LOGGER.debug("关闭页面失败 %s", url, exc_info=True)
+
+    async def _route_request(self, route: Any, policy: ResourceBlockPolicy) -> None:
+        request = route.request
+        if policy.should_block(request.resource_type, request.url):
+            with self._lock:
+                self._stats.blocked_requests += 1
+                by_type = self._stats.blocked_by_type
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+            await route.abort()
+            return
+        await route.continue_()
+
+    def _record_response(self, response: Any) -> None:
+        # 以 Content-Length 计量实际加载的字节；分块传输的响应无长度，不计入。
+        try:
+            length = int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._stats.loaded_bytes += length
+
+    async def _context_for(self, options: SourceContextOptions) -> _SourceContext:
+        if self._setup_lock is None:
+            self._setup_lock = asyncio.Lock()
+        async with self._setup_lock:
+            launch = options.launch
+            if launch in self._dead:
+                await self._restart(launch)
+            entry = self._contexts.get(options.source_type)
+            if entry is not None and entry.launch == launch:
+                return entry
+            browser = self._browsers.get(launch)
+            if browser is None:
+                browser = await self._launch(launch, options)
+            if launch.user_data_dir:
+                context = browser
+                shared = True
+            else:
+                context_kwargs: dict[str, Any] = {"user_agent": options.user_agent}
+                if options.credentials:
+                    context_kwargs["http_credentials"] = options.credentials.as_dict()
+                context = await browser.new_context(**context_kwargs)
+                shared = False
+                if options.headers:
+                    await context.set_extra_http_headers(options.headers)
+                for script in options.init_scripts:
+                    await context.add_init_script(script)
+            if options.cookies and options.cookie_domain:
+                await context.add_cookies(
+                    [
+                        {"name": name, "value": value, "domain": options.cookie_domain, "path": "/"}
+                        for name, value in options.cookies.items()
+                    ]
+                )
+            entry = _SourceContext(launch=launch, context=context, shared=shared)
+            with self._lock:
+                self._contexts[options.source_type] = entry
+            return entry
+
+    async def _launch(self, launch: BrowserLaunchOptions, options: SourceContextOptions) -> Any:
+        if self._playwright is None:
+            self._playwright = await self._playwright_factory()
+        launch_kwargs: dict[str, Any] = {"headless": launch.headless}
+        if launch.executable_path:
+            launch_kwargs["executable_path"] = launch.executable_path
+        elif launch.browser_channel:
+            launch_kwargs["channel"] = launch.browser_channel
+        if launch.user_data_dir:
+            cleanup_user_data_dir(launch.user_data_dir)
+            browser = await self._playwright.chromium.launch_persistent_context(
+                launch.user_data_dir,
+                **launch_kwargs,
+                user_agent=options.user_agent,
+                http_credentials=options.credentials.as_dict() if options.credentials else None,
+            )
+            # 关闭默认空白页，避免 GUI 下残留 about:blank。
+            for page in list(browser.pages):
+                try:
+                    await page.close()
+                except Exception:
+                    LOGGER.debug("关闭默认页面失败", exc_info=True)
+            event = "close"
+        else:
+            browser = await self._playwright.chromium.launch(**launch_kwargs)
+            event = "disconnected"
+        browser.on(event, lambda *_: self._mark_dead(launch))
+        self._browsers[launch] = browser
+        with self._lock:
+            self._stats.launches += 1
+        LOGGER.info("浏览器池启动 Chromium（headless=%s）", launch.headless)
+        return browser
+
+    async def _restart(self, launch: BrowserLaunchOptions) -> None:
+        with self._lock:
+            self._stats.restarts += 1
+        browser = self._browsers.pop(launch, None)
+        with self._lock:
+            self._dead.discard(launch)
+            stale = [source for source, entry in self._contexts.items() if entry.launch == launch]
+            for source in stale:
+                self._contexts.pop(source, None)
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                LOGGER.debug("关闭已断开的浏览器失败", exc_info=True)
+
+    def _mark_dead(self, launch: BrowserLaunchOptions) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._dead.add(launch)
+        LOGGER.warning("浏览器池检测到 Chromium 断开，将在下次使用时重启")
+
+    async def _shutdown(self) -> None:
+        with self._lock:
+            contexts = [entry.context for entry in self._contexts.values() if not entry.shared]
+            self._contexts.clear()
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                LOGGER.debug("关闭浏览器上下文失败", exc_info=True)
+        for browser in list(self._browsers.values()):
+            try:
+                await browser.close()
+            except Exception:
+                LOGGER.debug("关闭浏览器失败", exc_info=True)
+        self._browsers.clear()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                LOGGER.debug("停止 Playwright 失败", exc_info=True)
+            self._playwright = None
+
+
+class SourceBrowserSession:
+    """
+    单个来源的抓取入口：复用传入的 BrowserPool；未传入时自建一个并在 close 时关闭。
+    超时读取 `<SOURCE>_FETCH_TIMEOUT_SECONDS`（默认 60 秒）；throttle_seconds 为该来源
+    共享限速器的最小请求间隔，并发抓取时同样生效。
+    浏览器池带页面缓存时先查缓存；成功抓取且不是验证页的 HTML 写回缓存。
+    """
+
+    def __init__(
+        self,
+        source_type: str,
+        *,
+        browser_pool: BrowserPool | None = None,
+        referer: str,
+        cookie_domain: str | None,
+        extra_headers: dict[str, str] | None = None,
+        wait_selector: str | None = None,
+        throttle_seconds: float = 0.0,
+    ) -> None:
+        self._source_type = source_type
+        self._pool = browser_pool or BrowserPool()
+        self._owns_pool = browser_pool is None
+        self._referer = referer
+        self._cookie_domain = cookie_domain
+        self._extra_headers = extra_headers
+        self._wait_selector = wait_selector or browser_wait_selector_for_source(source_type)
+        self._timeout_seconds = _fetch_timeout_from_env(source_type)
+        self._rate_limiter = self._pool.rate_limiter(source_type, throttle_seconds)
+        self._max_pages = browser_max_pages_for_source(source_type)
+
+    @property
+    def max_pages(self) -> int:
+        return self._max_pages
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    @property
+    def html_cache(self) -> HtmlCache | None:
+        return self._pool.html_cache
+
+    def fetch_html(
+        self,
+        url: str,
+        *,
+        referer: str | None = None,
+        throttle: bool = True,
+        cache_lookup: bool = True,
+    ) -> str:
+        """
+        throttle=False / cache_lookup=False 供调用方已为本次请求等待过限速器、查过页面缓存时使用
+        （如 HTTP 优先抓取升级到浏览器）；抓到的页面仍会写入缓存。
+        """
+        cache = self._pool.html_cache
+        if cache is not None and cache_lookup:
+            cached = cache.get(url)
+            if cached is not None:
+                return str(cached.html)
+        if throttle:
+            self._rate_limiter.wait()
+        options = source_context_options(
+            self._source_type,
+            referer=referer or self._referer,
+            cookie_domain=self._cookie_domain,
+            extra_headers=self._extra_headers,
+        )
+        html = self._pool.fetch_html(
+            options,
+            url,
+            wait_selector=self._wait_selector,
+            timeout_seconds=self._timeout_seconds,
+        )
+        if cache is not None and not looks_like_challenge(html):
+            cache.put(url, html, source=self._source_type)
+        return html
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self._pool.close()
+
+
+def iter_in_window(func: Callable[[_T], _R], items: Iterable[_T], *, max_in_flight: int) -> Iterator[_R]:
+    """
+    按输入顺序产出 func(item)，最多 max_in_flight 个同时执行（滑动窗口）。
+    max_in_flight<=1 时在当前线程串行执行；生成器提前关闭时取消尚未开始的任务。
+    """
+    if max_in_flight <= 1:
+        for item in items:
+            yield func(item)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="page-window")
+    pending: deque[Future[_R]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_feed_records(
+    entries: Iterable[NormalizedFeedEntry],
+    build: Callable[[NormalizedFeedEntry], ArticleRecord],
+    enrich: Callable[[ArticleRecord, NormalizedFeedEntry], ArticleRecord],
+    *,
+    skip_ids: Collection[str] | None = None,
+    max_in_flight: int = 1,
+) -> Iterator[ArticleRecord]:
+    """
+    爬虫共用的 iter_crawl 主体：按 feed 顺序产出 build(entry)，再经 enrich 补全。
+    entry_id 在 skip_ids 中的条目已完成，只给出基础记录，不触发节流与页面/API 请求。
+    """
+
+    def _process(entry: NormalizedFeedEntry) -> ArticleRecord:
+        record = build(entry)
+        if skip_ids and entry.entry_id in skip_ids:
+            return record
+        return enrich(record, entry)
+
+    return iter_in_window(_process, entries, max_in_flight=max_in_flight)
+
+
+async def _start_async_playwright() -> Any:
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError(
+            "Playwright 未安装。运行 `uv add playwright` 和 `uv run playwright install chromium`。"
+        ) from exc
+    return await async_playwright().start()
+
+
+def _fetch_timeout_from_env(source_type: str) -> float:
+    env_key = f"{source_type.upper()}_FETCH_TIMEOUT_SECONDS"
+    raw = os.getenv(env_key)
+    if not raw:
+        return 60.0
+    try:
+        value = float(raw)
+        return value if value > 0 else 60.0
+    except ValueError:
+        LOGGER.warning("Invalid %s value: %s", env_key, raw)
+        return 60.0
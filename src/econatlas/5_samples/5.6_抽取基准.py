@@ -0,0 +1,165 @@
+# ruff: noqa: N999
+"""
+抽取基准：对样本目录（samples/<source>/<slug>/*.html）逐页运行各来源的抽取函数，
+统计吞吐、延迟分位与峰值内存，并与同目录下的 `<样本名>.expected.json` 黄金结果比对。
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from econatlas._loader import load_local_module
+
+GOLDEN_SUFFIX = ".expected.json"
+
+Extractor = Callable[[str], dict[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class GoldenMismatch:
+    sample: Path
+    fields: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, object]:
+        return {"sample": str(self.sample), "fields": list(self.fields)}
+
+
+@dataclass(frozen=True, slots=True)
+class SourceBenchmark:
+    source_type: str
+    pages: int
+    pages_per_second: float
+    p50_ms: float
+    p95_ms: float
+    peak_memory_bytes: int
+    golden_checked: int = 0
+    mismatches: tuple[GoldenMismatch, ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "source_type": self.source_type,
+            "pages": self.pages,
+            "pages_per_second": round(self.pages_per_second, 2),
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "golden_checked": self.golden_checked,
+            "mismatches": [mismatch.to_dict() for mismatch in self.mismatches],
+        }
+
+
+def extractors_by_source() -> dict[str, Extractor]:
+    """各来源在抓取流程中实际使用的抽取函数，输出统一为可 JSON 序列化的字典。"""
+    page_mod: Any = load_local_module(__file__, "../2_enrichers/2.6_页面抽取.py", "econatlas._enricher_extract")
+    cnki_mod: Any = load_local_module(__file__, "../2_enrichers/2.3_CNKI_增强器.py", "econatlas._enricher_cnki")
+    nber_mod: Any = load_local_module(__file__, "../2_enrichers/2.4_NBER_增强器.py", "econatlas._enricher_nber")
+    oxford_mod: Any = load_local_module(__file__, "../2_enrichers/2.2_Oxford_增强器.py", "econatlas._enricher_oxford")
+
+    def _page_metadata(html: str) -> dict[str, Any]:
+        metadata = page_mod.extract_page_metadata(html)
+        return {
+            "authors": list(metadata.authors),
+            "abstract": metadata.abstract,
+            "doi": metadata.doi,
+            "published_at": metadata.published_at.isoformat() if metadata.published_at else None,
+        }
+
+    return {
+        "wiley": _page_metadata,
+        "chicago": _page_metadata,
+        "informs": _page_metadata,
+        "cnki": lambda html: {"abstract": cnki_mod._extract_abstract(html)},
+        "nber": lambda html: {"abstract": nber_mod._extract_abstract(html)},
+        "oxford": lambda html: {"authors": oxford_mod._extract_authors(html)},
+    }
+
+
+def run_extraction_benchmark(
+    samples_dir: Path,
+    *,
+    sources: Iterable[str] | None = None,
+    repeat: int = 1,
+    update_golden: bool = False,
+    extractors: dict[str, Extractor] | None = None,
+) -> list[SourceBenchmark]:
+    """
+    每个来源先计时 repeat 轮（不开 tracemalloc，避免拖慢计时），再单独跑一轮记录峰值内存与结果。
+    update_golden=True 时用本次结果覆盖黄金文件，否则只比对已有的黄金文件。
+    """
+    table = extractors if extractors is not None else extractors_by_source()
+    wanted = {source.lower() for source in sources} if sources else None
+    results: list[SourceBenchmark] = []
+    for source_type, extractor in table.items():
+        if wanted is not None and source_type not in wanted:
+            continue
+        samples = sorted((samples_dir / source_type).glob("*/*.html"))
+        if not samples:
+            continue
+        pages = [(path, path.read_text(encoding="utf-8", errors="ignore")) for path in samples]
+        results.append(_bench_source(source_type, extractor, pages, repeat=max(1, repeat), update_golden=update_golden))
+    return results
+
+
+def _bench_source(
+    source_type: str,
+    extractor: Extractor,
+    pages: list[tuple[Path, str]],
+    *,
+    repeat: int,
+    update_golden: bool,
+) -> SourceBenchmark:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _path, html in pages:
+            page_started = time.perf_counter()
+            extractor(html)
+            latencies.append(time.perf_counter() - page_started)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        outputs = [(path, extractor(html)) for path, html in pages]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    checked = 0
+    mismatches: list[GoldenMismatch] = []
+    for path, output in outputs:
+        golden_path = path.with_name(path.stem + GOLDEN_SUFFIX)
+        if update_golden:
+            golden_path.write_text(json.dumps(output, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            continue
+        if not golden_path.exists():
+            continue
+        checked += 1
+        expected = json.loads(golden_path.read_text(encoding="utf-8"))
+        diff = tuple(sorted(key for key in expected.keys() | output.keys() if expected.get(key) != output.get(key)))
+        if diff:
+            mismatches.append(GoldenMismatch(sample=path, fields=diff))
+
+    return SourceBenchmark(
+        source_type=source_type,
+        pages=len(pages),
+        pages_per_second=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        p50_ms=_percentile(latencies, 0.50) * 1000,
+        p95_ms=_percentile(latencies, 0.95) * 1000,
+        peak_memory_bytes=peak,
+        golden_checked=checked,
+        mismatches=tuple(mismatches),
+    )
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
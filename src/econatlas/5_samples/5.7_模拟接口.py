@@ -0,0 +1,358 @@
+# ruff: noqa: N999
+"""
+本地模拟接口：在 127.0.0.1 上用 http.server 模拟 DeepSeek `chat/completions`、Elsevier 按 PII 取文
+以及 ScienceDirect 风格的 RSS feed，用于在不消耗 API 配额的情况下压测翻译与增强吞吐。
+延迟分布、500/429 注入比例与每秒请求上限均可配置；超出上限时返回 429 并带 Retry-After。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Literal, Self
+from xml.sax.saxutils import escape
+
+LOGGER = logging.getLogger(__name__)
+
+LatencyDistribution = Literal["fixed", "uniform", "lognormal"]
+
+DEEPSEEK_PATH = "/chat/completions"
+ELSEVIER_PREFIX = "/content/article/pii/"
+FEED_PREFIX = "/feeds/"
+
+_ABSTRACT_TEMPLATE = (
+    "This paper studies how {topic} responds to monetary policy shocks in a panel of {count} economies. "
+    "We show that the effect is larger when credit constraints bind and that the estimates are robust "
+    "to alternative identification strategies and to the inclusion of country fixed effects."
+)
+_TOPICS = ("household consumption", "firm investment", "bank lending", "house prices", "exchange rates")
+
+
+@dataclass(frozen=True, slots=True)
+class MockApiConfig:
+    """
+    latency_ms 为延迟中位数（fixed 时即固定值）；latency_spread 对 uniform 是相对半宽，对 lognormal 是 sigma。
+    error_rate / throttle_rate 为随机返回 500 / 429 的概率；requests_per_second 为服务端限速（None 不限）。
+    """
+
+    latency: LatencyDistribution = "lognormal"
+    latency_ms: float = 200.0
+    latency_spread: float = 0.5
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    requests_per_second: float | None = None
+    retry_after_seconds: float = 1.0
+    feed_items: int = 20
+    seed: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RouteStats:
+    route: str
+    requests: int
+    statuses: dict[int, int]
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "route": self.route,
+            "requests": self.requests,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+        }
+
+
+class MockApiServer:
+    """后台线程运行的模拟服务；port=0 时由系统分配端口。可作为上下文管理器使用。"""
+
+    def __init__(self, config: MockApiConfig | None = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._config = config or MockApiConfig()
+        self._random = random.Random(self._config.seed)
+        self._lock = threading.Lock()
+        self._statuses: dict[str, Counter[int]] = {}
+        self._latencies: dict[str, list[float]] = {}
+        rate = self._config.requests_per_second
+        self._bucket_capacity = max(1.0, rate) if rate else 0.0
+        self._bucket = self._bucket_capacity
+        self._bucket_updated = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def config(self) -> MockApiConfig:
+        return self._config
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def deepseek_url(self) -> str:
+        return self.base_url + DEEPSEEK_PATH
+
+    @property
+    def elsevier_base_url(self) -> str:
+        return self.base_url + ELSEVIER_PREFIX
+
+    def feed_url(self, slug: str) -> str:
+        return f"{self.base_url}{FEED_PREFIX}{slug}.xml"
+
+    def start(self) -> Self:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-api", daemon=True)
+            self._thread.start()
+            LOGGER.info("模拟接口已启动：%s", self.base_url)
+        return self
+
+    def serve_forever(self) -> None:
+        LOGGER.info("模拟接口已启动：%s", self.base_url)
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def stats(self) -> list[RouteStats]:
+        with self._lock:
+            snapshot = {route: (Counter(counter), sorted(self._latencies.get(route, []))) for route, counter in self._statuses.items()}
+        return [
+            RouteStats(
+                route=route,
+                requests=sum(counter.values()),
+                statuses=dict(counter),
+                p50_ms=percentile(latencies, 0.50),
+                p95_ms=percentile(latencies, 0.95),
+                p99_ms=percentile(latencies, 0.99),
+            )
+            for route, (counter, latencies) in sorted(snapshot.items())
+        ]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._statuses.clear()
+            self._latencies.clear()
+
+    def _record(self, route: str, status: int, elapsed_ms: float) -> None:
+        with self._lock:
+            self._statuses.setdefault(route, Counter())[status] += 1
+            self._latencies.setdefault(route, []).append(elapsed_ms)
+
+    def _admit(self) -> float | None:
+        """令牌桶限速：放行返回 None，否则返回建议的 Retry-After 秒数。"""
+        rate = self._config.requests_per_second
+        if not rate:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._bucket = min(self._bucket_capacity, self._bucket + (now - self._bucket_updated) * rate)
+            self._bucket_updated = now
+            if self._bucket >= 1.0:
+                self._bucket -= 1.0
+                return None
+            return (1.0 - self._bucket) / rate
+
+    def _draw(self) -> tuple[float, float]:
+        with self._lock:
+            return self._random.random(), self._sample_latency_locked()
+
+    def _sample_latency_locked(self) -> float:
+        config = self._config
+        if config.latency == "fixed":
+            return max(0.0, config.latency_ms) / 1000
+        if config.latency == "uniform":
+            factor = self._random.uniform(1 - config.latency_spread, 1 + config.latency_spread)
+            return max(0.0, config.latency_ms * factor) / 1000
+        return max(0.0, config.latency_ms * math.exp(self._random.gauss(0.0, config.latency_spread))) / 1000
+
+
+def mock_abstract(index: int) -> str:
+    return _ABSTRACT_TEMPLATE.format(topic=_TOPICS[index % len(_TOPICS)], count=20 + index)
+
+
+def mock_pii(slug: str, index: int) -> str:
+    """与 ScienceDirect 相同的 17 位 PII 形态，按期刊 slug 区分。"""
+    return f"S{zlib.crc32(slug.encode('utf-8')) % 10**8:08d}{index:08d}"
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """最近秩分位数，输入需已升序排列。"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _handler_for(server: MockApiServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            # 先读完请求体，保证长连接上的下一个请求能被正确解析。
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path.split("?", 1)[0] != DEEPSEEK_PATH:
+                self._reply("other", 404, {"error": "not found"})
+                return
+            self._serve("deepseek", lambda: _deepseek_reply(body), require="Authorization")
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path.startswith(ELSEVIER_PREFIX):
+                pii = path[len(ELSEVIER_PREFIX) :].strip("/")
+                self._serve("elsevier", lambda: (200, _elsevier_reply(pii)), require="X-ELS-APIKey")
+            elif path.startswith(FEED_PREFIX) and path.endswith(".xml"):
+                slug = path[len(FEED_PREFIX) : -len(".xml")]
+                # feed 不参与注入与限速，只模拟延迟，便于压测下游。
+                self._serve("feed", lambda: (200, _feed_xml(server, slug)), inject=False)
+            else:
+                self._reply("other", 404, {"error": "not found"})
+
+        def _serve(
+            self,
+            route: str,
+            build: Any,
+            *,
+            require: str | None = None,
+            inject: bool = True,
+        ) -> None:
+            started = time.perf_counter()
+            if require and not self.headers.get(require):
+                self._reply(route, 401, {"error": "missing credentials"}, started=started)
+                return
+            if inject:
+                wait = server._admit()
+                if wait is not None:
+                    self._reply(route, 429, {"error": "rate limited"}, retry_after=wait, started=started)
+                    return
+            roll, delay = server._draw()
+            time.sleep(delay)
+            config = server.config
+            if inject and roll < config.throttle_rate:
+                self._reply(route, 429, {"error": "throttled"}, retry_after=config.retry_after_seconds, started=started)
+                return
+            if inject and roll < config.throttle_rate + config.error_rate:
+                self._reply(route, 500, {"error": "injected failure"}, started=started)
+                return
+            status, payload = build()
+            self._reply(route, status, payload, started=started)
+
+        def _reply(
+            self,
+            route: str,
+            status: int,
+            payload: dict[str, Any] | str,
+            *,
+            retry_after: float | None = None,
+            started: float | None = None,
+        ) -> None:
+            if isinstance(payload, str):
+                body, content_type = payload.encode("utf-8"), "application/rss+xml; charset=utf-8"
+            else:
+                body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if retry_after is not None:
+                self.send_header("Retry-After", f"{retry_after:.3f}")
+            self.end_headers()
+            self.wfile.write(body)
+            if started is not None:
+                server._record(route, status, (time.perf_counter() - started) * 1000)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            LOGGER.debug("mock-api " + format, *args)
+
+    return _Handler
+
+
+def _deepseek_reply(body: bytes) -> tuple[int, dict[str, Any]]:
+    try:
+        request = json.loads(body)
+        content = str(request["messages"][-1]["content"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        return 400, {"error": {"message": "invalid request"}}
+    if request.get("response_format", {}).get("type") == "json_object":
+        # 批量请求：首行为目标语言，其后为 [{"id", "text", ...}] 数组。
+        try:
+            items = json.loads(content.split("\n", 1)[1])
+        except (ValueError, IndexError):
+            return 400, {"error": {"message": "invalid batch"}}
+        reply = json.dumps(
+            {"translations": [{"id": item.get("id"), "text": _fake_translation(str(item.get("text", "")))} for item in items]},
+            ensure_ascii=False,
+        )
+    else:
+        reply = _fake_translation(content.rsplit("Translate the following abstract:\n", 1)[-1])
+    prompt_tokens = len(content) // 4 + 1
+    return 200, {
+        "id": f"mock-{zlib.crc32(body):08x}",
+        "object": "chat.completion",
+        "model": request.get("model", "deepseek-chat"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(reply), "total_tokens": prompt_tokens + len(reply)},
+    }
+
+
+def _fake_translation(text: str) -> str:
+    return f"【模拟译文】{text[:80]}"
+
+
+def _elsevier_reply(pii: str) -> dict[str, Any]:
+    index = int(pii[-8:]) if pii[-8:].isdigit() else zlib.crc32(pii.encode("utf-8")) % 1000
+    return {
+        "full-text-retrieval-response": {
+            "coredata": {
+                "dc:title": f"Mock article {pii}",
+                "prism:coverDate": "2024-01-01",
+                "dc:description": mock_abstract(index),
+                "dc:creator": [{"$": "Doe, Jane"}, {"$": "Roe, Richard"}],
+            },
+        }
+    }
+
+
+def _feed_xml(server: MockApiServer, slug: str) -> str:
+    published = format_datetime(datetime(2024, 1, 1, tzinfo=UTC))
+    items = []
+    for index in range(server.config.feed_items):
+        pii = mock_pii(slug, index)
+        link = f"https://www.sciencedirect.com/science/article/pii/{pii}"
+        items.append(
+            "<item>"
+            f"<title>Mock article {index}</title>"
+            f"<link>{escape(link)}</link>"
+            f"<guid isPermaLink=\"false\">{pii}</guid>"
+            f"<pubDate>{published}</pubDate>"
+            f"<description>{escape(mock_abstract(index))}</description>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Mock feed {escape(slug)}</title><link>{escape(server.base_url)}</link>"
+        + "".join(items)
+        + "</channel></rss>"
+    )
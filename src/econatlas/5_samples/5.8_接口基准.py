@@ -0,0 +1,146 @@
+# ruff: noqa: N999
+"""
+接口压测：用 DeepSeekTranslator / ScienceDirectApiClient 对本地模拟接口（5.7）并发发请求，
+统计每秒完成数与客户端 p50/p95/p99 延迟，并附上服务端各路由的状态码分布（含重试与 429）。
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from econatlas._loader import load_local_module
+
+_mock = load_local_module(__file__, "5.7_模拟接口.py", "econatlas._samples_mock_api")
+RouteStats = _mock.RouteStats  # type: ignore[attr-defined]
+mock_abstract = _mock.mock_abstract  # type: ignore[attr-defined]
+mock_pii = _mock.mock_pii  # type: ignore[attr-defined]
+percentile = _mock.percentile  # type: ignore[attr-defined]
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class LoadResult:
+    """operations 为客户端完成的操作数（摘要/文章）；p*_ms 为 None 表示该场景不统计单次操作延迟。"""
+
+    scenario: str
+    operations: int
+    errors: int
+    elapsed_seconds: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    server: tuple[RouteStats, ...] = field(default_factory=tuple)
+
+    @property
+    def operations_per_second(self) -> float:
+        return self.operations / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "scenario": self.scenario,
+            "operations": self.operations,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "operations_per_second": round(self.operations_per_second, 2),
+            "p50_ms": None if self.p50_ms is None else round(self.p50_ms, 3),
+            "p95_ms": None if self.p95_ms is None else round(self.p95_ms, 3),
+            "p99_ms": None if self.p99_ms is None else round(self.p99_ms, 3),
+            "server": [route.to_dict() for route in self.server],
+        }
+
+
+def run_load(
+    scenario: str,
+    operation: Callable[[_T], int],
+    items: Sequence[_T],
+    *,
+    concurrency: int,
+    server: Any | None = None,
+) -> LoadResult:
+    """
+    以 concurrency 个线程执行 operation(item)；operation 返回该次完成的操作数中失败的条数，抛异常视为整次失败。
+    每个 item 计一次延迟样本。
+    """
+    if server is not None:
+        server.reset_stats()
+    latencies: list[float] = []
+    errors = 0
+
+    def _timed(item: _T) -> tuple[float, int]:
+        started = time.perf_counter()
+        try:
+            failed = operation(item)
+        except Exception:  # noqa: BLE001
+            failed = -1
+        return (time.perf_counter() - started) * 1000, failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="api-bench") as executor:
+        outcomes = list(executor.map(_timed, items))
+    elapsed = time.perf_counter() - started
+    operations = 0
+    for (latency, failed), item in zip(outcomes, items, strict=True):
+        latencies.append(latency)
+        size = len(item) if isinstance(item, list) else 1
+        operations += size
+        errors += size if failed < 0 else failed
+    latencies.sort()
+    return LoadResult(
+        scenario=scenario,
+        operations=operations,
+        errors=errors,
+        elapsed_seconds=elapsed,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        p99_ms=percentile(latencies, 0.99),
+        server=tuple(server.stats()) if server is not None else (),
+    )
+
+
+def bench_translator(server: Any, *, requests: int, concurrency: int, batch_size: int = 1) -> LoadResult:
+    """batch_size>1 时每次调用 translate_batch 翻译一组摘要，延迟按组统计。"""
+    translation: Any = load_local_module(
+        __file__, "../3_translation/3.2_DeepSeek_翻译.py", "econatlas._deepseek"
+    )
+    translator = translation.DeepSeekTranslator(
+        "mock", api_url=server.deepseek_url, backoff_seconds=0.1, batch_size=max(1, batch_size)
+    )
+    texts = [mock_abstract(index) for index in range(requests)]
+    if batch_size <= 1:
+
+        def _translate(text: str) -> int:
+            return int(translator.translate(text, source_language="en").status != "success")
+
+        return run_load("deepseek", _translate, texts, concurrency=concurrency, server=server)
+
+    groups = [texts[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+
+    def _translate_group(group: list[str]) -> int:
+        results = translator.translate_batch(group, source_languages=["en"] * len(group))
+        return sum(1 for result in results if result.status != "success")
+
+    return run_load("deepseek-batch", _translate_group, groups, concurrency=concurrency, server=server)
+
+
+def bench_elsevier(server: Any, *, requests: int, concurrency: int) -> LoadResult:
+    enricher: Any = load_local_module(
+        __file__, "../2_enrichers/2.1_ScienceDirect_增强器.py", "econatlas._enricher_scd"
+    )
+    client = enricher.ScienceDirectApiClient(
+        enricher.ElsevierApiConfig(api_key="mock", base_url=server.elsevier_base_url, backoff_seconds=0.1)
+    )
+    piis = [mock_pii("bench", index) for index in range(requests)]
+
+    def _fetch(pii: str) -> int:
+        payload = client.fetch_by_pii(pii)
+        return int("full-text-retrieval-response" not in payload)
+
+    try:
+        return run_load("elsevier", _fetch, piis, concurrency=concurrency, server=server)
+    finally:
+        client.close()
@@ -1,5 +1,5 @@
 """
-样本相关工具：采集、浏览器抓取与环境配置、样本清单。
+样本相关工具：采集、浏览器抓取与环境配置、样本清单、共享浏览器池、抽取基准、模拟接口与接口压测。
 目录采用英文编号，文件名为中文+编号，通过此处导出便于英文导入。
 """
 
@@ -11,6 +11,10 @@ _collector = load_local_module(__file__, "5.1_样本采集.py", "econatlas._samp
 _fetcher = load_local_module(__file__, "5.2_浏览器抓取.py", "econatlas._samples_fetcher")
 _env = load_local_module(__file__, "5.3_浏览器环境.py", "econatlas._samples_env")
 _inventory = load_local_module(__file__, "5.4_样本清单.py", "econatlas._samples_inventory")
+_browser_pool = load_local_module(__file__, "5.5_浏览器池.py", "econatlas._samples_browser_pool")
+_bench = load_local_module(__file__, "5.6_抽取基准.py", "econatlas._samples_bench")
+_mock_api = load_local_module(__file__, "5.7_模拟接口.py", "econatlas._samples_mock_api")
+_api_bench = load_local_module(__file__, "5.8_接口基准.py", "econatlas._samples_api_bench")
 
 SampleCollector = _collector.SampleCollector
 SampleCollectorReport = _collector.SampleCollectorReport
@@ -29,6 +33,9 @@ browser_init_scripts_for_source = _env.browser_init_scripts_for_source
 browser_local_storage_for_source = _env.browser_local_storage_for_source
 browser_user_data_dir_for_source = _env.browser_user_data_dir_for_source
 browser_headless_for_source = _env.browser_headless_for_source
+browser_max_pages_for_source = _env.browser_max_pages_for_source
+browser_block_policy_for_source = _env.browser_block_policy_for_source
+ResourceBlockPolicy = _env.ResourceBlockPolicy
 browser_launch_overrides = _env.browser_launch_overrides
 cookies_for_source = _env.cookies_for_source
 rewrite_sciencedirect_url = _env.rewrite_sciencedirect_url
@@ -40,6 +47,32 @@ SourceInventory = _inventory.SourceInventory
 JournalInventory = _inventory.JournalInventory
 build_inventory = _inventory.build_inventory
 
+BrowserPool = _browser_pool.BrowserPool
+BrowserPoolStats = _browser_pool.BrowserPoolStats
+BrowserLaunchOptions = _browser_pool.BrowserLaunchOptions
+SourceContextOptions = _browser_pool.SourceContextOptions
+SourceBrowserSession = _browser_pool.SourceBrowserSession
+source_context_options = _browser_pool.source_context_options
+RateLimiter = _browser_pool.RateLimiter
+iter_in_window = _browser_pool.iter_in_window
+iter_feed_records = _browser_pool.iter_feed_records
+
+SourceBenchmark = _bench.SourceBenchmark
+GoldenMismatch = _bench.GoldenMismatch
+run_extraction_benchmark = _bench.run_extraction_benchmark
+extractors_by_source = _bench.extractors_by_source
+
+MockApiServer = _mock_api.MockApiServer
+MockApiConfig = _mock_api.MockApiConfig
+RouteStats = _mock_api.RouteStats
+mock_abstract = _mock_api.mock_abstract
+mock_pii = _mock_api.mock_pii
+
+LoadResult = _api_bench.LoadResult
+run_load = _api_bench.run_load
+bench_translator = _api_bench.bench_translator
+bench_elsevier = _api_bench.bench_elsevier
+
 __all__ = [
     "SampleCollector",
     "SampleCollectorReport",
@@ -56,6 +89,9 @@ __all__ = [
     "browser_local_storage_for_source",
     "browser_user_data_dir_for_source",
     "browser_headless_for_source",
+    "browser_max_pages_for_source",
+    "browser_block_policy_for_source",
+    "ResourceBlockPolicy",
     "browser_launch_overrides",
     "cookies_for_source",
     "rewrite_sciencedirect_url",
@@ -65,4 +101,26 @@ __all__ = [
     "SourceInventory",
     "JournalInventory",
     "build_inventory",
+    "BrowserPool",
+    "BrowserPoolStats",
+    "BrowserLaunchOptions",
+    "SourceContextOptions",
+    "SourceBrowserSession",
+    "source_context_options",
+    "RateLimiter",
+    "iter_feed_records",
+    "iter_in_window",
+    "SourceBenchmark",
+    "GoldenMismatch",
+    "run_extraction_benchmark",
+    "extractors_by_source",
+    "MockApiServer",
+    "MockApiConfig",
+    "RouteStats",
+    "mock_abstract",
+    "mock_pii",
+    "LoadResult",
+    "run_load",
+    "bench_translator",
+    "bench_elsevier",
 ]
@@ -10,14 +10,18 @@ import json
 import logging
 import shutil
 import os
+import queue
+import tempfile
+import threading
 import time
 import http.server
 import functools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import StringIO
 from pathlib import Path
-from typing import Any, Iterable, Literal, Optional, cast
+from typing import Annotated, Any, Iterable, Literal, Optional, cast
 from urllib.parse import quote_plus, urlparse
 
 import typer
@@ -27,7 +31,7 @@ from slugify import slugify
 
 from econatlas.config import SettingsError, build_settings
 from econatlas.models import ArticleRecord, TranslationRecord, JournalSource
-from econatlas.feeds import FeedClient, JournalListLoader, ALLOWED_SOURCE_TYPES
+from econatlas.feeds import FeedCache, FeedClient, FeedNotModified, JournalListLoader, ALLOWED_SOURCE_TYPES
 from econatlas.crawlers import (
     ScienceDirect爬虫,
     Oxford爬虫,
@@ -39,19 +43,29 @@ from econatlas.crawlers import (
     Informs爬虫,
 )
 
-from econatlas.storage import JournalStore
+from econatlas.storage import JournalStore, SqliteJournalStore, ProgressJournal, html_cache_from_env
 from econatlas.translation import (
     Translator,
     TranslationResult,
     skipped_translation,
     detect_language,
     NoOpTranslator,
-    DeepSeekTranslator,
+    AsyncTranslationEngine,
+    TranslationMemory,
+    translate_texts,
+    run_backfill,
 )
 from econatlas.samples import (
+    BrowserPool,
     SampleCollector,
     SampleCollectorReport,
     build_inventory,
+    run_extraction_benchmark,
+    MockApiConfig,
+    MockApiServer,
+    LoadResult,
+    bench_translator,
+    bench_elsevier,
 )
 
 
@@ -93,7 +107,13 @@ app = typer.Typer(help="econ-atlas CLI")
 crawl_app = typer.Typer(help="运行 RSS 抓取")
 samples_app = typer.Typer(help="采集/导入/清点 HTML 样本")
 viewer_app = typer.Typer(help="本地静态查看器（浏览 data/*.json）")
+store_app = typer.Typer(help="存储后端维护（SQLite 导出等）")
+translate_app = typer.Typer(help="翻译维护（离线补译、翻译记忆）")
+memory_app = typer.Typer(help="翻译记忆：统计、清理与导出")
 LOGGER = logging.getLogger(__name__)
+FEED_CACHE_DIR = Path(".cache/feeds")
+HTML_CACHE_DIR = Path(".cache/html")
+TRANSLATION_MEMORY_PATH = Path(".cache/translation_memory.sqlite3")
 
 
 def main() -> None:
@@ -128,6 +148,44 @@ def crawl(
         Path(".cache/crawl_progress.json"),
         help="进度文件路径，默认开启断点续跑。",
     ),
+    store_backend: Literal["json", "sqlite"] = typer.Option(
+        "json", "--store", help="存储后端：json（直接写 data/*.json）或 sqlite。", case_sensitive=False
+    ),
+    db_path: Annotated[Path, typer.Option(help="SQLite 数据库路径（--store sqlite 时使用）。")] = Path(
+        "data/econatlas.sqlite3"
+    ),
+    max_lanes: int = typer.Option(
+        len(ALLOWED_SOURCE_TYPES),
+        "--max-lanes",
+        min=1,
+        help="同时运行的来源通道上限（每个来源一条通道，1 为串行）。",
+    ),
+    refresh_feeds: bool = typer.Option(
+        False,
+        "--refresh-feeds",
+        help="忽略 feed 缓存（ETag/Last-Modified/内容哈希），强制重新处理所有期刊。",
+    ),
+    prefetch_concurrency: int = typer.Option(
+        8,
+        "--prefetch-concurrency",
+        min=0,
+        help="运行开始时并发预取 feed 的并发数（0 关闭预取）。",
+    ),
+    html_cache: bool = typer.Option(
+        True,
+        "--html-cache/--no-html-cache",
+        help="缓存抓取到的文章页 HTML（.cache/html），TTL 内重复运行不再联网。",
+    ),
+    reuse_stale_html: bool = typer.Option(
+        False,
+        "--reuse-stale-html",
+        help="忽略页面缓存 TTL，直接用已缓存 HTML 重新抽取（修复解析规则后使用）。",
+    ),
+    translation_memory: bool = typer.Option(
+        True,
+        "--translation-memory/--no-translation-memory",
+        help="复用翻译记忆（.cache/translation_memory.sqlite3），相同摘要不再重复调用翻译接口。",
+    ),
 ) -> None:
     """全量抓取入口。"""
     if ctx.invoked_subcommand:
@@ -155,12 +213,15 @@ def crawl(
             fg=typer.colors.YELLOW,
         )
 
-    translator: NoOpTranslator | DeepSeekTranslator
+    translator: NoOpTranslator | AsyncTranslationEngine
+    memory: TranslationMemory | None = None
     if settings.skip_translation:
         translator = NoOpTranslator()
     else:
         assert settings.deepseek_api_key is not None
-        translator = DeepSeekTranslator(api_key=settings.deepseek_api_key)
+        memory = TranslationMemory(TRANSLATION_MEMORY_PATH) if translation_memory else None
+        # 异步引擎自带并发与限速，翻译不再按固定间隔串行等待。
+        translator = AsyncTranslationEngine(api_key=settings.deepseek_api_key, memory=memory)
 
     journals = JournalListLoader(settings.list_path).load()
     if settings.include_sources:
@@ -171,19 +232,33 @@ def crawl(
         typer.secho("无匹配的期刊可抓取。", fg=typer.colors.YELLOW)
         raise typer.Exit(code=1)
 
-    feed_client = FeedClient()
-    store = JournalStore(settings.output_dir)
-    report = _run_once(
-        journals=journals,
-        feed_client=feed_client,
-        translator=translator,
-        store=store,
-        scd_api_key=settings.elsevier_api_key,
-        scd_inst_token=settings.elsevier_inst_token,
-        skip_translation=settings.skip_translation,
-        progress_path=progress_path,
-    )
+    feed_client = FeedClient(feed_cache=FeedCache(FEED_CACHE_DIR), refresh=refresh_feeds)
+    store = _build_store(store_backend, output_dir=settings.output_dir, db_path=db_path)
+    try:
+        report = _run_once(
+            journals=journals,
+            feed_client=feed_client,
+            translator=translator,
+            store=store,
+            scd_api_key=settings.elsevier_api_key,
+            scd_inst_token=settings.elsevier_inst_token,
+            skip_translation=settings.skip_translation,
+            progress_path=progress_path,
+            max_lanes=max_lanes,
+            prefetch_concurrency=prefetch_concurrency,
+            html_cache_dir=HTML_CACHE_DIR if html_cache else None,
+            reuse_stale_html=reuse_stale_html,
+        )
+    finally:
+        if isinstance(translator, AsyncTranslationEngine):
+            translator.close()
+        if memory is not None:
+            memory.close()
     _print_report(report)
+    if isinstance(store, SqliteJournalStore):
+        # 查看器读取 data/*.json，SQLite 后端需导出本轮涉及的期刊。
+        _export_sqlite_archives(store, journals, output_dir=settings.output_dir)
+        store.close()
     # 默认自动更新本地查看器索引，避免用户手动执行 viewer build。
     try:
         _build_viewer_index(list_path=settings.list_path, data_dir=settings.output_dir, viewer_dir=Path("viewer"))
@@ -213,6 +288,44 @@ def crawl_publisher(
         Path(".cache/crawl_progress.json"),
         help="进度文件路径，默认开启断点续跑。",
     ),
+    store_backend: Literal["json", "sqlite"] = typer.Option(
+        "json", "--store", help="存储后端：json（直接写 data/*.json）或 sqlite。", case_sensitive=False
+    ),
+    db_path: Annotated[Path, typer.Option(help="SQLite 数据库路径（--store sqlite 时使用）。")] = Path(
+        "data/econatlas.sqlite3"
+    ),
+    max_lanes: int = typer.Option(
+        len(ALLOWED_SOURCE_TYPES),
+        "--max-lanes",
+        min=1,
+        help="同时运行的来源通道上限（每个来源一条通道，1 为串行）。",
+    ),
+    refresh_feeds: bool = typer.Option(
+        False,
+        "--refresh-feeds",
+        help="忽略 feed 缓存（ETag/Last-Modified/内容哈希），强制重新处理所有期刊。",
+    ),
+    prefetch_concurrency: int = typer.Option(
+        8,
+        "--prefetch-concurrency",
+        min=0,
+        help="运行开始时并发预取 feed 的并发数（0 关闭预取）。",
+    ),
+    html_cache: bool = typer.Option(
+        True,
+        "--html-cache/--no-html-cache",
+        help="缓存抓取到的文章页 HTML（.cache/html），TTL 内重复运行不再联网。",
+    ),
+    reuse_stale_html: bool = typer.Option(
+        False,
+        "--reuse-stale-html",
+        help="忽略页面缓存 TTL，直接用已缓存 HTML 重新抽取（修复解析规则后使用）。",
+    ),
+    translation_memory: bool = typer.Option(
+        True,
+        "--translation-memory/--no-translation-memory",
+        help="复用翻译记忆（.cache/translation_memory.sqlite3），相同摘要不再重复调用翻译接口。",
+    ),
 ) -> None:
     """按单一出版商运行抓取。"""
     normalized_source = source.strip().lower()
@@ -240,12 +353,15 @@ def crawl_publisher(
             fg=typer.colors.YELLOW,
         )
 
-    translator: NoOpTranslator | DeepSeekTranslator
+    translator: NoOpTranslator | AsyncTranslationEngine
+    memory: TranslationMemory | None = None
     if settings.skip_translation:
         translator = NoOpTranslator()
     else:
         assert settings.deepseek_api_key is not None
-        translator = DeepSeekTranslator(api_key=settings.deepseek_api_key)
+        memory = TranslationMemory(TRANSLATION_MEMORY_PATH) if translation_memory else None
+        # 异步引擎自带并发与限速，翻译不再按固定间隔串行等待。
+        translator = AsyncTranslationEngine(api_key=settings.deepseek_api_key, memory=memory)
 
     journals = JournalListLoader(settings.list_path).load()
     journals = [j for j in journals if j.source_type == normalized_source]
@@ -255,19 +371,33 @@ def crawl_publisher(
         typer.secho("无匹配的期刊可抓取。", fg=typer.colors.YELLOW)
         raise typer.Exit(code=1)
 
-    feed_client = FeedClient()
-    store = JournalStore(settings.output_dir)
-    report = _run_once(
-        journals=journals,
-        feed_client=feed_client,
-        translator=translator,
-        store=store,
-        scd_api_key=settings.elsevier_api_key,
-        scd_inst_token=settings.elsevier_inst_token,
-        skip_translation=settings.skip_translation,
-        progress_path=progress_path,
-    )
+    feed_client = FeedClient(feed_cache=FeedCache(FEED_CACHE_DIR), refresh=refresh_feeds)
+    store = _build_store(store_backend, output_dir=settings.output_dir, db_path=db_path)
+    try:
+        report = _run_once(
+            journals=journals,
+            feed_client=feed_client,
+            translator=translator,
+            store=store,
+            scd_api_key=settings.elsevier_api_key,
+            scd_inst_token=settings.elsevier_inst_token,
+            skip_translation=settings.skip_translation,
+            progress_path=progress_path,
+            max_lanes=max_lanes,
+            prefetch_concurrency=prefetch_concurrency,
+            html_cache_dir=HTML_CACHE_DIR if html_cache else None,
+            reuse_stale_html=reuse_stale_html,
+        )
+    finally:
+        if isinstance(translator, AsyncTranslationEngine):
+            translator.close()
+        if memory is not None:
+            memory.close()
     _print_report(report)
+    if isinstance(store, SqliteJournalStore):
+        # 查看器读取 data/*.json，SQLite 后端需导出本轮涉及的期刊。
+        _export_sqlite_archives(store, journals, output_dir=settings.output_dir)
+        store.close()
     # 默认自动更新本地查看器索引，避免用户手动执行 viewer build。
     try:
         _build_viewer_index(list_path=settings.list_path, data_dir=settings.output_dir, viewer_dir=Path("viewer"))
@@ -279,6 +409,9 @@ def crawl_publisher(
 app.add_typer(crawl_app, name="crawl")
 app.add_typer(samples_app, name="samples")
 app.add_typer(viewer_app, name="viewer")
+app.add_typer(store_app, name="store")
+app.add_typer(translate_app, name="translate")
+translate_app.add_typer(memory_app, name="memory")
 
 
 @samples_app.command("collect")
@@ -309,8 +442,13 @@ def collect_samples(
         typer.secho("未匹配到指定来源的期刊。", fg=typer.colors.YELLOW)
         raise typer.Exit(code=1)
 
-    collector = SampleCollector(feed_client=FeedClient(), sciencedirect_debug=sciencedirect_debug)
-    report = collector.collect(filtered, limit_per_journal=limit, output_dir=output_dir)
+    feed_client = FeedClient()
+    collector = SampleCollector(feed_client=feed_client, sciencedirect_debug=sciencedirect_debug)
+    try:
+        report = collector.collect(filtered, limit_per_journal=limit, output_dir=output_dir)
+    finally:
+        collector.close()
+        feed_client.close()
     _print_sample_summary(report)
     if report.failures:
         raise typer.Exit(code=1)
@@ -364,6 +502,413 @@ def inventory_samples(
         typer.echo(content)
 
 
+@samples_app.command("bench")
+def bench_samples(
+    samples_dir: Annotated[Path, typer.Option(help="样本目录。")] = Path("samples"),
+    include_source: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--include-source",
+            "-s",
+            help="仅测试指定来源（默认全部有抽取函数的来源）。",
+        ),
+    ] = None,
+    repeat: int = typer.Option(3, "--repeat", min=1, help="计时轮数。"),
+    update_golden: bool = typer.Option(
+        False,
+        "--update-golden",
+        help="用本次抽取结果覆盖 <样本名>.expected.json 黄金文件。",
+    ),
+    output_format: Literal["table", "json"] = typer.Option(
+        "table", "--format", help="输出格式。", case_sensitive=False
+    ),
+) -> None:
+    """对样本 HTML 运行抽取基准，并与黄金结果比对（有差异时退出码为 1）。"""
+    results = run_extraction_benchmark(
+        samples_dir,
+        sources=include_source,
+        repeat=repeat,
+        update_golden=update_golden,
+    )
+    if not results:
+        typer.secho("未找到可测试的样本。请先运行 `samples collect`。", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+    if output_format.lower() == "json":
+        typer.echo(json.dumps([result.to_dict() for result in results], ensure_ascii=False, indent=2))
+    else:
+        typer.echo(f"{'source':<10} {'pages':>6} {'pages/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'peak KB':>9} {'golden':>9}")
+        for result in results:
+            golden = f"{result.golden_checked - len(result.mismatches)}/{result.golden_checked}"
+            typer.echo(
+                f"{result.source_type:<10} {result.pages:>6} {result.pages_per_second:>9.1f} "
+                f"{result.p50_ms:>8.2f} {result.p95_ms:>8.2f} {result.peak_memory_bytes / 1024:>9.1f} {golden:>9}"
+            )
+        for result in results:
+            for mismatch in result.mismatches:
+                typer.secho(f"[差异] {mismatch.sample}: {', '.join(mismatch.fields)}", fg=typer.colors.RED)
+    if any(result.mismatches for result in results):
+        raise typer.Exit(code=1)
+
+
+@samples_app.command("mock-server")
+def mock_api_server(
+    host: str = typer.Option("127.0.0.1", help="监听地址。"),
+    port: int = typer.Option(8900, help="监听端口。"),
+    latency: Literal["fixed", "uniform", "lognormal"] = typer.Option("lognormal", help="延迟分布。"),
+    latency_ms: float = typer.Option(200.0, "--latency-ms", min=0, help="延迟中位数（毫秒）。"),
+    latency_spread: float = typer.Option(0.5, "--latency-spread", min=0, help="uniform 的相对半宽 / lognormal 的 sigma。"),
+    error_rate: float = typer.Option(0.0, "--error-rate", min=0, max=1, help="随机返回 500 的概率。"),
+    throttle_rate: float = typer.Option(0.0, "--throttle-rate", min=0, max=1, help="随机返回 429 的概率。"),
+    rps: float | None = typer.Option(None, "--rps", min=0.1, help="服务端每秒请求上限，超出返回 429。"),
+    seed: int | None = typer.Option(None, "--seed", help="随机种子。"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="开启详细日志。"),
+) -> None:
+    """启动本地模拟 DeepSeek / Elsevier 接口，供手动压测（Ctrl-C 退出）。"""
+    _configure_logging(verbose)
+    config = MockApiConfig(
+        latency=latency,
+        latency_ms=latency_ms,
+        latency_spread=latency_spread,
+        error_rate=error_rate,
+        throttle_rate=throttle_rate,
+        requests_per_second=rps,
+        seed=seed,
+    )
+    server = MockApiServer(config, host=host, port=port)
+    typer.echo(f"DEEPSEEK_API_URL={server.deepseek_url}")
+    typer.echo(f"ELSEVIER_API_BASE_URL={server.elsevier_base_url}")
+    typer.echo(f"示例 feed：{server.feed_url('demo')}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+@samples_app.command("api-bench")
+def api_bench(
+    scenario: Annotated[
+        list[str] | None,
+        typer.Option("--scenario", "-S", help="压测场景：deepseek / elsevier / crawl（默认全部）。"),
+    ] = None,
+    requests: int = typer.Option(200, "--requests", min=1, help="deepseek / elsevier 场景的请求条数。"),
+    concurrency: int = typer.Option(8, "--concurrency", min=1, help="客户端并发线程数。"),
+    batch_size: int = typer.Option(1, "--batch-size", min=1, help="deepseek 场景每次翻译的摘要数（>1 走批量接口）。"),
+    journals: int = typer.Option(2, "--journals", min=1, help="crawl 场景的模拟期刊数。"),
+    feed_items: int = typer.Option(20, "--feed-items", min=1, help="crawl 场景每个 feed 的条目数。"),
+    latency: Literal["fixed", "uniform", "lognormal"] = typer.Option("lognormal", help="延迟分布。"),
+    latency_ms: float = typer.Option(200.0, "--latency-ms", min=0, help="延迟中位数（毫秒）。"),
+    latency_spread: float = typer.Option(0.5, "--latency-spread", min=0, help="uniform 的相对半宽 / lognormal 的 sigma。"),
+    error_rate: float = typer.Option(0.0, "--error-rate", min=0, max=1, help="随机返回 500 的概率。"),
+    throttle_rate: float = typer.Option(0.0, "--throttle-rate", min=0, max=1, help="随机返回 429 的概率。"),
+    rps: float | None = typer.Option(None, "--rps", min=0.1, help="服务端每秒请求上限，超出返回 429。"),
+    seed: int | None = typer.Option(None, "--seed", help="随机种子。"),
+    output_format: Literal["table", "json"] = typer.Option(
+        "table", "--format", help="输出格式。", case_sensitive=False
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="开启详细日志。"),
+) -> None:
+    """对本地模拟接口压测翻译、Elsevier 增强与抓取流程，输出每秒完成数与尾延迟（不消耗 API 配额）。"""
+    _configure_logging(verbose)
+    scenarios = [value.strip().lower() for value in scenario or ["deepseek", "elsevier", "crawl"]]
+    invalid = set(scenarios) - {"deepseek", "elsevier", "crawl"}
+    if invalid:
+        raise typer.BadParameter(f"Invalid scenarios: {', '.join(sorted(invalid))}")
+    config = MockApiConfig(
+        latency=latency,
+        latency_ms=latency_ms,
+        latency_spread=latency_spread,
+        error_rate=error_rate,
+        throttle_rate=throttle_rate,
+        requests_per_second=rps,
+        feed_items=feed_items,
+        seed=seed,
+    )
+    results: list[LoadResult] = []
+    with MockApiServer(config) as server:
+        for name in scenarios:
+            if name == "deepseek":
+                results.append(
+                    bench_translator(server, requests=requests, concurrency=concurrency, batch_size=batch_size)
+                )
+            elif name == "elsevier":
+                results.append(bench_elsevier(server, requests=requests, concurrency=concurrency))
+            else:
+                results.append(_bench_crawl(server, journal_count=journals))
+    if output_format.lower() == "json":
+        typer.echo(json.dumps([result.to_dict() for result in results], ensure_ascii=False, indent=2))
+        return
+
+    def _ms(value: float | None) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    typer.echo(f"{'scenario':<15} {'ops':>6} {'errors':>6} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        typer.echo(
+            f"{result.scenario:<15} {result.operations:>6} {result.errors:>6} {result.operations_per_second:>8.1f} "
+            f"{_ms(result.p50_ms):>8} {_ms(result.p95_ms):>8} {_ms(result.p99_ms):>8}"
+        )
+        for route in result.server:
+            statuses = " ".join(f"{status}×{count}" for status, count in sorted(route.statuses.items()))
+            typer.echo(
+                f"  └ {route.route:<10} {route.requests:>6} 次  p50 {route.p50_ms:.1f} / p95 {route.p95_ms:.1f} "
+                f"/ p99 {route.p99_ms:.1f} ms  [{statuses}]"
+            )
+
+
+def _bench_crawl(server: MockApiServer, *, journal_count: int) -> LoadResult:
+    """用模拟 feed + Elsevier + DeepSeek 跑一遍 _run_once（ScienceDirect 通道），按文章数计吞吐。"""
+    journals = [
+        JournalSource(
+            name=f"Mock journal {index}",
+            rss_url=server.feed_url(f"mock-{index}"),
+            slug=f"mock-{index}",
+            source_type="sciencedirect",
+        )
+        for index in range(journal_count)
+    ]
+    server.reset_stats()
+    # 模拟接口不需要按真实站点节流；Elsevier 地址由环境变量传给 ScienceDirect 爬虫。
+    overrides = {"ELSEVIER_API_BASE_URL": server.elsevier_base_url, "SCIENCEDIRECT_THROTTLE_SECONDS": "0"}
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    translator = AsyncTranslationEngine(api_key="mock", api_url=server.deepseek_url, backoff_seconds=0.1)
+    started = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory(prefix="econatlas-bench-") as workdir:
+            report = _run_once(
+                journals=journals,
+                feed_client=FeedClient(),
+                translator=translator,
+                store=JournalStore(Path(workdir) / "data"),
+                scd_api_key="mock",
+                scd_inst_token=None,
+                skip_translation=False,
+                progress_path=Path(workdir) / "progress.json",
+            )
+    finally:
+        translator.close()
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    elapsed = time.perf_counter() - started
+    return LoadResult(
+        scenario="crawl",
+        operations=sum(result.fetched for result in report.results),
+        errors=report.total_translation_failures + len(report.errors),
+        elapsed_seconds=elapsed,
+        p50_ms=None,
+        p95_ms=None,
+        p99_ms=None,
+        server=tuple(server.stats()),
+    )
+
+
+@store_app.command("export")
+def export_store(
+    list_path: Annotated[Path, typer.Option(exists=True, help="期刊列表 CSV 路径。")] = Path("list.csv"),
+    db_path: Annotated[Path, typer.Option(exists=True, help="SQLite 数据库路径。")] = Path("data/econatlas.sqlite3"),
+    output_dir: Annotated[Path, typer.Option(help="期刊 JSON 输出目录。")] = Path("data"),
+    include_slug: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--include-slug",
+            "-j",
+            help="仅导出指定 slug。",
+        ),
+    ] = None,
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="开启详细日志。"),
+) -> None:
+    """从 SQLite 重新生成 data/*.json 与 viewer/index.json。"""
+    _configure_logging(verbose)
+    journals = JournalListLoader(list_path).load()
+    slug_filter = _normalize_slug_filter(include_slug)
+    if slug_filter:
+        journals = [j for j in journals if j.slug in slug_filter]
+    store = SqliteJournalStore(db_path)
+    try:
+        exported = _export_sqlite_archives(store, journals, output_dir=output_dir)
+    finally:
+        store.close()
+    typer.echo(f"已导出 {exported} 个期刊到 {output_dir}")
+    try:
+        _build_viewer_index(list_path=list_path, data_dir=output_dir, viewer_dir=Path("viewer"))
+    except Exception:
+        LOGGER.debug("生成 viewer/index.json 失败", exc_info=True)
+
+
+@translate_app.command("backfill")
+def backfill_translations(
+    list_path: Annotated[Path, typer.Option(exists=True, help="期刊列表 CSV 路径。")] = Path("list.csv"),
+    output_dir: Annotated[Path, typer.Option(help="期刊 JSON 目录。")] = Path("data"),
+    store_backend: Literal["json", "sqlite"] = typer.Option(
+        "json", "--store", help="存储后端：json 或 sqlite。", case_sensitive=False
+    ),
+    db_path: Annotated[Path, typer.Option(help="SQLite 数据库路径（--store sqlite 时使用）。")] = Path(
+        "data/econatlas.sqlite3"
+    ),
+    source: Annotated[list[str] | None, typer.Option("--source", "-s", help="仅补译指定来源类型。")] = None,
+    include_slug: Annotated[list[str] | None, typer.Option("--include-slug", "-j", help="仅补译指定 slug。")] = None,
+    since: str | None = typer.Option(None, "--since", help="仅补译该日期（ISO 格式）之后发表的条目。"),
+    limit: int | None = typer.Option(None, "--limit", min=1, help="本轮最多补译条数。"),
+    token_budget: int | None = typer.Option(
+        None, "--token-budget", min=1, help="本轮原文估算 token 上限，用尽后停止提交。"
+    ),
+    concurrency: int | None = typer.Option(
+        None, "--concurrency", min=1, help="同时在途的翻译请求数（默认 TRANSLATION_MAX_IN_FLIGHT）。"
+    ),
+    batch_size: int = typer.Option(16, "--batch-size", min=1, help="每组条数；每组翻译完成即写回一次。"),
+    progress_path: Annotated[Path, typer.Option(help="补译进度文件，已尝试过的条目在续跑时跳过。")] = Path(
+        ".cache/backfill_progress.json"
+    ),
+    reset_progress: bool = typer.Option(False, "--reset-progress", help="清空补译进度，重新尝试此前失败的条目。"),
+    translation_memory: bool = typer.Option(
+        True, "--translation-memory/--no-translation-memory", help="复用翻译记忆。"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="开启详细日志。"),
+) -> None:
+    """补译已存档案中 failed/skipped 的非中文摘要，不访问 feed 与浏览器。"""
+    _configure_logging(verbose)
+    load_dotenv()
+    since_at = _parse_iso_datetime(since)
+    if since and since_at is None:
+        typer.secho(f"无法解析 --since：{since}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    try:
+        settings = build_settings(
+            list_path=list_path,
+            output_dir=output_dir,
+            include_slugs=_normalize_slug_filter(include_slug),
+            include_sources=_normalize_crawl_sources(source),
+            skip_translation=False,
+        )
+    except SettingsError as exc:
+        typer.secho(str(exc), fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1) from exc
+    assert settings.deepseek_api_key is not None
+
+    journals = JournalListLoader(settings.list_path).load()
+    if settings.include_sources:
+        journals = [j for j in journals if j.source_type in settings.include_sources]
+    if settings.include_slugs:
+        journals = [j for j in journals if j.slug in settings.include_slugs]
+    if not journals:
+        typer.secho("无匹配的期刊可补译。", fg=typer.colors.YELLOW)
+        raise typer.Exit(code=1)
+
+    if reset_progress:
+        progress_path.unlink(missing_ok=True)
+        progress_path.with_suffix(".log").unlink(missing_ok=True)
+    progress = ProgressJournal(progress_path)
+    memory = TranslationMemory(TRANSLATION_MEMORY_PATH) if translation_memory else None
+    translator = AsyncTranslationEngine(api_key=settings.deepseek_api_key, max_in_flight=concurrency, memory=memory)
+    # SQLite 后端不从 JSON 导入：只补译库中已有的条目。
+    store = SqliteJournalStore(db_path) if store_backend.lower() == "sqlite" else JournalStore(settings.output_dir)
+    try:
+        report = run_backfill(
+            store,
+            journals,
+            translator,
+            since=since_at,
+            limit=limit,
+            token_budget=token_budget,
+            batch_size=batch_size,
+            progress=progress,
+        )
+        if isinstance(store, SqliteJournalStore):
+            _export_sqlite_archives(store, [j for j in journals if j.slug in report.journals], output_dir=settings.output_dir)
+    finally:
+        translator.close()
+        progress.close()
+        if memory is not None:
+            memory.close()
+        if isinstance(store, SqliteJournalStore):
+            store.close()
+    typer.echo(
+        f"扫描 {report.scanned} 条，待补译 {report.candidates} 条；成功 {report.translated}，失败 {report.failed}"
+    )
+    if report.budget_exhausted:
+        typer.secho("已达 token 预算，剩余条目留待下次补译。", fg=typer.colors.YELLOW)
+    if report.translated:
+        try:
+            _build_viewer_index(list_path=settings.list_path, data_dir=settings.output_dir, viewer_dir=Path("viewer"))
+        except Exception:
+            LOGGER.debug("生成 viewer/index.json 失败", exc_info=True)
+    raise typer.Exit(code=0 if not report.failed else 1)
+
+
+@memory_app.command("stats")
+def memory_stats(
+    db_path: Annotated[Path, typer.Option(help="翻译记忆数据库路径。")] = TRANSLATION_MEMORY_PATH,
+) -> None:
+    """显示翻译记忆条目数与累计命中次数。"""
+    memory = TranslationMemory(db_path)
+    try:
+        stats = memory.stats()
+    finally:
+        memory.close()
+    typer.echo(f"条目 {stats.entries}，累计命中 {stats.stored_hits}（{db_path}）")
+
+
+@memory_app.command("evict")
+def memory_evict(
+    db_path: Annotated[Path, typer.Option(help="翻译记忆数据库路径。")] = TRANSLATION_MEMORY_PATH,
+    older_than_days: float | None = typer.Option(None, "--older-than-days", min=0, help="删除超过 N 天未使用的条目。"),
+    max_entries: int | None = typer.Option(None, "--max-entries", min=0, help="按最久未用裁剪到 N 条。"),
+) -> None:
+    """清理翻译记忆。"""
+    if older_than_days is None and max_entries is None:
+        typer.secho("请指定 --older-than-days 或 --max-entries。", fg=typer.colors.YELLOW, err=True)
+        raise typer.Exit(code=1)
+    memory = TranslationMemory(db_path)
+    try:
+        removed = memory.evict(older_than_days=older_than_days, max_entries=max_entries)
+        remaining = memory.stats().entries
+    finally:
+        memory.close()
+    typer.echo(f"已删除 {removed} 条，剩余 {remaining} 条")
+
+
+@memory_app.command("export")
+def memory_export(
+    output: Annotated[Path, typer.Argument(help="输出 JSONL 文件路径。")],
+    db_path: Annotated[Path, typer.Option(help="翻译记忆数据库路径。")] = TRANSLATION_MEMORY_PATH,
+) -> None:
+    """把翻译记忆导出为 JSONL（原文、译文、模型与提示词版本）。"""
+    memory = TranslationMemory(db_path)
+    try:
+        count = memory.export(output)
+    finally:
+        memory.close()
+    typer.echo(f"已导出 {count} 条到 {output}")
+
+
+def _build_store(backend: str, *, output_dir: Path, db_path: Path) -> Any:
+    json_store = JournalStore(output_dir)
+    if backend.lower() == "sqlite":
+        return SqliteJournalStore(db_path, seed_store=json_store)
+    return json_store
+
+
+def _export_sqlite_archives(store: Any, journals: list[JournalSource], *, output_dir: Path) -> int:
+    json_store = JournalStore(output_dir)
+    exported = 0
+    for journal in journals:
+        if not store.has_journal(journal):
+            continue
+        try:
+            count = store.export_json(journal, json_store)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("导出失败 %s: %s", journal.slug, exc)
+            continue
+        LOGGER.debug("导出 %s：%d 条", journal.slug, count)
+        exported += 1
+    return exported
+
+
 def _render_inventory(inventories: list[Any], fmt: str, pretty: bool) -> str:
     if fmt == "csv":
         buffer = StringIO()
@@ -435,40 +980,6 @@ def _configure_logging(verbose: bool) -> None:
     )
 
 
-def _load_progress(path: Path) -> tuple[dict[str, set[str]], set[str]]:
-    """
-    返回 (per_entry, legacy_completed_slugs)。
-    per_entry: slug -> 已处理 entry.id 集合。
-    legacy_completed_slugs: 兼容旧版仅记录 slug 的进度文件。
-    """
-    per_entry: dict[str, set[str]] = {}
-    legacy_completed_slugs: set[str] = set()
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            legacy_completed_slugs = {str(item) for item in data}
-        elif isinstance(data, dict):
-            raw_entries = data.get("completed_entries", {}) if isinstance(data.get("completed_entries", {}), dict) else {}
-            per_entry = {slug: {str(item) for item in items or []} for slug, items in raw_entries.items()}
-            legacy_raw = data.get("completed_slugs", [])
-            if isinstance(legacy_raw, list):
-                legacy_completed_slugs = {str(item) for item in legacy_raw}
-    except FileNotFoundError:
-        return per_entry, legacy_completed_slugs
-    except Exception:
-        LOGGER.debug("读取进度文件失败 %s", path, exc_info=True)
-    return per_entry, legacy_completed_slugs
-
-
-def _save_progress(path: Path, per_entry: dict[str, set[str]]) -> None:
-    payload = {"completed_entries": {slug: sorted(entries) for slug, entries in per_entry.items()}}
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        LOGGER.debug("写入进度文件失败 %s", path, exc_info=True)
-
-
 def _run_once(
     *,
     journals: list[JournalSource],
@@ -479,26 +990,181 @@ def _run_once(
     scd_inst_token: str | None,
     skip_translation: bool,
     progress_path: Path,
+    max_lanes: int = 1,
+    prefetch_concurrency: int = 0,
+    html_cache_dir: Path | None = None,
+    reuse_stale_html: bool = False,
 ) -> RunReport:
     started = datetime.now(timezone.utc)
-    results: list[JournalRunResult] = []
-    errors: list[str] = []
-    per_entry_progress, legacy_completed_slugs = _load_progress(progress_path)
-
-    scd_crawler = ScienceDirect爬虫(feed_client, scd_api_key, scd_inst_token)
-    oxford_crawler = Oxford爬虫(feed_client)
-    cambridge_crawler = Cambridge爬虫(feed_client)
-    cnki_crawler = CNKI爬虫(feed_client)
-    nber_crawler = NBER爬虫(feed_client)
-    wiley_crawler = Wiley爬虫(feed_client)
-    chicago_crawler = Chicago爬虫(feed_client)
-    informs_crawler = Informs爬虫(feed_client)
+    # 进度改为追加日志：每篇只追加一行，定期/结束时压实成快照。
+    progress = ProgressJournal(progress_path)
+    legacy_completed_slugs = progress.legacy_completed_slugs
+
+    # 整轮共用一个浏览器池：首次需要时才启动 Chromium，各来源独立上下文。
+    # 页面缓存挂在浏览器池上，浏览器与 HTTP 优先两条路径共用。
+    html_cache = (
+        html_cache_from_env(html_cache_dir, allow_stale=reuse_stale_html) if html_cache_dir is not None else None
+    )
+    browser_pool = BrowserPool(html_cache=html_cache)
+    crawlers: dict[str, Any] = {
+        "scd_crawler": ScienceDirect爬虫(feed_client, scd_api_key, scd_inst_token),
+        "oxford_crawler": Oxford爬虫(feed_client, browser_pool=browser_pool),
+        "cambridge_crawler": Cambridge爬虫(feed_client),
+        "cnki_crawler": CNKI爬虫(feed_client),
+        "nber_crawler": NBER爬虫(feed_client, browser_pool=browser_pool),
+        "wiley_crawler": Wiley爬虫(feed_client, browser_pool=browser_pool),
+        "chicago_crawler": Chicago爬虫(feed_client, browser_pool=browser_pool),
+        "informs_crawler": Informs爬虫(feed_client, browser_pool=browser_pool),
+    }
 
-    for journal in journals:
+    # 每个来源一条通道：通道内按列表顺序串行（沿用各来源自己的节流），通道之间并行。
+    lanes: dict[str, list[tuple[int, JournalSource]]] = {}
+    for index, journal in enumerate(journals):
         if journal.slug in legacy_completed_slugs:
             LOGGER.info("跳过已完成 %s（来自旧版进度文件）", journal.slug)
             continue
-        completed_entries = set(per_entry_progress.get(journal.slug, set()))
+        lanes.setdefault(journal.source_type, []).append((index, journal))
+    slots: list[JournalRunResult | None] = [None] * len(journals)
+    # Ctrl-C 时置位：各通道停止抓取新条目，已入队的记录落盘后退出。
+    cancel = threading.Event()
+
+    def _run_lane(source_type: str, items: list[tuple[int, JournalSource]]) -> None:
+        lane_started = time.monotonic()
+        for done, (index, journal) in enumerate(items, start=1):
+            if cancel.is_set():
+                break
+            result = _crawl_journal(
+                journal,
+                crawlers=crawlers,
+                feed_client=feed_client,
+                translator=translator,
+                store=store,
+                progress=progress,
+                skip_translation=skip_translation,
+                cancel=cancel,
+            )
+            slots[index] = result
+            LOGGER.info(
+                "通道 %s 进度 %d/%d：%s（新增 %d%s）",
+                source_type,
+                done,
+                len(items),
+                journal.name,
+                result.added,
+                "，失败" if result.error else "",
+            )
+        LOGGER.info("通道 %s 完成：%d 个期刊，用时 %.1fs", source_type, len(items), time.monotonic() - lane_started)
+
+    if prefetch_concurrency > 0 and lanes:
+        _prefetch_feeds(
+            feed_client,
+            [journal.rss_url for items in lanes.values() for _, journal in items],
+            concurrency=prefetch_concurrency,
+        )
+
+    workers = max(1, min(max_lanes, len(lanes)))
+    try:
+        if workers == 1:
+            for source_type, items in lanes.items():
+                _run_lane(source_type, items)
+        else:
+            LOGGER.info("并行抓取 %d 条来源通道（上限 %d）", len(lanes), workers)
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl-lane")
+            try:
+                futures = [executor.submit(_run_lane, source_type, items) for source_type, items in lanes.items()]
+                for future in futures:
+                    future.result()
+            except BaseException:
+                cancel.set()
+                raise
+            finally:
+                executor.shutdown(wait=True)
+    except KeyboardInterrupt:
+        cancel.set()
+        LOGGER.warning("收到中断，已停止抓取并落盘已处理的条目")
+        raise
+    finally:
+        # 兜底：把本轮涉及期刊残留的 WAL（例如会话异常中断）压实进 JSON。
+        for journal in journals:
+            try:
+                if store.has_pending_wal(journal):
+                    store.compact(journal)
+            except Exception:
+                LOGGER.debug("压实 WAL 失败 %s", journal.slug, exc_info=True)
+        progress.close()
+        # 先关闭各爬虫的来源会话（会输出 HTTP 优先的升级率），再关闭共享浏览器池。
+        for name, crawler in crawlers.items():
+            close = getattr(crawler, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception:
+                LOGGER.debug("关闭爬虫失败 %s", name, exc_info=True)
+        try:
+            browser_pool.close()
+        except Exception:
+            LOGGER.debug("关闭浏览器池失败", exc_info=True)
+        try:
+            feed_client.close()
+        except Exception:
+            LOGGER.debug("关闭 FeedClient 失败", exc_info=True)
+
+    # 合并各通道结果，保持期刊列表原有顺序。
+    results = [result for result in slots if result is not None]
+    errors = [f"{result.journal.name}: {result.error}" for result in results if result.error is not None]
+    finished = datetime.now(timezone.utc)
+    return RunReport(started_at=started, finished_at=finished, results=results, errors=errors)
+
+
+def _prefetch_feeds(feed_client: FeedClient, rss_urls: list[str], *, concurrency: int) -> None:
+    """运行开始时并发预取所有非受保护 feed；失败的 feed 由各爬虫按原逻辑重新拉取。"""
+    started = time.monotonic()
+    try:
+        outcomes = feed_client.fetch_many(rss_urls, concurrency=concurrency)
+    except Exception:
+        LOGGER.warning("并发预取 feed 失败，改为逐个拉取", exc_info=True)
+        return
+    not_modified = sum(1 for outcome in outcomes.values() if isinstance(outcome, FeedNotModified))
+    failed = sum(1 for outcome in outcomes.values() if isinstance(outcome, BaseException)) - not_modified
+    LOGGER.info(
+        "预取 feed %d 个：更新 %d，未更新 %d，失败 %d，用时 %.1fs",
+        len(outcomes),
+        len(outcomes) - not_modified - failed,
+        not_modified,
+        failed,
+        time.monotonic() - started,
+    )
+
+
+def _crawl_journal(
+    journal: JournalSource,
+    *,
+    crawlers: dict[str, Any],
+    feed_client: FeedClient,
+    translator: Translator,
+    store: JournalStore,
+    progress: ProgressJournal,
+    skip_translation: bool,
+    cancel: threading.Event | None = None,
+) -> JournalRunResult:
+    """抓取、翻译并落盘单个期刊；异常记录在结果的 error 中，不向上抛出。"""
+    completed_entries = progress.entries_for(journal.slug)
+    try:
+        # 先拉取 feed：未更新（304/内容哈希一致）时整刊跳过，不解析存档、不增强、不落盘。
+        try:
+            feed_client.prefetch(journal.rss_url)
+        except FeedNotModified as exc:
+            feed_client.commit_feed(journal.rss_url)
+            LOGGER.info("%s feed 未更新（%s），跳过", journal.name, exc.reason)
+            return JournalRunResult(
+                journal=journal,
+                fetched=0,
+                added=0,
+                updated=0,
+                translation_attempts=0,
+                translation_failures=0,
+            )
         store.ensure_archive(journal)
         # 防止进度文件与存档不一致：若存档里缺少标记为完成的条目，则重新抓取这些缺失条目。
         try:
@@ -508,91 +1174,217 @@ def _run_once(
             if missing:
                 LOGGER.info("检测到进度与存档不一致，重新抓取 %s 缺失的 %d 条", journal.slug, len(missing))
                 completed_entries -= missing
-                if completed_entries:
-                    per_entry_progress[journal.slug] = completed_entries
-                else:
-                    per_entry_progress.pop(journal.slug, None)
+                progress.forget(journal.slug, missing)
         except Exception:
             LOGGER.debug("校验存档与进度失败 %s", journal.slug, exc_info=True)
-        try:
-            LOGGER.info("开始 %s", journal.name)
-            fetched_total = 0
-            added_total = 0
-            updated_total = 0
-            translation_attempts = 0
-            translation_failures = 0
-
-            for record in _stream_records(
+
+        LOGGER.info("开始 %s", journal.name)
+        # 整刊共用一个缓冲写入会话，避免每篇文章都整文件重写 JSON 档案。
+        with store.open_session(journal) as session:
+            stats = _run_pipeline(
                 journal,
-                scd_crawler=scd_crawler,
-                oxford_crawler=oxford_crawler,
-                cambridge_crawler=cambridge_crawler,
-                cnki_crawler=cnki_crawler,
-                nber_crawler=nber_crawler,
-                wiley_crawler=wiley_crawler,
-                chicago_crawler=chicago_crawler,
-                informs_crawler=informs_crawler,
-                feed_client=feed_client,
-            ):
-                fetched_total += 1
-                if record.id in completed_entries:
-                    LOGGER.info("%s | %s（已完成，跳过）", journal.name, record.title)
-                    continue
+                records=_stream_records(
+                    journal,
+                    **crawlers,
+                    feed_client=feed_client,
+                    skip_ids=completed_entries,
+                ),
+                session=session,
+                translator=translator,
+                progress=progress,
+                completed_entries=completed_entries,
+                skip_translation=skip_translation,
+                cancel=cancel or threading.Event(),
+            )
 
-                LOGGER.info("%s | %s", journal.name, record.title)
-                base_store = store.persist(journal, [record])
-                added_total += base_store.added
-                updated_total += base_store.updated
+        if cancel is not None and cancel.is_set():
+            # 中断的期刊可能尚未处理完，不提交 feed 校验信息，下次照常拉取。
+            feed_client.discard_feed(journal.rss_url)
+        else:
+            feed_client.commit_feed(journal.rss_url)
+        return JournalRunResult(
+            journal=journal,
+            fetched=stats.fetched,
+            added=stats.added,
+            updated=stats.updated,
+            translation_attempts=stats.translation_attempts,
+            translation_failures=stats.translation_failures,
+        )
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("处理失败 %s", journal.name)
+        feed_client.discard_feed(journal.rss_url)
+        return JournalRunResult(
+            journal=journal,
+            fetched=0,
+            added=0,
+            updated=0,
+            translation_attempts=0,
+            translation_failures=0,
+            error=str(exc),
+        )
 
-                if skip_translation:
-                    completed_entries.add(record.id)
-                    per_entry_progress[journal.slug] = completed_entries
-                    _save_progress(progress_path, per_entry_progress)
-                    continue
 
-                translated_records, attempts, failures = _translate_records(
-                    [record], translator, skip_translation=False
-                )
-                translation_attempts += attempts
-                translation_failures += failures
-                trans_store = store.persist(journal, translated_records)
-                updated_total += trans_store.updated
-
-                completed_entries.add(record.id)
-                per_entry_progress[journal.slug] = completed_entries
-                _save_progress(progress_path, per_entry_progress)
-
-            results.append(
-                JournalRunResult(
-                    journal=journal,
-                    fetched=fetched_total,
-                    added=added_total,
-                    updated=updated_total,
-                    translation_attempts=translation_attempts,
-                    translation_failures=translation_failures,
-                )
-            )
-        except Exception as exc:  # noqa: BLE001
-            msg = f"{journal.name}: {exc}"
-            LOGGER.exception("处理失败 %s", journal.name)
-            errors.append(msg)
-            results.append(
-                JournalRunResult(
-                    journal=journal,
-                    fetched=0,
-                    added=0,
-                    updated=0,
-                    translation_attempts=0,
-                    translation_failures=0,
-                    error=str(exc),
-                )
-            )
-    finished = datetime.now(timezone.utc)
+@dataclass
+class _PipelineStats:
+    fetched: int = 0
+    added: int = 0
+    updated: int = 0
+    translation_attempts: int = 0
+    translation_failures: int = 0
+
+
+_PIPELINE_STOP = object()
+
+
+def _run_pipeline(
+    journal: JournalSource,
+    *,
+    records: Iterable[ArticleRecord],
+    session: Any,
+    translator: Translator,
+    progress: ProgressJournal,
+    completed_entries: set[str],
+    skip_translation: bool,
+    cancel: threading.Event,
+) -> _PipelineStats:
+    """
+    抓取 → 翻译 → 落盘 三段流水线，段间为有界队列（背压）。
+    抓取在调用线程执行，保证各来源的同步浏览器会话始终留在同一线程；
+    翻译、落盘各占一个线程，会话只由落盘线程访问。
+    任一段出错或 cancel 置位时停止抓取；已入队的基础记录照常落盘，
+    尚未翻译的条目不再翻译、也不标记进度，下次运行会重新处理。
+    """
+    queue_size = _pipeline_queue_size_from_env()
+    translate_queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+    persist_queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+    stopping = threading.Event()
+    errors: list[BaseException] = []
+    stats = _PipelineStats()
+
+    def _translate_batch(batch: list[ArticleRecord]) -> None:
+        translated_records, attempts, failures = _translate_records(batch, translator, skip_translation=False)
+        record_ids = [record.id for record in batch]
+        persist_queue.put(("translated", record_ids, translated_records, attempts, failures))
+
+    def _translate_stage() -> None:
+        finished = False
+        # 翻译器支持并发（异步引擎）时，同时保持多批在途，抓取不必等上一批译完。
+        max_in_flight = max(1, int(getattr(translator, "max_in_flight", 1)))
+        # 只有支持 translate_batch 的翻译器才凑批；逐条翻译的实现出错时不连累同批其他条目。
+        batch_limit = queue_size if hasattr(translator, "translate_batch") else 1
+        in_flight: set[Future[None]] = set()
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix=f"translate-{journal.slug}")
+        try:
+            while not finished:
+                item = translate_queue.get()
+                if item is _PIPELINE_STOP:
+                    finished = True
+                    break
+                # 顺带取走队列里已就绪的条目，凑成一批交给批量翻译；不为凑批而等待。
+                batch = [cast(ArticleRecord, item)]
+                while len(batch) < batch_limit:
+                    try:
+                        extra = translate_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if extra is _PIPELINE_STOP:
+                        finished = True
+                        break
+                    batch.append(cast(ArticleRecord, extra))
+                if stopping.is_set() or cancel.is_set():
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(executor.submit(_translate_batch, batch))
+            for future in in_flight:
+                future.result()
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            stopping.set()
+            # 继续消费到结束标记，避免上游阻塞在满队列上。
+            while not finished and translate_queue.get() is not _PIPELINE_STOP:
+                pass
+        finally:
+            executor.shutdown(wait=True)
+            persist_queue.put(_PIPELINE_STOP)
+
+    def _persist_stage() -> None:
+        failed = False
+        while True:
+            item = persist_queue.get()
+            if item is _PIPELINE_STOP:
+                return
+            if failed:
+                continue
+            try:
+                kind, *payload = cast(tuple[Any, ...], item)
+                if kind == "base":
+                    (record,) = payload
+                    base_store = session.append([record])
+                    stats.added += base_store.added
+                    stats.updated += base_store.updated
+                    if skip_translation:
+                        completed_entries.add(record.id)
+                        progress.mark(journal.slug, record.id)
+                else:
+                    record_ids, translated_records, attempts, failures = payload
+                    stats.translation_attempts += attempts
+                    stats.translation_failures += failures
+                    trans_store = session.append(translated_records)
+                    stats.updated += trans_store.updated
+                    for record_id in record_ids:
+                        completed_entries.add(record_id)
+                        progress.mark(journal.slug, record_id)
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+                stopping.set()
+                failed = True
+
+    persister = threading.Thread(target=_persist_stage, name=f"persist-{journal.slug}", daemon=True)
+    translator_thread = threading.Thread(target=_translate_stage, name=f"translate-{journal.slug}", daemon=True)
+    persister.start()
+    if not skip_translation:
+        translator_thread.start()
     try:
-        oxford_crawler.close()
-    except Exception:
-        LOGGER.debug("关闭 Oxford 爬虫失败", exc_info=True)
-    return RunReport(started_at=started, finished_at=finished, results=results, errors=errors)
+        for record in records:
+            if stopping.is_set() or cancel.is_set():
+                break
+            stats.fetched += 1
+            if record.id in completed_entries:
+                LOGGER.info("%s | %s（已完成，跳过）", journal.name, record.title)
+                continue
+            LOGGER.info("%s | %s", journal.name, record.title)
+            # 先落盘基础记录，再排队翻译：翻译阶段中断也不丢抓取结果。
+            persist_queue.put(("base", record))
+            if not skip_translation:
+                translate_queue.put(record)
+    except BaseException:
+        stopping.set()
+        raise
+    finally:
+        if skip_translation:
+            persist_queue.put(_PIPELINE_STOP)
+        else:
+            translate_queue.put(_PIPELINE_STOP)
+            translator_thread.join()
+        persister.join()
+    if errors:
+        raise errors[0]
+    return stats
+
+
+def _pipeline_queue_size_from_env() -> int:
+    raw = os.getenv("CRAWL_PIPELINE_QUEUE_SIZE")
+    if not raw:
+        return 4
+    try:
+        value = int(raw)
+        return value if value > 0 else 1
+    except ValueError:
+        LOGGER.warning("Invalid CRAWL_PIPELINE_QUEUE_SIZE value: %s", raw)
+        return 4
 
 
 def _stream_records(
@@ -607,12 +1399,13 @@ def _stream_records(
     chicago_crawler: Any,
     informs_crawler: Any,
     feed_client: FeedClient,
+    skip_ids: set[str] | None = None,
 ) -> Iterable[ArticleRecord]:
     def _iter_from(crawler: Any) -> Iterable[ArticleRecord]:
         iter_crawl = getattr(crawler, "iter_crawl", None)
         if callable(iter_crawl):
-            return cast(Iterable[ArticleRecord], iter_crawl(journal))
-        records = crawler.crawl(journal)
+            return cast(Iterable[ArticleRecord], iter_crawl(journal, skip_ids=skip_ids))
+        records = crawler.crawl(journal, skip_ids=skip_ids)
         if isinstance(records, list):
             return records
         return cast(Iterable[ArticleRecord], records)
@@ -677,43 +1470,49 @@ def _translate_records(
     except ValueError:
         throttle_seconds = 0.5
     attempts = 0
-    translated: list[ArticleRecord] = []
-    results: list[TranslationResult | None] = []
-    failure_indices: list[int] = []
+    translated: list[ArticleRecord] = list(records)
+    results: list[TranslationResult | None] = [None] * len(records)
+    pending: list[int] = []
     for idx, record in enumerate(records):
         summary = record.abstract_original or ""
         language = record.abstract_language
         if not summary:
-            translated.append(record)
-            results.append(None)
             continue
         if language and language.startswith("zh"):
             # 中文摘要无需翻译：对用户展示为已具备中文摘要（success），且填充 abstract_zh。
             now = datetime.now(timezone.utc)
-            translated.append(
-                record.model_copy(
-                    update={
-                        "abstract_zh": record.abstract_zh or summary,
-                        "translation": TranslationRecord(
-                            status="success",
-                            translator=None,
-                            translated_at=now,
-                            error=None,
-                        ),
-                    }
-                )
+            translated[idx] = record.model_copy(
+                update={
+                    "abstract_zh": record.abstract_zh or summary,
+                    "translation": TranslationRecord(
+                        status="success",
+                        translator=None,
+                        translated_at=now,
+                        error=None,
+                    ),
+                }
             )
-            results.append(None)
             continue
-        if throttle_seconds:
+        pending.append(idx)
+
+    def _translate_pending(indices: list[int]) -> None:
+        nonlocal attempts
+        if not indices:
+            return
+        # 自带限速的翻译器（异步引擎）不再额外等待。
+        if throttle_seconds and not getattr(translator, "rate_limited", False):
             time.sleep(throttle_seconds)
-        attempts += 1
-        result: TranslationResult = translator.translate(summary, source_language=language or "unknown")
-        results.append(result)
-        if result.status == "failed":
-            failure_indices.append(idx)
-        translated.append(
-            record.model_copy(
+        attempts += len(indices)
+        # 多条待译时交给 translate_batch 打包请求；单条仍走 translate。
+        batch_results = translate_texts(
+            translator,
+            [records[idx].abstract_original or "" for idx in indices],
+            source_languages=[records[idx].abstract_language for idx in indices],
+        )
+        for idx, result in zip(indices, batch_results):
+            record = records[idx]
+            results[idx] = result
+            translated[idx] = record.model_copy(
                 update={
                     "abstract_zh": result.translated_text or record.abstract_zh,
                     "translation": TranslationRecord(
@@ -724,29 +1523,12 @@ def _translate_records(
                     ),
                 }
             )
-        )
+
+    _translate_pending(pending)
+    failure_indices = [idx for idx in pending if (result := results[idx]) is not None and result.status == "failed"]
     if failure_indices:
         LOGGER.info("翻译失败 %d 条，开始补偿重试", len(failure_indices))
-        for idx in failure_indices:
-            record = records[idx]
-            summary = record.abstract_original or ""
-            language = record.abstract_language
-            if throttle_seconds:
-                time.sleep(throttle_seconds)
-            attempts += 1
-            retry_result: TranslationResult = translator.translate(summary, source_language=language or "unknown")
-            results[idx] = retry_result
-            translated[idx] = record.model_copy(
-                update={
-                    "abstract_zh": retry_result.translated_text or record.abstract_zh,
-                    "translation": TranslationRecord(
-                        status=retry_result.status,
-                        translator=retry_result.translator,
-                        translated_at=retry_result.translated_at,
-                        error=retry_result.error,
-                    ),
-                }
-            )
+        _translate_pending(failure_indices)
     failures = sum(1 for result in results if result and result.status == "failed")
     return translated, attempts, failures
 
@@ -842,11 +1624,14 @@ def fix_cnki_links(
         if journal.source_type != "cnki":
             continue
         archive_path = store.archive_path(journal)
-        if not archive_path.exists():
+        if not archive_path.exists() and not store.has_pending_wal(journal):
             continue
         total_archives += 1
         try:
-            archive = json.loads(archive_path.read_text(encoding="utf-8"))
+            if apply and store.has_pending_wal(journal):
+                # 写回前先把 WAL 折叠进 JSON，避免回放时覆盖修正后的链接。
+                store.compact(journal)
+            archive = store.load_payload(journal)
         except Exception as exc:  # noqa: BLE001
             typer.secho(f"读取失败 {archive_path}: {exc}", fg=typer.colors.YELLOW)
             continue
@@ -951,10 +1736,10 @@ def _build_viewer_index(*, list_path: Path, data_dir: Path, viewer_dir: Path) ->
     items: list[dict[str, Any]] = []
     for journal in journals:
         archive_path = store.archive_path(journal)
-        if not archive_path.exists():
+        if not archive_path.exists() and not store.has_pending_wal(journal):
             continue
         try:
-            archive = json.loads(archive_path.read_text(encoding="utf-8"))
+            archive = store.load_payload(journal)
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning("读取失败 %s: %s", archive_path, exc)
             continue
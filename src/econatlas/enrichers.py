@@ -0,0 +1,37 @@
+"""
+英文导入入口：封装 2_enrichers 包。
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from econatlas._loader import load_local_module
+
+_pkg = cast(Any, load_local_module(__file__, "2_enrichers/__init__.py", "econatlas._enrichers_pkg"))
+
+ScienceDirectEnricher = _pkg.ScienceDirectEnricher
+ScienceDirectApiClient = _pkg.ScienceDirectApiClient
+ElsevierApiConfig = _pkg.ElsevierApiConfig
+ScienceDirectApiError = _pkg.ScienceDirectApiError
+OxfordEnricher = _pkg.OxfordEnricher
+OxfordArticleFetcher = _pkg.OxfordArticleFetcher
+TieredFetcher = _pkg.TieredFetcher
+HostEscalationStats = _pkg.HostEscalationStats
+PageMetadata = _pkg.PageMetadata
+extract_page_metadata = _pkg.extract_page_metadata
+html_parser_backend = _pkg.html_parser_backend
+
+__all__ = [
+    "ElsevierApiConfig",
+    "HostEscalationStats",
+    "OxfordArticleFetcher",
+    "OxfordEnricher",
+    "PageMetadata",
+    "ScienceDirectApiClient",
+    "ScienceDirectApiError",
+    "ScienceDirectEnricher",
+    "TieredFetcher",
+    "extract_page_metadata",
+    "html_parser_backend",
+]
@@ -11,9 +11,19 @@ from econatlas._loader import load_local_module
 _feeds_pkg = cast(Any, load_local_module(__file__, "0_feeds/__init__.py", "econatlas._feeds_pkg"))
 
 FeedClient = _feeds_pkg.FeedClient
+FeedCache = _feeds_pkg.FeedCache
+FeedNotModified = _feeds_pkg.FeedNotModified
 BrowserFetcher = _feeds_pkg.BrowserFetcher
 strip = _feeds_pkg.strip
 JournalListLoader = _feeds_pkg.JournalListLoader
 ALLOWED_SOURCE_TYPES = _feeds_pkg.ALLOWED_SOURCE_TYPES
 
-__all__ = ["FeedClient", "BrowserFetcher", "strip", "JournalListLoader", "ALLOWED_SOURCE_TYPES"]
+__all__ = [
+    "ALLOWED_SOURCE_TYPES",
+    "BrowserFetcher",
+    "FeedCache",
+    "FeedClient",
+    "FeedNotModified",
+    "JournalListLoader",
+    "strip",
+]
@@ -25,6 +25,9 @@ browser_init_scripts_for_source = _pkg.browser_init_scripts_for_source
 browser_local_storage_for_source = _pkg.browser_local_storage_for_source
 browser_user_data_dir_for_source = _pkg.browser_user_data_dir_for_source
 browser_headless_for_source = _pkg.browser_headless_for_source
+browser_max_pages_for_source = _pkg.browser_max_pages_for_source
+browser_block_policy_for_source = _pkg.browser_block_policy_for_source
+ResourceBlockPolicy = _pkg.ResourceBlockPolicy
 browser_launch_overrides = _pkg.browser_launch_overrides
 cookies_for_source = _pkg.cookies_for_source
 rewrite_sciencedirect_url = _pkg.rewrite_sciencedirect_url
@@ -34,6 +37,28 @@ cleanup_user_data_dir = _pkg.cleanup_user_data_dir
 SourceInventory = _pkg.SourceInventory
 JournalInventory = _pkg.JournalInventory
 build_inventory = _pkg.build_inventory
+BrowserPool = _pkg.BrowserPool
+BrowserPoolStats = _pkg.BrowserPoolStats
+BrowserLaunchOptions = _pkg.BrowserLaunchOptions
+SourceContextOptions = _pkg.SourceContextOptions
+SourceBrowserSession = _pkg.SourceBrowserSession
+source_context_options = _pkg.source_context_options
+RateLimiter = _pkg.RateLimiter
+iter_in_window = _pkg.iter_in_window
+iter_feed_records = _pkg.iter_feed_records
+SourceBenchmark = _pkg.SourceBenchmark
+GoldenMismatch = _pkg.GoldenMismatch
+run_extraction_benchmark = _pkg.run_extraction_benchmark
+extractors_by_source = _pkg.extractors_by_source
+MockApiServer = _pkg.MockApiServer
+MockApiConfig = _pkg.MockApiConfig
+RouteStats = _pkg.RouteStats
+mock_abstract = _pkg.mock_abstract
+mock_pii = _pkg.mock_pii
+LoadResult = _pkg.LoadResult
+run_load = _pkg.run_load
+bench_translator = _pkg.bench_translator
+bench_elsevier = _pkg.bench_elsevier
 
 __all__ = [
     "SampleCollector",
@@ -51,6 +76,9 @@ __all__ = [
     "browser_local_storage_for_source",
     "browser_user_data_dir_for_source",
     "browser_headless_for_source",
+    "browser_max_pages_for_source",
+    "browser_block_policy_for_source",
+    "ResourceBlockPolicy",
     "browser_launch_overrides",
     "cookies_for_source",
     "rewrite_sciencedirect_url",
@@ -60,4 +88,26 @@ __all__ = [
     "SourceInventory",
     "JournalInventory",
     "build_inventory",
+    "BrowserPool",
+    "BrowserPoolStats",
+    "BrowserLaunchOptions",
+    "SourceContextOptions",
+    "SourceBrowserSession",
+    "source_context_options",
+    "RateLimiter",
+    "iter_feed_records",
+    "iter_in_window",
+    "SourceBenchmark",
+    "GoldenMismatch",
+    "run_extraction_benchmark",
+    "extractors_by_source",
+    "MockApiServer",
+    "MockApiConfig",
+    "RouteStats",
+    "mock_abstract",
+    "mock_pii",
+    "LoadResult",
+    "run_load",
+    "bench_translator",
+    "bench_elsevier",
 ]
@@ -9,8 +9,32 @@ from typing import Any, cast
 from econatlas._loader import load_local_module
 
 _store = cast(Any, load_local_module(__file__, "4_storage/4.1_JSON存储.py", "econatlas._storage_json"))
+_sqlite = cast(Any, load_local_module(__file__, "4_storage/4.2_SQLite存储.py", "econatlas._storage_sqlite"))
+_progress = cast(Any, load_local_module(__file__, "4_storage/4.3_进度日志.py", "econatlas._storage_progress"))
+_html_cache = cast(Any, load_local_module(__file__, "4_storage/4.4_页面缓存.py", "econatlas._storage_html_cache"))
 
 JournalStore = _store.JournalStore
 StorageResult = _store.StorageResult
+JournalWriteSession = _store.JournalWriteSession
+SqliteJournalStore = _sqlite.SqliteJournalStore
+SqliteWriteSession = _sqlite.SqliteWriteSession
+ProgressJournal = _progress.ProgressJournal
+load_progress = _progress.load_progress
+HtmlCache = _html_cache.HtmlCache
+CachedPage = _html_cache.CachedPage
+html_cache_from_env = _html_cache.html_cache_from_env
+normalize_url = _html_cache.normalize_url
 
-__all__ = ["JournalStore", "StorageResult"]
+__all__ = [
+    "CachedPage",
+    "HtmlCache",
+    "JournalStore",
+    "JournalWriteSession",
+    "ProgressJournal",
+    "SqliteJournalStore",
+    "SqliteWriteSession",
+    "StorageResult",
+    "html_cache_from_env",
+    "load_progress",
+    "normalize_url",
+]
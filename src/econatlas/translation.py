@@ -10,15 +10,27 @@ from econatlas._loader import load_local_module
 
 _base = cast(Any, load_local_module(__file__, "3_translation/3.1_翻译基础.py", "econatlas._trans_base"))
 _deepseek = cast(Any, load_local_module(__file__, "3_translation/3.2_DeepSeek_翻译.py", "econatlas._trans_ds"))
+_engine = cast(Any, load_local_module(__file__, "3_translation/3.3_异步翻译引擎.py", "econatlas._trans_engine"))
+_memory = cast(Any, load_local_module(__file__, "3_translation/3.4_翻译记忆.py", "econatlas._trans_memory"))
+_backfill = cast(Any, load_local_module(__file__, "3_translation/3.5_离线补译.py", "econatlas._trans_backfill"))
 
 TranslationResult = _base.TranslationResult
 Translator = _base.Translator
 detect_language = _base.detect_language
 skipped_translation = _base.skipped_translation
 failed_translation = _base.failed_translation
+translate_texts = _base.translate_texts
 NoOpTranslator = _base.NoOpTranslator
 
 DeepSeekTranslator = _deepseek.DeepSeekTranslator
+AsyncTranslationEngine = _engine.AsyncTranslationEngine
+AdaptiveRateLimiter = _engine.AdaptiveRateLimiter
+TranslationMemory = _memory.TranslationMemory
+TranslationMemoryStats = _memory.TranslationMemoryStats
+DEFAULT_MEMORY_PATH = _memory.DEFAULT_MEMORY_PATH
+BackfillReport = _backfill.BackfillReport
+needs_backfill = _backfill.needs_backfill
+run_backfill = _backfill.run_backfill
 
 __all__ = [
     "TranslationResult",
@@ -26,6 +38,15 @@ __all__ = [
     "detect_language",
     "skipped_translation",
     "failed_translation",
+    "translate_texts",
     "NoOpTranslator",
     "DeepSeekTranslator",
+    "AsyncTranslationEngine",
+    "AdaptiveRateLimiter",
+    "TranslationMemory",
+    "TranslationMemoryStats",
+    "DEFAULT_MEMORY_PATH",
+    "BackfillReport",
+    "needs_backfill",
+    "run_backfill",
 ]
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from pytest import MonkeyPatch
+
+from econatlas.samples import (
+    BrowserLaunchOptions,
+    BrowserPool,
+    ResourceBlockPolicy,
+    SourceBrowserSession,
+    SourceContextOptions,
+    browser_block_policy_for_source,
+    iter_in_window,
+)
+from econatlas.storage import HtmlCache
+
+
+class FakeRequest:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, request: FakeRequest) -> None:
+        self.request = request
+        self.aborted = False
+
+    async def abort(self) -> None:
+        self.aborted = True
+
+    async def continue_(self) -> None:
+        return None
+
+
+class FakeResponse:
+    def __init__(self, size: int) -> None:
+        self.headers = {"content-length": str(size)}
+
+
+class FakePage:
+    def __init__(self, browser: FakeBrowser) -> None:
+        self._browser = browser
+        self._url = ""
+        self._route_handler: Callable[[FakeRoute], Any] | None = None
+        self._response_handlers: list[Callable[[FakeResponse], None]] = []
+
+    async def route(self, pattern: str, handler: Callable[[FakeRoute], Any]) -> None:
+        self._route_handler = handler
+
+    def on(self, event: str, handler: Callable[[FakeResponse], None]) -> None:
+        assert event == "response"
+        self._response_handlers.append(handler)
+
+    async def goto(self, url: str, **_: Any) -> None:
+        if self._browser.crash_on_next_goto:
+            self._browser.crash_on_next_goto = False
+            self._browser.crash()
+            raise RuntimeError("Target closed")
+        await asyncio.sleep(self._browser.load_seconds)
+        for resource_type, resource_url, size in [("document", url, 1000), *self._browser.subresources]:
+            route = FakeRoute(FakeRequest(resource_type, resource_url))
+            if self._route_handler is not None:
+                await self._route_handler(route)
+            if not route.aborted:
+                for handler in self._response_handlers:
+                    handler(FakeResponse(size))
+        self._url = url
+
+    async def wait_for_selector(self, selector: str, **_: Any) -> None:
+        return None
+
+    async def content(self) -> str:
+        return f"<html>{self._url}</html>"
+
+    async def close(self) -> None:
+        self._browser.open_pages -= 1
+
+
+class FakeContext:
+    def __init__(self, browser: FakeBrowser, options: dict[str, Any]) -> None:
+        self.browser = browser
+        self.options = options
+        self.headers: dict[str, str] = {}
+        self.cookies: list[dict[str, str]] = []
+
+    async def set_extra_http_headers(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+
+    async def add_init_script(self, script: str) -> None:
+        return None
+
+    async def add_cookies(self, cookies: list[dict[str, str]]) -> None:
+        self.cookies.extend(cookies)
+
+    async def new_page(self) -> FakePage:
+        self.browser.open_pages += 1
+        self.browser.peak_pages = max(self.browser.peak_pages, self.browser.open_pages)
+        return FakePage(self.browser)
+
+    async def close(self) -> None:
+        return None
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[FakeContext] = []
+        self.handlers: list[Callable[..., None]] = []
+        self.crash_on_next_goto = False
+        self.closed = False
+        self.load_seconds = 0.0
+        self.subresources: list[tuple[str, str, int]] = []
+        self.open_pages = 0
+        self.peak_pages = 0
+
+    def on(self, event: str, handler: Callable[..., None]) -> None:
+        assert event == "disconnected"
+        self.handlers.append(handler)
+
+    def crash(self) -> None:
+        for handler in self.handlers:
+            handler(self)
+
+    async def new_context(self, **options: Any) -> FakeContext:
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self) -> None:
+        self.browsers: list[FakeBrowser] = []
+
+    async def launch(self, **_: Any) -> FakeBrowser:
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+def _options(
+    source_type: str,
+    cookie_domain: str,
+    *,
+    max_pages: int = 1,
+    block_policy: ResourceBlockPolicy | None = None,
+) -> SourceContextOptions:
+    return SourceContextOptions(
+        source_type=source_type,
+        user_agent=f"{source_type}-agent",
+        launch=BrowserLaunchOptions(headless=True),
+        headers={"Referer": f"https://{source_type}.example/"},
+        cookies={"session": source_type},
+        cookie_domain=cookie_domain,
+        max_pages=max_pages,
+        block_policy=block_policy,
+    )
+
+
+def _pool(playwright: FakePlaywright, html_cache: HtmlCache | None = None) -> BrowserPool:
+    async def factory() -> FakePlaywright:
+        return playwright
+
+    return BrowserPool(playwright_factory=factory, html_cache=html_cache)
+
+
+def test_browser_pool_shares_browser_with_isolated_contexts() -> None:
+    playwright = FakePlaywright()
+    with _pool(playwright) as pool:
+        wiley = _options("wiley", ".wiley.com")
+        informs = _options("informs", ".pubsonline.informs.org")
+        assert pool.fetch_html(wiley, "https://w/1") == "<html>https://w/1</html>"
+        assert pool.fetch_html(informs, "https://i/1") == "<html>https://i/1</html>"
+        assert pool.fetch_html(wiley, "https://w/2") == "<html>https://w/2</html>"
+
+        assert len(playwright.chromium.browsers) == 1
+        contexts = playwright.chromium.browsers[0].contexts
+        assert [context.options["user_agent"] for context in contexts] == ["wiley-agent", "informs-agent"]
+        assert [context.cookies[0]["domain"] for context in contexts] == [".wiley.com", ".pubsonline.informs.org"]
+        assert pool.health() == {"wiley": "ok", "informs": "ok"}
+    assert playwright.stopped is True
+
+
+def test_browser_pool_restarts_crashed_browser_and_retries() -> None:
+    playwright = FakePlaywright()
+    with _pool(playwright) as pool:
+        options = _options("chicago", ".journals.uchicago.edu")
+        pool.fetch_html(options, "https://c/1")
+        first = playwright.chromium.browsers[0]
+        first.crash_on_next_goto = True
+
+        assert pool.fetch_html(options, "https://c/2") == "<html>https://c/2</html>"
+        assert len(playwright.chromium.browsers) == 2
+        assert first.closed is True
+        assert pool.stats().restarts == 1
+        assert pool.health() == {"chicago": "ok"}
+
+
+def test_browser_pool_bounds_concurrent_pages_per_source() -> None:
+    playwright = FakePlaywright()
+    with _pool(playwright) as pool:
+        options = _options("nber", ".nber.org", max_pages=2)
+        pool.fetch_html(options, "https://n/0")
+        playwright.chromium.browsers[0].load_seconds = 0.05
+        urls = [f"https://n/{index}" for index in range(1, 7)]
+
+        pages = list(iter_in_window(lambda url: pool.fetch_html(options, url), urls, max_in_flight=4))
+
+        assert pages == [f"<html>{url}</html>" for url in urls]
+        assert playwright.chromium.browsers[0].peak_pages == 2
+
+
+def test_iter_in_window_keeps_input_order() -> None:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(value: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02 * (5 - value))
+        with lock:
+            running -= 1
+        return value * 10
+
+    assert list(iter_in_window(work, range(5), max_in_flight=3)) == [0, 10, 20, 30, 40]
+    assert 1 < peak <= 3
+
+
+def test_browser_pool_blocks_heavy_resources_and_trackers(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("BROWSER_BLOCK_RESOURCES", raising=False)
+    monkeypatch.delenv("INFORMS_BROWSER_BLOCK_RESOURCES", raising=False)
+    monkeypatch.delenv("BROWSER_BLOCK_DOMAINS", raising=False)
+    policy = browser_block_policy_for_source("informs")
+    playwright = FakePlaywright()
+    with _pool(playwright) as pool:
+        options = _options("informs", ".pubsonline.informs.org", block_policy=policy)
+        pool.fetch_html(options, "https://i/0")
+        playwright.chromium.browsers[0].subresources = [
+            ("image", "https://pubsonline.informs.org/cover.jpg", 50_000),
+            ("stylesheet", "https://pubsonline.informs.org/site.css", 20_000),
+            ("script", "https://www.googletagmanager.com/gtm.js", 80_000),
+            ("script", "https://challenges.cloudflare.com/turnstile.js", 300),
+            ("script", "https://pubsonline.informs.org/app.js", 700),
+        ]
+        pool.fetch_html(options, "https://i/1")
+
+        stats = pool.stats()
+        assert stats.pages == 2
+        assert stats.blocked_requests == 3
+        assert stats.blocked_by_type == {"image": 1, "stylesheet": 1, "script": 1}
+        assert stats.loaded_bytes == 1000 + 1000 + 300 + 700
+
+
+def test_block_policy_env_overrides(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("BROWSER_BLOCK_RESOURCES", "image,font")
+    monkeypatch.setenv("OXFORD_BROWSER_BLOCK_RESOURCES", "none")
+    monkeypatch.setenv("BROWSER_BLOCK_DOMAINS", "ads.example.com")
+
+    wiley = browser_block_policy_for_source("wiley")
+    oxford = browser_block_policy_for_source("oxford")
+
+    assert wiley.resource_types == frozenset({"image", "font"})
+    assert wiley.should_block("script", "https://cdn.ads.example.com/x.js")
+    assert wiley.should_block("xhr", "https://www.google-analytics.com/collect")
+    assert not wiley.should_block("stylesheet", "https://onlinelibrary.wiley.com/a.css")
+    assert oxford.resource_types == frozenset()
+    assert not oxford.should_block("image", "https://academic.oup.com/a.png")
+
+
+def test_source_session_serves_cached_pages_without_browser(tmp_path: Path) -> None:
+    playwright = FakePlaywright()
+    with _pool(playwright, HtmlCache(tmp_path)) as pool:
+        session = SourceBrowserSession("wiley", browser_pool=pool, referer="https://w/", cookie_domain=".wiley.com")
+        assert session.fetch_html("https://w/1") == "<html>https://w/1</html>"
+        assert session.fetch_html("https://w/1#abstract") == "<html>https://w/1</html>"
+
+        assert pool.stats().pages == 1
+        assert session.html_cache is not None and session.html_cache.hits == 1
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
+import logging
+import threading
+from datetime import UTC, datetime
 from importlib import import_module
+from pathlib import Path
 
+import httpx
+import pytest
 from typer.testing import CliRunner
 from pytest import MonkeyPatch
 
 from econatlas.cli.app import RunReport, app
-from econatlas.models import JournalSource
+from econatlas.feeds import FeedClient
+from econatlas.models import ArticleRecord, JournalSource, NormalizedFeedEntry, TranslationRecord
+from econatlas.storage import JournalStore, ProgressJournal
+from econatlas.translation import NoOpTranslator, TranslationResult
 
 
 runner = CliRunner()
@@ -21,7 +28,7 @@ def test_crawl_publisher_does_not_trigger_parent_callback(monkeypatch: MonkeyPat
 
     def fake_run_once(*, journals: list[JournalSource], **_: object) -> RunReport:
         calls.append([journal.slug for journal in journals])
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         return RunReport(started_at=now, finished_at=now, results=[], errors=[])
 
     def fake_load(self: object) -> list[JournalSource]:  # noqa: ANN001
@@ -47,3 +54,172 @@ def test_crawl_publisher_does_not_trigger_parent_callback(monkeypatch: MonkeyPat
     assert result.exit_code == 0, result.output
     # 仅应调用一次，且只包含 ScienceDirect 期刊。
     assert calls == [["jfe"]]
+
+
+def test_run_once_runs_source_lanes_in_parallel(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    journals = [
+        JournalSource(name="A", rss_url="https://a.invalid/rss", slug="a", source_type="wiley"),
+        JournalSource(name="B", rss_url="https://b.invalid/rss", slug="b", source_type="oxford"),
+        JournalSource(name="C", rss_url="https://c.invalid/rss", slug="c", source_type="wiley"),
+    ]
+    # 两条通道必须同时到达屏障，串行执行会超时。
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_stream(journal: JournalSource, **_: object) -> list[ArticleRecord]:
+        if journal.slug in {"a", "b"}:
+            barrier.wait()
+        if journal.slug == "b":
+            raise RuntimeError("boom")
+        now = datetime.now(UTC)
+        return [
+            ArticleRecord(
+                id=f"{journal.slug}-1",
+                title="T",
+                link="https://example.com",
+                authors=[],
+                published_at=now,
+                abstract_original=None,
+                abstract_language=None,
+                abstract_zh=None,
+                translation=TranslationRecord(status="skipped"),
+                fetched_at=now,
+            )
+        ]
+
+    monkeypatch.setattr(cli_app, "_stream_records", fake_stream)
+    feed_client = FeedClient()
+    monkeypatch.setattr(feed_client, "fetch", lambda rss_url: [])
+    report = cli_app._run_once(
+        journals=journals,
+        feed_client=feed_client,
+        translator=NoOpTranslator(),
+        store=JournalStore(tmp_path / "data"),
+        scd_api_key=None,
+        scd_inst_token=None,
+        skip_translation=True,
+        progress_path=tmp_path / "progress.json",
+        max_lanes=2,
+    )
+
+    assert [result.journal.slug for result in report.results] == ["a", "b", "c"]
+    assert [result.added for result in report.results] == [1, 0, 1]
+    assert report.errors == ["B: boom"]
+
+
+def test_run_once_closes_crawlers_before_browser_pool(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    closed: list[str] = []
+    monkeypatch.setattr(cli_app.Oxford爬虫, "close", lambda self: closed.append("oxford"))
+    monkeypatch.setattr(cli_app.NBER爬虫, "close", lambda self: closed.append("nber"))
+    monkeypatch.setattr(cli_app.BrowserPool, "close", lambda self: closed.append("pool"))
+    feed_client = FeedClient()
+    monkeypatch.setattr(feed_client, "fetch", lambda rss_url: [])
+
+    cli_app._run_once(
+        journals=[JournalSource(name="A", rss_url="https://a.invalid/rss", slug="a", source_type="oxford")],
+        feed_client=feed_client,
+        translator=NoOpTranslator(),
+        store=JournalStore(tmp_path / "data"),
+        scd_api_key=None,
+        scd_inst_token=None,
+        skip_translation=True,
+        progress_path=tmp_path / "progress.json",
+    )
+
+    assert closed == ["oxford", "nber", "pool"]
+
+
+def test_run_once_logs_http_first_escalation_stats(
+    monkeypatch: MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setenv("NBER_THROTTLE_SECONDS", "0")
+    monkeypatch.setenv("NBER_HTTP_FIRST", "1")
+    page = '<p class="page-header__intro">A full working paper abstract.</p>'
+    monkeypatch.setattr(
+        httpx.Client, "get", lambda self, url, **_: httpx.Response(200, text=page, request=httpx.Request("GET", url))
+    )
+    entry = NormalizedFeedEntry(
+        entry_id="w1",
+        title="Paper",
+        summary="",
+        link="https://www.nber.org/papers/w1",
+        authors=(),
+        published_at=datetime(2024, 1, 1),
+    )
+    feed_client = FeedClient()
+    monkeypatch.setattr(feed_client, "fetch", lambda rss_url: [entry])
+
+    with caplog.at_level(logging.INFO):
+        report = cli_app._run_once(
+            journals=[JournalSource(name="N", rss_url="https://n.invalid/rss", slug="n", source_type="nber")],
+            feed_client=feed_client,
+            translator=NoOpTranslator(),
+            store=JournalStore(tmp_path / "data"),
+            scd_api_key=None,
+            scd_inst_token=None,
+            skip_translation=True,
+            progress_path=tmp_path / "progress.json",
+        )
+
+    assert report.errors == [] and report.results[0].added == 1
+    assert "nber HTTP 优先：www.nber.org 升级浏览器 0/1（0%）" in caplog.text
+
+
+def _record(entry_id: str, abstract: str | None = "An abstract.") -> ArticleRecord:
+    now = datetime.now(UTC)
+    return ArticleRecord(
+        id=entry_id,
+        title=f"T{entry_id}",
+        link="https://example.com",
+        authors=[],
+        published_at=now,
+        abstract_original=abstract,
+        abstract_language="en",
+        abstract_zh=None,
+        translation=TranslationRecord(status="skipped"),
+        fetched_at=now,
+    )
+
+
+class _FlakyTranslator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def translate(
+        self, text: str, *, source_language: str | None = None, target_language: str = "zh"
+    ) -> TranslationResult:
+        self.calls += 1
+        if self.calls == 2:
+            raise RuntimeError("translator down")
+        return TranslationResult(
+            status="success",
+            translated_text="摘要",
+            translator="fake",
+            translated_at=datetime.now(UTC),
+        )
+
+
+def test_pipeline_persists_base_records_but_not_progress_on_translate_error(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("TRANSLATION_THROTTLE_SECONDS", "0")
+    journal = JournalSource(name="J", rss_url="https://j.invalid/rss", slug="j", source_type="wiley")
+    store = JournalStore(tmp_path / "data")
+    store.ensure_archive(journal)
+    progress = ProgressJournal(tmp_path / "progress.json")
+
+    with pytest.raises(RuntimeError, match="translator down"), store.open_session(journal) as session:
+        cli_app._run_pipeline(
+            journal,
+            records=[_record("1"), _record("2"), _record("3")],
+            session=session,
+            translator=_FlakyTranslator(),
+            progress=progress,
+            completed_entries=set(),
+            skip_translation=False,
+            cancel=threading.Event(),
+        )
+
+    entries = {entry.id: entry for entry in store._load_archive(journal).entries}
+    assert entries["1"].abstract_zh == "摘要"
+    assert "2" in entries and entries["2"].abstract_zh is None
+    assert progress.entries_for("j") == {"1"}
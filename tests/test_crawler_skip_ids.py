@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pytest import MonkeyPatch
+
+from econatlas.crawlers import ScienceDirect爬虫, Wiley爬虫
+from econatlas.models import JournalSource, NormalizedFeedEntry
+
+
+class FakeFeedClient:
+    def __init__(self, entries: list[NormalizedFeedEntry]) -> None:
+        self._entries = entries
+
+    def fetch(self, rss_url: str) -> list[NormalizedFeedEntry]:
+        return self._entries
+
+
+def _entry(entry_id: str) -> NormalizedFeedEntry:
+    return NormalizedFeedEntry(
+        entry_id=entry_id,
+        title=f"Title {entry_id}",
+        summary="rss summary",
+        link=f"https://onlinelibrary.wiley.com/doi/{entry_id}",
+        authors=(),
+        published_at=datetime(2024, 1, 1),
+    )
+
+
+def test_wiley_skip_ids_bypass_page_fetch(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("WILEY_THROTTLE_SECONDS", "0")
+    crawler = Wiley爬虫(FakeFeedClient([_entry("1"), _entry("2")]))
+    fetched: list[str] = []
+
+    def fake_fetch_html(url: str, *, referer: str | None = None) -> str:
+        fetched.append(url)
+        return '<meta name="citation_abstract" content="full abstract">'
+
+    monkeypatch.setattr(crawler._session, "fetch_html", fake_fetch_html)
+    journal = JournalSource(name="J", rss_url="http://rss", slug="j", source_type="wiley")
+
+    records = crawler.crawl(journal, skip_ids={"1"})
+    crawler.close()
+
+    assert [record.id for record in records] == ["1", "2"]
+    assert fetched == ["https://onlinelibrary.wiley.com/doi/2"]
+    assert records[0].abstract_original == "rss summary"
+    assert records[1].abstract_original == "full abstract"
+
+
+def test_sciencedirect_skip_ids_bypass_throttle(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SCIENCEDIRECT_THROTTLE_SECONDS", "5")
+    crawler = ScienceDirect爬虫(FakeFeedClient([_entry("1"), _entry("2")]), api_key=None, inst_token=None)
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    journal = JournalSource(name="J", rss_url="http://rss", slug="j", source_type="sciencedirect")
+
+    records = crawler.crawl(journal, skip_ids={"1"})
+
+    assert [record.id for record in records] == ["1", "2"]
+    assert sleeps == [5.0]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from econatlas.cli.app import app
+from econatlas.samples import run_extraction_benchmark
+
+WILEY_PAGE = """
+<html><head>
+<meta name="citation_author" content="Dana Park">
+<meta name="citation_doi" content="10.1111/iere.00001">
+</head><body><section id="abstract"><p>Wiley abstract.</p></section></body></html>
+"""
+
+
+def _write_sample(samples_dir: Path, source_type: str, name: str, html: str) -> Path:
+    path = samples_dir / source_type / "journal" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding="utf-8")
+    return path
+
+
+def test_benchmark_writes_and_checks_golden_outputs(tmp_path: Path) -> None:
+    sample = _write_sample(tmp_path, "wiley", "a.html", WILEY_PAGE)
+
+    [first] = run_extraction_benchmark(tmp_path, sources=["wiley"], update_golden=True)
+    golden_path = sample.with_name("a.expected.json")
+    golden = json.loads(golden_path.read_text(encoding="utf-8"))
+    assert golden["authors"] == ["Dana Park"]
+    assert golden["abstract"] == "Wiley abstract."
+    assert first.pages == 1 and first.golden_checked == 0
+
+    [second] = run_extraction_benchmark(tmp_path, sources=["wiley"], repeat=2)
+    assert second.golden_checked == 1 and second.mismatches == ()
+    assert second.pages_per_second > 0 and second.p95_ms >= second.p50_ms
+    assert second.peak_memory_bytes > 0
+
+    golden["abstract"] = "Old abstract."
+    golden_path.write_text(json.dumps(golden), encoding="utf-8")
+    [third] = run_extraction_benchmark(tmp_path, sources=["wiley"])
+    assert [mismatch.fields for mismatch in third.mismatches] == [("abstract",)]
+
+
+def test_samples_bench_cli_fails_on_regression(tmp_path: Path) -> None:
+    sample = _write_sample(tmp_path, "wiley", "a.html", WILEY_PAGE)
+    sample.with_name("a.expected.json").write_text(json.dumps({"authors": []}), encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["samples", "bench", "--samples-dir", str(tmp_path), "--repeat", "1"])
+
+    assert result.exit_code == 1
+    assert "wiley" in result.output
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from econatlas.feeds import FeedCache, FeedClient, FeedNotModified
+
+RSS_URL = "https://feeds.example.org/journal.rss"
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>J</title>
+<item><title>Paper</title><link>https://example.org/p1</link><guid>p1</guid></item>
+</channel></rss>"""
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, str]] = []
+        self.not_modified = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        headers = dict(request.headers)
+        self.requests.append(headers)
+        if self.not_modified and headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=RSS_BODY, headers={"ETag": '"v1"'})
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handle))
+
+
+def test_feed_cache_short_circuits_after_commit(tmp_path: Path) -> None:
+    server = FakeServer()
+    client = FeedClient(feed_cache=FeedCache(tmp_path / "feeds"), http_client=server.client())
+
+    assert [entry.entry_id for entry in client.fetch(RSS_URL)] == ["p1"]
+    # 未提交前不应影响下一次抓取。
+    assert len(client.fetch(RSS_URL)) == 1
+    client.commit_feed(RSS_URL)
+
+    server.not_modified = True
+    with pytest.raises(FeedNotModified) as excinfo:
+        client.fetch(RSS_URL)
+    assert excinfo.value.reason == "304"
+    assert server.requests[-1]["if-none-match"] == '"v1"'
+
+    # 服务器忽略条件请求时，按内容哈希判断未变化。
+    server.not_modified = False
+    with pytest.raises(FeedNotModified):
+        client.fetch(RSS_URL)
+
+    refreshed = FeedClient(feed_cache=FeedCache(tmp_path / "feeds"), refresh=True, http_client=server.client())
+    assert len(refreshed.fetch(RSS_URL)) == 1
+    assert "if-none-match" not in server.requests[-1]
+    client.close()
+    refreshed.close()
+
+
+def test_prefetch_is_consumed_by_next_fetch() -> None:
+    server = FakeServer()
+    client = FeedClient(http_client=server.client())
+
+    assert client.prefetch(RSS_URL) == 1
+    assert [entry.entry_id for entry in client.fetch(RSS_URL)] == ["p1"]
+    assert len(server.requests) == 1
+    client.close()
+
+
+def test_fetch_many_prefetches_concurrently_and_records_not_modified(tmp_path: Path) -> None:
+    other_url = "https://other.example.org/feed.rss"
+    cache = FeedCache(tmp_path / "feeds")
+    seed = FeedClient(feed_cache=cache, http_client=FakeServer().client())
+    seed.fetch(RSS_URL)
+    seed.commit_feed(RSS_URL)
+
+    server = FakeServer()
+    server.not_modified = True
+    client = FeedClient(
+        feed_cache=cache,
+        http_client=server.client(),
+        async_client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+    )
+    outcomes = client.fetch_many([RSS_URL, other_url, "https://pubsonline.informs.org/feed"], concurrency=4)
+
+    assert set(outcomes) == {RSS_URL, other_url}
+    assert isinstance(outcomes[RSS_URL], FeedNotModified)
+    assert outcomes[other_url] == 1
+    requests_after_prefetch = len(server.requests)
+    assert [entry.entry_id for entry in client.fetch(other_url)] == ["p1"]
+    with pytest.raises(FeedNotModified):
+        client.fetch(RSS_URL)
+    assert len(server.requests) == requests_after_prefetch
+    client.close()
+    seed.close()
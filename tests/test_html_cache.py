@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from econatlas.storage import HtmlCache, normalize_url
+
+
+def test_html_cache_round_trip_and_url_normalization(tmp_path: Path) -> None:
+    cache = HtmlCache(tmp_path)
+    cache.put(
+        "https://Academic.OUP.com/qje/article/1?utm_source=rss&b=2&a=1#abstract",
+        "<html>qje</html>",
+        source="oxford",
+    )
+
+    hit = cache.get("https://academic.oup.com/qje/article/1?a=1&b=2")
+    assert hit is not None
+    assert hit.html == "<html>qje</html>"
+    assert hit.source == "oxford"
+    assert cache.get("https://academic.oup.com/qje/article/2") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert normalize_url("HTTPS://www.nber.org?x=1#top") == "https://www.nber.org/?x=1"
+    cache.close()
+
+
+def test_html_cache_expires_after_ttl_unless_stale_allowed(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    cache = HtmlCache(tmp_path, ttl_seconds=60)
+    cache.put("https://www.nber.org/papers/w1", "<html>w1</html>", source="nber")
+    later = time.time() + 120
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert cache.get("https://www.nber.org/papers/w1") is None
+    cache.close()
+    stale = HtmlCache(tmp_path, ttl_seconds=60, allow_stale=True)
+    page = stale.get("https://www.nber.org/papers/w1")
+    assert page is not None and page.html == "<html>w1</html>"
+    stale.close()
+
+
+def test_html_cache_dedupes_content_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = HtmlCache(tmp_path, max_bytes=1_800)
+    # 同一内容只存一个对象。
+    cache.put("https://a.example/1", "same body", source="wiley")
+    cache.put("https://a.example/1-mirror", "same body", source="wiley")
+    assert len(list((tmp_path / "objects").rglob("*.html.gz"))) == 1
+
+    # 随机内容难以压缩，每个对象压缩后约 0.7 KB。
+    bodies = {f"https://b.example/{index}": os.urandom(700).hex() for index in range(3)}
+    for url, body in list(bodies.items())[:2]:
+        cache.put(url, body, source="informs")
+    assert cache.get("https://b.example/0") is not None
+    cache.put("https://b.example/2", bodies["https://b.example/2"], source="informs")
+
+    assert cache.total_bytes() <= 1_800
+    assert cache.get("https://b.example/1") is None
+    assert cache.get("https://b.example/0") is not None
+    assert cache.get("https://b.example/2") is not None
+    cache.close()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+from pytest import MonkeyPatch
+from typer.testing import CliRunner
+
+from econatlas.cli.app import app
+from econatlas.enrichers import ElsevierApiConfig, ScienceDirectApiClient
+from econatlas.samples import MockApiConfig, MockApiServer, bench_translator, mock_pii
+from econatlas.translation import DeepSeekTranslator
+
+
+def test_mock_server_speaks_deepseek_and_injects_throttling() -> None:
+    config = MockApiConfig(latency="fixed", latency_ms=0, throttle_rate=0.5, retry_after_seconds=0.01, seed=7)
+    with MockApiServer(config) as server:
+        translator = DeepSeekTranslator("key", api_url=server.deepseek_url, backoff_seconds=0.01, max_retries=10)
+        single = translator.translate("An abstract about credit.", source_language="en")
+        batch = translator.translate_batch(["alpha text", "beta text"], source_languages=["en", "en"])
+        [stats] = server.stats()
+
+    assert single.status == "success" and single.translated_text.endswith("An abstract about credit.")
+    assert [result.translated_text for result in batch] == ["【模拟译文】alpha text", "【模拟译文】beta text"]
+    assert stats.route == "deepseek" and stats.statuses[200] == 2 and stats.statuses.get(429, 0) > 0
+
+
+def test_elsevier_client_uses_configured_base_url(monkeypatch: MonkeyPatch) -> None:
+    with MockApiServer(MockApiConfig(latency="fixed", latency_ms=0, requests_per_second=1000)) as server:
+        monkeypatch.setenv("ELSEVIER_API_BASE_URL", server.elsevier_base_url)
+        client = ScienceDirectApiClient(ElsevierApiConfig(api_key="key", backoff_seconds=0.01))
+        payload = client.fetch_by_pii(mock_pii("journal", 3))
+        client.close()
+        result = bench_translator(server, requests=6, concurrency=3, batch_size=2)
+
+    coredata = payload["full-text-retrieval-response"]["coredata"]
+    assert coredata["dc:title"] == f"Mock article {mock_pii('journal', 3)}"
+    assert (result.scenario, result.operations, result.errors) == ("deepseek-batch", 6, 0)
+    assert result.p95_ms is not None and result.p95_ms >= (result.p50_ms or 0)
+
+
+def test_api_bench_cli_reports_throughput_as_json() -> None:
+    result = CliRunner().invoke(
+        app,
+        ["samples", "api-bench", "-S", "elsevier", "--requests", "5", "--latency", "fixed", "--latency-ms", "0", "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    [report] = json.loads(result.output[result.output.index("[\n  {") :])
+    assert report["scenario"] == "elsevier" and report["operations"] == 5 and report["errors"] == 0
+    assert report["server"][0]["statuses"] == {"200": 5}
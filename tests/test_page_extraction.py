@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from econatlas.enrichers import extract_page_metadata
+
+PAGE = """
+<html><head>
+<meta name="citation_author" content=" Alice Smith ">
+<meta name="citation_author" content="Bob Lee">
+<meta name="citation_doi" content="10.1287/mnsc.2024.01234">
+<meta name="citation_publication_date" content="2024/03/15">
+<meta name="description" content="Truncated summary...">
+</head><body>
+<div class="hlFld-Abstract section"><p>Class abstract.</p></div>
+<section id="abstract-1"><p>First paragraph.</p><p>Second paragraph.</p></section>
+</body></html>
+"""
+
+
+def test_extract_page_metadata_reads_everything_in_one_pass() -> None:
+    metadata = extract_page_metadata(PAGE)
+
+    assert metadata.authors == ("Alice Smith", "Bob Lee")
+    # id 匹配优先于 class 匹配，与各爬虫原有顺序一致。
+    assert metadata.abstract == "First paragraph. Second paragraph."
+    assert metadata.doi == "10.1287/mnsc.2024.01234"
+    assert metadata.published_at == datetime(2024, 3, 15, tzinfo=UTC)
+
+
+def test_extract_page_metadata_falls_back_to_meta_descriptions() -> None:
+    html = """
+    <html><head>
+    <meta property="og:description" content="OG summary">
+    <meta name="dc.Identifier" scheme="doi" content="doi:10.1111/iere.12345">
+    </head><body><div class="abstract"></div></body></html>
+    """
+    metadata = extract_page_metadata(html)
+
+    assert metadata.authors == ()
+    assert metadata.abstract == "OG summary"
+    assert metadata.doi == "10.1111/iere.12345"
+    assert metadata.published_at is None
+
+
+def test_extract_page_metadata_stops_at_head_when_full_abstract_meta_present() -> None:
+    head = """
+    <html><head>
+    <meta name="citation_author" content="Carol Wu">
+    <meta name="citation_abstract" content="Complete abstract &amp; results.">
+    <meta name="citation_doi" content="10.1111/ecta.99999">
+    </head>
+    """
+    # 正文很大且不完整也不影响：读到 </head> 即停止。
+    body = "<body>" + "<div><p>filler</p>" * 20_000 + '<section id="abstract"><p>Body copy.</p>'
+    metadata = extract_page_metadata(head + body)
+
+    assert metadata.authors == ("Carol Wu",)
+    assert metadata.abstract == "Complete abstract & results."
+    assert metadata.doi == "10.1111/ecta.99999"
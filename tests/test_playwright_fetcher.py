@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import playwright.sync_api
+from pytest import MonkeyPatch
+
+from econatlas.samples import PlaywrightFetcher
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self._url = ""
+
+    def goto(self, url: str, **_: Any) -> None:
+        self._url = url
+
+    def wait_for_load_state(self, state: str, **_: Any) -> None:
+        return None
+
+    def content(self) -> str:
+        return f"<html>{self._url}</html>"
+
+    def close(self) -> None:
+        return None
+
+
+class FakeContext:
+    def set_extra_http_headers(self, headers: dict[str, str]) -> None:
+        return None
+
+    def add_cookies(self, cookies: list[dict[str, str]]) -> None:
+        return None
+
+    def new_page(self) -> FakePage:
+        return FakePage()
+
+    def close(self) -> None:
+        return None
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.closed = False
+        self.contexts = 0
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    def new_context(self, **_: Any) -> FakeContext:
+        self.contexts += 1
+        return FakeContext()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self) -> None:
+        self.browsers: list[FakeBrowser] = []
+
+    def launch(self, **_: Any) -> FakeBrowser:
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    def start(self) -> FakePlaywright:
+        return self
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+def _fetch(fetcher: PlaywrightFetcher, url: str) -> bytes:
+    html: bytes = fetcher.fetch(url=url, headers={}, cookies={"a": "1"}, credentials=None, user_agent="agent")
+    return html
+
+
+def test_reused_fetcher_launches_browser_once(monkeypatch: MonkeyPatch) -> None:
+    fake = FakePlaywright()
+    monkeypatch.setattr(playwright.sync_api, "sync_playwright", lambda: fake)
+    fetcher = PlaywrightFetcher(idle_wait_seconds=0, reuse_browser=True)
+
+    assert _fetch(fetcher, "https://home/") == b"<html>https://home/</html>"
+    assert _fetch(fetcher, "https://feed/") == b"<html>https://feed/</html>"
+    fetcher.close()
+
+    assert len(fake.chromium.browsers) == 1
+    assert fake.chromium.browsers[0].contexts == 2
+    assert fake.chromium.browsers[0].closed is True
+    assert fake.stopped is True
+
+
+def test_reused_fetcher_closes_idle_browser(monkeypatch: MonkeyPatch) -> None:
+    fake = FakePlaywright()
+    monkeypatch.setattr(playwright.sync_api, "sync_playwright", lambda: fake)
+    fetcher = PlaywrightFetcher(idle_wait_seconds=0, reuse_browser=True, idle_timeout_seconds=0.05)
+
+    _fetch(fetcher, "https://feed/1")
+    deadline = time.monotonic() + 2
+    while not fake.chromium.browsers[0].closed and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert fake.chromium.browsers[0].closed is True
+
+    _fetch(fetcher, "https://feed/2")
+    fetcher.close()
+    assert len(fake.chromium.browsers) == 2
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 from econatlas.models import ArticleRecord, JournalSource, TranslationRecord, TranslationStatus
 
-from econatlas.storage import JournalStore
+from econatlas.storage import JournalStore, ProgressJournal, SqliteJournalStore, load_progress
 
 
 def _article_with(id_: str, zh: str | None, status: TranslationStatus = "success") -> ArticleRecord:
@@ -54,3 +55,127 @@ def test_cnki_uses_chinese_filename(tmp_path: Path) -> None:
     entry = _article_with("1", None, "success")
     store.persist(journal, [entry])
     assert (tmp_path / "中国期刊.json").exists()
+
+
+def test_write_session_buffers_until_flush(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path)
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    store.persist(journal, [_article_with("1", "zh1", "success")])
+    with store.open_session(journal, flush_every=10, flush_interval=3600) as session:
+        res = session.append([_article_with("2", None, "failed")])
+        assert res.added == 1
+        assert session.pending == 1
+        assert "\"2\"" not in (tmp_path / "j.json").read_text(encoding="utf-8")
+        merged = session.append([_article_with("2", "zh2", "success")])
+        assert merged.updated == 1
+    data = (tmp_path / "j.json").read_text(encoding="utf-8")
+    assert "zh1" in data and "zh2" in data
+
+
+def test_write_session_flushes_by_record_count(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path)
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    session = store.open_session(journal, flush_every=2, flush_interval=3600)
+    session.append([_article_with("1", None, "failed")])
+    assert not (tmp_path / "j.json").exists()
+    session.append([_article_with("2", None, "failed")])
+    assert session.pending == 0
+    assert (tmp_path / "j.json").exists()
+    session.close()
+
+
+def test_session_appends_wal_and_readers_replay_it(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path)
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    session = store.open_session(journal, flush_every=100, flush_interval=3600)
+    session.append([_article_with("1", "zh1", "success")])
+    # 模拟崩溃：会话未关闭，记录只存在于 WAL。
+    assert store.has_pending_wal(journal)
+    assert not (tmp_path / "j.json").exists()
+    replayed = store._load_archive(journal)
+    assert [entry.id for entry in replayed.entries] == ["1"]
+    payload = store.load_payload(journal)
+    assert isinstance(payload, dict) and payload["entries"][0]["abstract_zh"] == "zh1"
+
+    store.compact(journal)
+    assert not store.has_pending_wal(journal)
+    assert "zh1" in (tmp_path / "j.json").read_text(encoding="utf-8")
+
+
+def test_store_keeps_lock_files_out_of_data_dir(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path / "data")
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    store.persist(journal, [_article_with("1", None, "failed")])
+    store.compact(journal)
+    with store.open_session(journal, flush_every=1, flush_interval=3600) as session:
+        session.append([_article_with("2", None, "failed")])
+
+    assert [path.name for path in (tmp_path / "data").iterdir()] == ["j.json"]
+
+
+def test_wal_replay_skips_torn_trailing_line(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path)
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    store._append_wal(journal, [_article_with("1", None, "failed")])
+    with store.wal_path(journal).open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "2", "tit')
+    archive = store._load_archive(journal)
+    assert [entry.id for entry in archive.entries] == ["1"]
+
+
+def test_sqlite_store_upserts_and_queries(tmp_path: Path) -> None:
+    store = SqliteJournalStore(tmp_path / "atlas.sqlite3")
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    store.ensure_archive(journal)
+    first = store.persist(journal, [_article_with("1", None, "failed"), _article_with("2", "zh2", "success")])
+    assert (first.added, first.updated) == (2, 0)
+    second = store.persist(journal, [_article_with("1", "zh1", "success")])
+    assert (second.added, second.updated) == (0, 1)
+    assert store.query(status="failed") == []
+    assert {record.id for _, record in store.query(journal_slug="j", status="success")} == {"1", "2"}
+    store.close()
+
+
+def test_sqlite_store_seeds_from_json_and_exports(tmp_path: Path) -> None:
+    json_store = JournalStore(tmp_path / "data")
+    journal = JournalSource(name="J", rss_url="http://x", slug="j", source_type="sciencedirect")
+    json_store.persist(journal, [_article_with("old", "zh-old", "success")])
+    store = SqliteJournalStore(tmp_path / "atlas.sqlite3", seed_store=json_store)
+    store.ensure_archive(journal)
+    store.persist(journal, [_article_with("new", None, "failed")])
+    assert store.export_json(journal, json_store) == 2
+    data = (tmp_path / "data" / "j.json").read_text(encoding="utf-8")
+    assert "zh-old" in data and "\"new\"" in data
+    store.close()
+
+
+def test_progress_journal_appends_and_replays_tail(tmp_path: Path) -> None:
+    snapshot = tmp_path / "crawl_progress.json"
+    snapshot.write_text(json.dumps({"completed_entries": {"aer": ["a"]}}), encoding="utf-8")
+    progress = ProgressJournal(snapshot, compact_every=100)
+    progress.mark("aer", "https://example.com/b")
+    progress.mark("jpe", "c")
+
+    assert json.loads(snapshot.read_text(encoding="utf-8")) == {"completed_entries": {"aer": ["a"]}}
+    assert progress.log_path.read_text(encoding="utf-8").splitlines() == ["aer/https://example.com/b", "jpe/c"]
+    per_entry, legacy = load_progress(snapshot)
+    assert per_entry == {"aer": {"a", "https://example.com/b"}, "jpe": {"c"}}
+    assert legacy == set()
+
+    progress.forget("aer", {"a"})
+    progress.close()
+    assert not progress.log_path.exists()
+    assert load_progress(snapshot)[0] == {"aer": {"https://example.com/b"}, "jpe": {"c"}}
+
+
+def test_progress_journal_compacts_periodically_and_reads_legacy(tmp_path: Path) -> None:
+    snapshot = tmp_path / "crawl_progress.json"
+    snapshot.write_text(json.dumps(["old-journal"]), encoding="utf-8")
+    progress = ProgressJournal(snapshot, compact_every=2)
+    assert progress.legacy_completed_slugs == {"old-journal"}
+
+    progress.mark("aer", "1")
+    progress.mark("aer", "2")
+
+    assert not progress.log_path.exists()
+    assert json.loads(snapshot.read_text(encoding="utf-8")) == {"completed_entries": {"aer": ["1", "2"]}}
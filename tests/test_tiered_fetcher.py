@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import httpx
+
+from econatlas.enrichers import TieredFetcher
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.fetched: list[str] = []
+        self.throttled: list[bool] = []
+        self.cache_lookups: list[bool] = []
+        self.closed = False
+
+    def fetch_html(self, url: str, *, throttle: bool = True, cache_lookup: bool = True) -> str:
+        self.fetched.append(url)
+        self.throttled.append(throttle)
+        self.cache_lookups.append(cache_lookup)
+        return f"<div id='abstract'>browser {url}</div>"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+PAGES = {
+    "/ok": '<div id="abstract">Full abstract</div>',
+    "/teaser": "<p>Subscribe to read</p>",
+    "/challenge": "<title>Just a moment...</title><div class='cf-chl-widget'></div>",
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    body = PAGES.get(request.url.path)
+    if body is None:
+        return httpx.Response(403, text="forbidden")
+    return httpx.Response(200, text=body)
+
+
+def test_tiered_fetcher_escalates_only_when_needed() -> None:
+    browser = FakeBrowser()
+    fetcher = TieredFetcher(
+        "nber",
+        browser=browser,
+        referer="https://www.nber.org/",
+        accept=lambda html: 'id="abstract"' in html,
+        http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        enabled=True,
+    )
+
+    assert fetcher.fetch_html("https://www.nber.org/ok") == PAGES["/ok"]
+    fetcher.fetch_html("https://www.nber.org/teaser")
+    fetcher.fetch_html("https://www.nber.org/challenge")
+    fetcher.fetch_html("https://www.nber.org/blocked")
+    fetcher.close()
+
+    assert browser.fetched == [
+        "https://www.nber.org/teaser",
+        "https://www.nber.org/challenge",
+        "https://www.nber.org/blocked",
+    ]
+    stats = fetcher.escalation_stats()["www.nber.org"]
+    assert (stats.http_ok, stats.escalated) == (1, 3)
+    assert stats.escalation_rate == 0.75
+    assert browser.closed is True
+
+
+def test_tiered_fetcher_disabled_goes_straight_to_browser() -> None:
+    browser = FakeBrowser()
+    fetcher = TieredFetcher(
+        "wiley",
+        browser=browser,
+        referer="https://onlinelibrary.wiley.com/",
+        accept=lambda html: True,
+        http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+    )
+
+    fetcher.fetch_html("https://onlinelibrary.wiley.com/ok")
+
+    assert browser.fetched == ["https://onlinelibrary.wiley.com/ok"]
+    assert browser.throttled == [True]
+    assert browser.cache_lookups == [True]
+    assert fetcher.escalation_stats() == {}
+
+
+def test_tiered_fetcher_escalation_waits_and_checks_cache_once() -> None:
+    browser = FakeBrowser()
+    waits: list[None] = []
+    fetcher = TieredFetcher(
+        "nber",
+        browser=browser,
+        referer="https://www.nber.org/",
+        accept=lambda html: 'id="abstract"' in html,
+        http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        wait=lambda: waits.append(None),
+        enabled=True,
+    )
+
+    fetcher.fetch_html("https://www.nber.org/teaser")
+
+    assert len(waits) == 1
+    assert browser.throttled == [False]
+    assert browser.cache_lookups == [False]
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from econatlas.translation import detect_language, skipped_translation, TranslationResult
+import json
+from typing import Any
+
+import httpx
+from pytest import MonkeyPatch
+
+from econatlas import translation
+from econatlas.translation import (
+    DeepSeekTranslator,
+    TranslationResult,
+    detect_language,
+    skipped_translation,
+)
 
 
 def test_detect_language_handles_empty() -> None:
@@ -14,3 +26,69 @@ def test_skipped_translation_returns_same_text() -> None:
     assert isinstance(result, TranslationResult)
     assert result.status == "skipped"
     assert result.translated_text == text
+
+
+def test_detect_language_uses_script_fast_path_and_cache(monkeypatch: MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_langdetect(text: str) -> str | None:
+        calls.append(text)
+        return "fr"
+
+    monkeypatch.setattr(translation._base, "_detect_with_langdetect", fake_langdetect)
+
+    english = "We estimate the effect of the minimum wage on employment in this paper, using county data."
+    chinese = "本文基于省级面板数据，考察了数字金融对居民消费的影响。"
+    french = "Nous estimons l'effet du salaire minimum sur l'emploi."
+    assert detect_language(english) == "en"
+    assert detect_language(chinese) == "zh-cn"
+    assert calls == []
+
+    assert detect_language(french) == "fr"
+    assert detect_language(french) == "fr"
+    assert calls == [french]
+
+
+def _deepseek_client(replies: list[str], requests: list[dict[str, Any]]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"content": replies.pop(0)}}]})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_translate_batch_packs_abstracts_into_one_request() -> None:
+    requests: list[dict[str, Any]] = []
+    reply = json.dumps({"translations": [{"id": 2, "text": "丙"}, {"id": 0, "text": "甲"}, {"id": 1, "text": "乙"}]})
+    translator = DeepSeekTranslator("key", http_client=_deepseek_client([reply], requests))
+
+    results = translator.translate_batch(["alpha", "beta", "gamma"], source_languages=["en", "en", None])
+
+    assert [result.translated_text for result in results] == ["甲", "乙", "丙"]
+    assert all(result.status == "success" for result in results)
+    assert len(requests) == 1
+    assert requests[0]["response_format"] == {"type": "json_object"}
+
+
+def test_translate_batch_falls_back_per_item_for_missing_entries() -> None:
+    requests: list[dict[str, Any]] = []
+    reply = '```json\n{"translations": [{"id": 0, "text": "甲"}, {"id": 1, "text": ""}]}\n```'
+    translator = DeepSeekTranslator("key", http_client=_deepseek_client([reply, "乙（单独）"], requests))
+
+    results = translator.translate_batch(["alpha", "beta"], source_languages=["en", "en"])
+
+    assert [result.translated_text for result in results] == ["甲", "乙（单独）"]
+    assert len(requests) == 2
+    assert "beta" in requests[1]["messages"][1]["content"]
+
+
+def test_translate_batch_respects_token_budget() -> None:
+    requests: list[dict[str, Any]] = []
+    translator = DeepSeekTranslator(
+        "key", batch_max_tokens=30, http_client=_deepseek_client(["一", "二"], requests)
+    )
+
+    results = translator.translate_batch(["word " * 20, "word " * 20], source_languages=["en", "en"])
+
+    assert [result.translated_text for result in results] == ["一", "二"]
+    assert len(requests) == 2
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from econatlas.models import ArticleRecord, JournalSource, TranslationRecord
+from econatlas.storage import JournalStore, ProgressJournal
+from econatlas.translation import DeepSeekTranslator, needs_backfill, run_backfill
+
+JOURNAL = JournalSource(name="Test Journal", rss_url="https://example.com/rss", slug="test-journal", source_type="wiley")
+
+
+def _record(entry_id: str, status: str, abstract: str, *, language: str | None, year: int = 2024) -> ArticleRecord:
+    return ArticleRecord(
+        id=entry_id,
+        title=f"Title {entry_id}",
+        link=f"https://example.com/{entry_id}",
+        authors=[],
+        published_at=datetime(year, 1, 1, tzinfo=UTC),
+        abstract_original=abstract,
+        abstract_language=language,
+        translation=TranslationRecord(status=status),  # type: ignore[arg-type]
+        fetched_at=datetime(2024, 6, 1, tzinfo=UTC),
+    )
+
+
+def _translator(requests: list[str]) -> DeepSeekTranslator:
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = json.loads(request.content)["messages"][1]["content"]
+        requests.append(content)
+        if "response_format" in json.loads(request.content):
+            items = json.loads(content.split("\n", 1)[1])
+            reply = json.dumps({"translations": [{"id": item["id"], "text": f"译:{item['text']}"} for item in items]})
+        else:
+            reply = "译:" + content.rsplit("\n", 1)[-1]
+        return httpx.Response(200, json={"choices": [{"message": {"content": reply}}]})
+
+    return DeepSeekTranslator("key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_backfill_translates_failed_and_skipped_non_chinese_entries(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path / "data")
+    store.persist(
+        JOURNAL,
+        [
+            _record("a", "failed", "Alpha abstract.", language="en"),
+            _record("b", "skipped", "Beta abstract.", language="en"),
+            _record("c", "skipped", "中文摘要。", language="zh-cn"),
+            _record("d", "success", "Delta abstract.", language="en"),
+            _record("e", "failed", "Old abstract.", language="en", year=2019),
+        ],
+    )
+    requests: list[str] = []
+
+    report = run_backfill(
+        store,
+        [JOURNAL],
+        _translator(requests),
+        since=datetime(2020, 1, 1, tzinfo=UTC),
+        progress=ProgressJournal(tmp_path / "progress.json"),
+    )
+
+    assert (report.scanned, report.candidates, report.translated, report.failed) == (5, 2, 2, 0)
+    assert len(requests) == 1
+    entries = store.compact(JOURNAL)
+    assert entries["a"].abstract_zh == "译:Alpha abstract." and entries["a"].translation.status == "success"
+    assert entries["b"].abstract_zh == "译:Beta abstract."
+    assert entries["c"].translation.status == "skipped" and entries["e"].translation.status == "failed"
+
+
+def test_backfill_resumes_from_progress_and_respects_limit(tmp_path: Path) -> None:
+    store = JournalStore(tmp_path / "data")
+    store.persist(JOURNAL, [_record(name, "failed", f"{name} abstract.", language="en") for name in "abc"])
+    requests: list[str] = []
+    progress_path = tmp_path / "progress.json"
+
+    first = run_backfill(store, [JOURNAL], _translator(requests), limit=1, progress=ProgressJournal(progress_path))
+    assert first.translated == 1
+
+    # 模拟上一轮已尝试但未成功的条目：进度中有记录时续跑跳过。
+    progress = ProgressJournal(progress_path)
+    progress.mark(JOURNAL.slug, "b")
+    second = run_backfill(store, [JOURNAL], _translator(requests), progress=progress)
+
+    assert (second.candidates, second.translated) == (1, 1)
+    statuses: dict[str, Any] = {key: value.translation.status for key, value in store.compact(JOURNAL).items()}
+    assert statuses == {"a": "success", "b": "failed", "c": "success"}
+
+
+def test_backfill_treats_undetectable_language_as_non_chinese(tmp_path: Path) -> None:
+    record = _record("n", "failed", "123 456 (7)", language=None)
+    assert needs_backfill(record)
+
+    store = JournalStore(tmp_path / "data")
+    store.persist(JOURNAL, [record])
+    report = run_backfill(store, [JOURNAL], _translator([]))
+
+    assert (report.candidates, report.translated) == (1, 1)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+
+from econatlas.translation import AdaptiveRateLimiter, AsyncTranslationEngine
+
+
+def _reply(content: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def test_engine_keeps_requests_in_flight_concurrently() -> None:
+    running = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        text = json.loads(request.content)["messages"][1]["content"].rsplit("\n", 1)[-1]
+        return _reply(f"译:{text}")
+
+    engine = AsyncTranslationEngine(
+        "key",
+        max_in_flight=3,
+        requests_per_minute=6000,
+        client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    with engine:
+        futures = [engine.submit(f"abstract {index}", source_language="en") for index in range(6)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert [result.translated_text for result in results] == [f"译:abstract {index}" for index in range(6)]
+    assert peak == 3
+
+
+def test_engine_honors_retry_after_and_backs_off() -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.05"})
+        return _reply("译文")
+
+    engine = AsyncTranslationEngine(
+        "key",
+        requests_per_minute=6000,
+        client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    with engine:
+        result = engine.translate("An abstract.", source_language="en")
+
+    assert result.status == "success" and result.translated_text == "译文"
+    assert calls == 2
+    assert engine.requests == 2
+
+
+def test_rate_limiter_spaces_requests_and_halves_rate_on_backoff() -> None:
+    now = 0.0
+    slept: list[float] = []
+
+    def clock() -> float:
+        return now
+
+    async def sleep(seconds: float) -> None:
+        nonlocal now
+        slept.append(seconds)
+        now += seconds
+
+    async def scenario() -> None:
+        limiter = AdaptiveRateLimiter(60, clock=clock, sleep=sleep)
+        for _ in range(3):
+            await limiter.acquire()
+        assert abs(now - 2.0) < 1e-6
+
+        limiter.backoff(retry_after=None)
+        assert limiter.scale == 0.5
+        started = now
+        await limiter.acquire()
+        await limiter.acquire()
+        # 暂停 2 秒后按减半后的速率（每 2 秒 1 次）放行。
+        assert abs(now - started - 4.0) < 1e-6
+
+    asyncio.run(scenario())
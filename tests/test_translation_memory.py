@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+from typer.testing import CliRunner
+
+from econatlas.cli.app import app
+from econatlas.translation import DeepSeekTranslator, TranslationMemory
+
+
+def _deepseek_client(replies: list[str], requests: list[dict[str, Any]]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"content": replies.pop(0)}}]})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_memory_matches_normalized_text_per_model_and_prompt(tmp_path: Path) -> None:
+    memory = TranslationMemory(tmp_path / "tm.sqlite3")
+    memory.put("An  abstract\nwith spacing.", "译文", model="deepseek-chat", prompt_version="1")
+
+    assert memory.get("An abstract with spacing. ", model="deepseek-chat", prompt_version="1") == "译文"
+    assert memory.get("An abstract with spacing.", model="deepseek-chat", prompt_version="2") is None
+    assert memory.get("An abstract with spacing.", model="other-model", prompt_version="1") is None
+    stats = memory.stats()
+    assert (stats.entries, stats.hits, stats.misses, stats.stored_hits) == (1, 1, 2, 1)
+    memory.close()
+
+
+def test_translator_skips_api_for_remembered_abstracts(tmp_path: Path) -> None:
+    memory = TranslationMemory(tmp_path / "tm.sqlite3")
+    requests: list[dict[str, Any]] = []
+    reply = json.dumps({"translations": [{"id": 0, "text": "甲"}, {"id": 1, "text": "乙"}]})
+    first = DeepSeekTranslator("key", memory=memory, http_client=_deepseek_client([reply, "丙"], requests))
+    first.translate_batch(["alpha", "beta"], source_languages=["en", "en"])
+    assert len(requests) == 1
+
+    results = first.translate_batch(["beta", "gamma", "alpha"], source_languages=["en", "en", "en"])
+
+    assert [result.translated_text for result in results] == ["乙", "丙", "甲"]
+    assert len(requests) == 2
+    assert "gamma" in requests[1]["messages"][1]["content"]
+    assert first.translate("alpha").translated_text == "甲"
+    assert len(requests) == 2
+    memory.close()
+
+
+def test_memory_cli_evicts_and_exports(tmp_path: Path) -> None:
+    db_path = tmp_path / "tm.sqlite3"
+    memory = TranslationMemory(db_path)
+    for index in range(3):
+        memory.put(f"abstract {index}", f"译文 {index}", model="deepseek-chat", prompt_version="1")
+    memory.close()
+    runner = CliRunner()
+
+    evicted = runner.invoke(app, ["translate", "memory", "evict", "--db-path", str(db_path), "--max-entries", "2"])
+    assert evicted.exit_code == 0, evicted.output
+    output = tmp_path / "tm.jsonl"
+    exported = runner.invoke(app, ["translate", "memory", "export", str(output), "--db-path", str(db_path)])
+    assert exported.exit_code == 0, exported.output
+
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [row["source_text"] for row in rows] == ["abstract 1", "abstract 2"]
+    assert rows[0]["translated_text"] == "译文 1" and rows[0]["prompt_version"] == "1"